@@ -0,0 +1,102 @@
+"""Memory benchmark: LocalTrack/Candidate storage for a large run.
+
+Usage:
+    python -m benchmarks.bench_memory [--tracks 200000] [--candidates 5]
+
+Holds ``--tracks`` LocalTrack objects plus ``--candidates`` Candidate objects per
+track (what a run keeps alive: pending tracks, cached search results) and reports
+the memory traced by tracemalloc, for the former plain dataclasses ("before") and
+the current slotted, frozen ones ("after"). Strings are shared between both runs
+so that only the per-object overhead is compared.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+from src.types import Candidate, LocalTrack
+
+
+@dataclass
+class LegacyLocalTrack:
+    path: Path
+    title: Optional[str]
+    artist: Optional[str]
+    album: Optional[str]
+    duration_ms: Optional[int]
+    year: Optional[int]
+    isrc: Optional[str]
+    tracknumber: Optional[int] = None
+
+
+@dataclass
+class LegacyCandidate:
+    uri: str
+    name: str
+    artists: List[str]
+    album: str
+    duration_ms: int
+    score: float
+    release_year: Optional[int] = None
+    track_number: Optional[int] = None
+
+
+def _strings(n: int):
+    return [f"Title {i}" for i in range(n)], [f"spotify:track:{i:022d}" for i in range(n)]
+
+
+def _build(track_cls, cand_cls, artists_type, n_tracks: int, n_cands: int, titles, uris, path):
+    tracks = [
+        track_cls(path=path, title=titles[i], artist="Artist", album="Album", duration_ms=200000, year=2001, isrc=None)
+        for i in range(n_tracks)
+    ]
+    cands = [
+        cand_cls(
+            uri=uris[i],
+            name=titles[i],
+            artists=artists_type(("Artist",)),
+            album="Album",
+            duration_ms=200000,
+            score=0.5,
+            release_year=2001,
+        )
+        for i in range(n_tracks)
+        for _ in range(n_cands)
+    ]
+    return tracks, cands
+
+
+def _measure(label: str, track_cls, cand_cls, artists_type, args, titles, uris, path) -> None:
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    held = _build(track_cls, cand_cls, artists_type, args.tracks, args.candidates, titles, uris, path)
+    elapsed = time.perf_counter() - t0
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    n = len(held[0]) + len(held[1])
+    print(f"{label:<8} {current / 2**20:>10.1f} {peak / 2**20:>10.1f} {current / n:>12.1f} {elapsed:>9.2f}")
+    del held
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--tracks", type=int, default=200_000)
+    ap.add_argument("--candidates", type=int, default=5)
+    args = ap.parse_args()
+
+    titles, uris = _strings(args.tracks)
+    path = Path("Artist - Title.mp3")
+    print(f"{args.tracks} tracks, {args.tracks * args.candidates} candidates")
+    print(f"{'':<8} {'held (MiB)':>10} {'peak (MiB)':>10} {'bytes/object':>12} {'build (s)':>9}")
+    _measure("before", LegacyLocalTrack, LegacyCandidate, list, args, titles, uris, path)
+    _measure("after", LocalTrack, Candidate, tuple, args, titles, uris, path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Micro-benchmark: regex work per track, before/after the memoized text_forms() engine.
+
+Usage:
+    python -m benchmarks.bench_normalize [--tracks 2000] [--candidates 50]
+
+The workload replays the normalization calls made for one local track: filename
+inference, query planning, the in-run cache key and scoring against N candidates
+(re-scored once more on a cache hit). "before" uses the original uncached
+strip_suffixes/remove_feat; "after" uses the current code paths. The regex
+patterns of src.utils are wrapped to count substitutions.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from pathlib import Path
+
+import src.utils as utils
+from src.matcher import plan_queries, score_candidates
+from src.metadata import infer_from_filename
+from src.search_engine import SearchEngine
+from src.types import Candidate, LocalTrack
+
+
+class CountingPattern:
+    def __init__(self, pattern):
+        self.pattern = pattern
+        self.subs = 0
+
+    def sub(self, *args, **kwargs):
+        self.subs += 1
+        return self.pattern.sub(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.pattern, name)
+
+
+def legacy_strip_suffixes(text: str) -> str:
+    if not text:
+        return text
+    t = utils._paren_re.sub("", text)
+    t = utils._brackets_re.sub("", t)
+    return utils._ws_re.sub(" ", t).strip()
+
+
+def legacy_remove_feat(text: str) -> str:
+    if not text:
+        return text
+    return utils._feat_re.sub("", text).strip()
+
+
+def _workload(n_tracks: int, n_cands: int, seed: int = 1):
+    rnd = random.Random(seed)
+    titles = ["Blue", "Night Drive", "Love Song (Live)", "Hero [Remastered 2011]", "Tokyo feat. X", "Moon (Radio Edit)"]
+    artists = ["Vivid", "Artist feat. Guest", "The Band", "東京事変"]
+    tracks = []
+    for i in range(n_tracks):
+        title, artist = rnd.choice(titles), rnd.choice(artists)
+        lt = LocalTrack(
+            path=Path(f"{artist} - {title} {i % 50}.mp3"),
+            title=f"{title} {i % 50}",
+            artist=artist,
+            album=f"Album {i % 20} (Deluxe)",
+            duration_ms=200000,
+            year=2011,
+            isrc=None,
+        )
+        cands = [
+            Candidate(
+                uri=f"u{j}",
+                name=f"{title} {j % 50} (Remastered)",
+                artists=[artist],
+                album=f"Album {j % 20}",
+                duration_ms=200000 + j,
+                score=0.0,
+            )
+            for j in range(n_cands)
+        ]
+        tracks.append((lt, cands))
+    return tracks
+
+
+def run_before(tracks) -> None:
+    from rapidfuzz import fuzz
+
+    for lt, cands in tracks:
+        # infer_from_filename
+        legacy_strip_suffixes(lt.path.stem)
+        legacy_strip_suffixes(lt.title)
+        # plan_queries (title/artist + the two cleaned variants)
+        title = legacy_strip_suffixes(lt.title)
+        artist = legacy_remove_feat(lt.artist)
+        legacy_strip_suffixes(title)
+        legacy_remove_feat(title)
+        legacy_remove_feat(artist)
+        # cache key
+        legacy_strip_suffixes(lt.title)
+        legacy_remove_feat(lt.artist)
+        # score_candidate per candidate, twice (search + cache-hit re-score)
+        for _ in range(2):
+            for c in cands:
+                a = legacy_strip_suffixes(lt.title)
+                b = legacy_remove_feat(lt.artist)
+                al = legacy_strip_suffixes(lt.album)
+                ct = legacy_strip_suffixes(c.name)
+                ca = legacy_strip_suffixes(c.album)
+                fuzz.token_set_ratio(a, ct)
+                fuzz.token_set_ratio(b, ", ".join(c.artists))
+                fuzz.token_set_ratio(al, ca)
+
+
+def run_after(tracks) -> None:
+    for lt, cands in tracks:
+        infer_from_filename(lt.path, lt)
+        plan_queries(lt)
+        SearchEngine.cache_key(lt)
+        for _ in range(2):
+            score_candidates(lt, cands)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--tracks", type=int, default=2000)
+    ap.add_argument("--candidates", type=int, default=50)
+    args = ap.parse_args()
+
+    tracks = _workload(args.tracks, args.candidates)
+    patterns = {name: getattr(utils, name) for name in ("_paren_re", "_brackets_re", "_ws_re", "_feat_re")}
+    results = {}
+    for label, fn in (("before", run_before), ("after", run_after)):
+        utils.text_forms.cache_clear()
+        counters = {name: CountingPattern(p) for name, p in patterns.items()}
+        for name, c in counters.items():
+            setattr(utils, name, c)
+        try:
+            t0 = time.perf_counter()
+            fn(tracks)
+            elapsed = time.perf_counter() - t0
+        finally:
+            for name, p in patterns.items():
+                setattr(utils, name, p)
+        results[label] = (sum(c.subs for c in counters.values()), elapsed)
+
+    print(f"{'':<8} {'regex subs/track':>17} {'time/track (us)':>16}")
+    for label, (subs, elapsed) in results.items():
+        print(f"{label:<8} {subs / len(tracks):>17.1f} {elapsed / len(tracks) * 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""Micro-benchmark: per-file cost of read_tags(), before/after the per-format extractors.
+
+Usage:
+    python -m benchmarks.bench_read_tags                   # synthetic mp3/flac/wav files
+    python -m benchmarks.bench_read_tags --path "D:/Music" # real library, all DEFAULT_EXTS
+
+Prints the mean time per file and extension for the legacy implementation (kept
+below verbatim) and the current one.
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import struct
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from src.metadata import _extract_isrc_generic, read_tags
+from src.types import LocalTrack
+from src.utils import DEFAULT_EXTS, safe_int
+
+
+def legacy_read_tags(path: Path) -> LocalTrack:
+    """read_tags() as it was before the per-format extractors (double open for MP3)."""
+    # Lazy import mutagen to keep this module importable without the package
+    try:
+        from mutagen import File as MutagenFile  # type: ignore
+        from mutagen.id3 import ID3, TSRC  # type: ignore
+    except Exception:  # pragma: no cover
+        MutagenFile = None  # type: ignore
+        ID3 = None  # type: ignore
+        TSRC = None  # type: ignore
+
+    audio = MutagenFile(path) if MutagenFile else None
+    title = artist = album = None
+    duration_ms = None
+    year = None
+    isrc = None
+    tracknum = None
+
+    if audio is not None:
+        # duration
+        try:
+            if getattr(audio, "info", None) and getattr(audio.info, "length", None):
+                duration_ms = int(audio.info.length * 1000)
+        except Exception:
+            pass
+
+        tags = getattr(audio, "tags", None)
+        # Try easy-like and multiple tag formats
+        try:
+            title = (
+                (tags.get("title")[0] if isinstance(tags.get("title"), list) else tags.get("title"))
+                if tags and tags.get("title")
+                else None
+            )
+        except Exception:
+            pass
+        try:
+            # Try multiple artist tag formats (artist, TPE1, ©ART, etc.)
+            artist = None
+            for key in ("artist", "TPE1", "©ART", "ARTIST"):
+                if tags and tags.get(key):
+                    val = tags.get(key)
+                    artist = val[0] if isinstance(val, list) else val
+                    # Convert to string if it's a tag object
+                    if artist:
+                        artist = str(artist) if not isinstance(artist, str) else artist
+                        break
+        except Exception:
+            pass
+        try:
+            album = (
+                (tags.get("album")[0] if isinstance(tags.get("album"), list) else tags.get("album"))
+                if tags and tags.get("album")
+                else None
+            )
+        except Exception:
+            pass
+        try:
+            tn = (
+                (tags.get("tracknumber")[0] if isinstance(tags.get("tracknumber"), list) else tags.get("tracknumber"))
+                if tags and tags.get("tracknumber")
+                else None
+            )
+            tracknum = safe_int(tn)
+        except Exception:
+            pass
+        # Year/date
+        try:
+            y = None
+            for k in ("date", "year"):  # many formats
+                v = tags.get(k) if tags else None
+                if v:
+                    if isinstance(v, list):
+                        v = v[0]
+                    y = str(v)
+                    break
+            if y:
+                y = re.findall(r"(\d{4})", y)
+                if y:
+                    year = int(y[0])
+        except Exception:
+            pass
+
+        # ISRC generic
+        try:
+            isrc = _extract_isrc_generic(tags)
+        except Exception:
+            pass
+
+        # Specific ID3 TSRC frame for MP3
+        if isrc is None and ID3 and TSRC:
+            try:
+                id3 = ID3(path)
+                frame = id3.get("TSRC")
+                if frame and isinstance(frame, TSRC):
+                    isrc = str(frame.text[0]) if frame.text else None
+            except Exception:
+                pass
+
+    return LocalTrack(
+        path=path,
+        title=title.strip() if isinstance(title, str) else title,
+        artist=artist.strip() if isinstance(artist, str) else artist,
+        album=album.strip() if isinstance(album, str) else album,
+        duration_ms=duration_ms,
+        year=year,
+        isrc=isrc,
+        tracknumber=tracknum,
+    )
+
+
+def _mp3_frames(n: int = 40) -> bytes:
+    # MPEG-1 Layer III, 128 kbps, 44.1 kHz, no padding: 417-byte frames
+    header = bytes([0xFF, 0xFB, 0x90, 0x64])
+    return (header + b"\x00" * 413) * n
+
+
+def _flac_stream() -> bytes:
+    # fLaC + last STREAMINFO block (34 bytes): 4096-sample blocks, 44.1 kHz, stereo, 16 bit, 10 s
+    info = struct.pack(">HH", 4096, 4096) + b"\x00\x00\x00" + b"\x00\x00\x00"
+    sample_rate, channels, bps, total = 44100, 2, 16, 441000
+    packed = (sample_rate << 44) | ((channels - 1) << 41) | ((bps - 1) << 36) | total
+    info += packed.to_bytes(8, "big") + b"\x00" * 16
+    return b"fLaC" + bytes([0x80]) + len(info).to_bytes(3, "big") + info
+
+
+def _wav_stream() -> bytes:
+    fmt = struct.pack("<HHIIHH", 1, 2, 44100, 44100 * 4, 4, 16)
+    data = b"\x00" * 44100 * 4
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt + b"data" + struct.pack("<I", len(data)) + data
+    return b"RIFF" + struct.pack("<I", len(body)) + body
+
+
+def make_synthetic(dest: Path, per_ext: int) -> List[Path]:
+    from mutagen.flac import FLAC
+    from mutagen.id3 import ID3, TALB, TDRC, TIT2, TPE1, TRCK
+    from mutagen.wave import WAVE
+
+    def id3_frames(tags, i: int) -> None:
+        tags.add(TIT2(encoding=3, text=[f"Title {i}"]))
+        tags.add(TPE1(encoding=3, text=[f"Artist {i}"]))
+        tags.add(TALB(encoding=3, text=["Album"]))
+        tags.add(TRCK(encoding=3, text=[f"{i}/20"]))
+        tags.add(TDRC(encoding=3, text=["2011"]))
+
+    files: List[Path] = []
+    for i in range(per_ext):
+        p = dest / f"{i:04d}.mp3"
+        p.write_bytes(_mp3_frames())
+        tags = ID3()
+        id3_frames(tags, i)
+        tags.save(p)
+        files.append(p)
+
+        p = dest / f"{i:04d}.flac"
+        p.write_bytes(_flac_stream())
+        f = FLAC(p)
+        f["title"], f["artist"], f["album"], f["tracknumber"], f["date"] = f"Title {i}", f"Artist {i}", "Album", str(i), "2011"
+        f.save()
+        files.append(p)
+
+        p = dest / f"{i:04d}.wav"
+        p.write_bytes(_wav_stream())
+        w = WAVE(p)
+        w.add_tags()
+        id3_frames(w.tags, i)
+        w.save()
+        files.append(p)
+    return files
+
+
+def _bench(fn: Callable[[Path], LocalTrack], files: List[Path], repeat: int) -> Dict[str, float]:
+    per_ext: Dict[str, List[float]] = defaultdict(list)
+    for _ in range(repeat):
+        for p in files:
+            t0 = time.perf_counter()
+            try:
+                fn(p)
+            except Exception:
+                continue
+            per_ext[p.suffix.lower().lstrip(".")].append(time.perf_counter() - t0)
+    return {ext: sum(v) / len(v) for ext, v in per_ext.items() if v}
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--path", default=None, help="Dossier de fichiers réels (sinon fichiers synthétiques)")
+    ap.add_argument("--per-ext", type=int, default=50, help="Nombre de fichiers par extension")
+    ap.add_argument("--repeat", type=int, default=3)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.path:
+            by_ext: Dict[str, List[Path]] = defaultdict(list)
+            for p in Path(args.path).rglob("*"):
+                ext = p.suffix.lower().lstrip(".")
+                if ext in DEFAULT_EXTS and len(by_ext[ext]) < args.per_ext:
+                    by_ext[ext].append(p)
+            files = [p for ps in by_ext.values() for p in ps]
+        else:
+            files = make_synthetic(Path(tmp), args.per_ext)
+
+        before = _bench(legacy_read_tags, files, args.repeat)
+        after = _bench(read_tags, files, args.repeat)
+
+    print(f"{'ext':<6} {'before (us)':>12} {'after (us)':>12} {'speedup':>8}")
+    for ext in DEFAULT_EXTS:
+        if ext in before and ext in after:
+            b, a = before[ext] * 1e6, after[ext] * 1e6
+            print(f"{ext:<6} {b:>12.1f} {a:>12.1f} {b / a:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
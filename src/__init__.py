@@ -1,11 +1,22 @@
 """spotify-playlist-importer package."""
 __all__ = [
+    "album",
+    "api_calls",
+    "artist",
     "auth",
+    "catalog",
     "cli",
+    "dedupe",
     "scanner",
+    "tag_cache",
+    "markets",
     "metadata",
     "matcher",
     "playlist",
+    "playlist_cache",
+    "response_cache",
+    "review",
+    "search_engine",
     "log_utils",
     "types",
     "utils",
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from rapidfuzz import fuzz
+
+from . import api_calls
+from .matcher import CandidatePool, _cand_from_item
+from .types import Candidate, LocalTrack
+from .utils import call_spotify_with_retries, text_forms
+
+# Album mode: one album search + its tracklist for a whole folder, instead of a
+# planned search per file. Files left unassigned fall back to per-track search.
+
+ALBUM_MIN_TRACKS = 3  # smaller groups are searched per track
+ALBUM_MIN_MATCH = 0.75  # album search result accepted from this score
+ALBUM_MIN_SCORE = 0.6  # file <-> album track pairs below this are left to per-track search
+
+
+def linear_assignment(scores) -> List[Tuple[int, int]]:
+    """Maximum-weight matching of rows to columns (Hungarian algorithm, O(n²m)).
+
+    ``scores`` is an n x m matrix (list of lists or numpy array). Each row gets at
+    most one column and each column at most one row; returns sorted (row, col) pairs.
+    """
+    rows = [list(map(float, r)) for r in scores]
+    n = len(rows)
+    m = len(rows[0]) if n else 0
+    if not n or not m:
+        return []
+    transposed = n > m
+    if transposed:
+        rows = [[rows[i][j] for i in range(n)] for j in range(m)]
+        n, m = m, n
+
+    inf = float("inf")
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    p = [0] * (m + 1)  # p[j]: row (1-based) assigned to column j
+    way = [0] * (m + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minv = [inf] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0, delta, j1 = p[j0], inf, 0
+            row = rows[i0 - 1]
+            for j in range(1, m + 1):
+                if not used[j]:
+                    cur = -row[j - 1] - u[i0] - v[j]
+                    if cur < minv[j]:
+                        minv[j], way[j] = cur, j0
+                    if minv[j] < delta:
+                        delta, j1 = minv[j], j
+            for j in range(m + 1):
+                if used[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            p[j0] = p[j1]
+            j0 = j1
+
+    pairs = [(p[j] - 1, j - 1) for j in range(1, m + 1) if p[j]]
+    if transposed:
+        pairs = [(j, i) for i, j in pairs]
+    return sorted(pairs)
+
+
+def group_by_album(
+    tracks: Iterable[Tuple[Path, LocalTrack]], min_tracks: int = ALBUM_MIN_TRACKS
+) -> List[List[Tuple[Path, LocalTrack]]]:
+    """Group files by (folder, album tag); groups smaller than min_tracks are dropped."""
+    groups: Dict[Tuple[Path, str], List[Tuple[Path, LocalTrack]]] = defaultdict(list)
+    for path, lt in tracks:
+        key = text_forms(lt.album or "").folded
+        if key:
+            groups[(path.parent, key)].append((path, lt))
+    return [g for g in groups.values() if len(g) >= max(1, min_tracks)]
+
+
+def _album_artist(lts: Sequence[LocalTrack]) -> Optional[str]:
+    # Compilations (no artist on most files) are searched by album name only
+    artist, n = Counter(text_forms(lt.artist or "").defeat for lt in lts).most_common(1)[0]
+    return artist if artist and n * 2 > len(lts) else None
+
+
+def _album_score(album: dict, name: str, artist: Optional[str], n_files: int) -> float:
+    a_name = text_forms(album.get("name", "")).folded
+    s = fuzz.token_set_ratio(text_forms(name).folded, a_name) / 100.0
+    if artist:
+        a_artist = ", ".join(a.get("name", "") for a in album.get("artists", []))
+        s = 0.6 * s + 0.3 * fuzz.token_set_ratio(artist, a_artist) / 100.0
+    else:
+        s = 0.9 * s
+    total = int(album.get("total_tracks") or 0)
+    if total:
+        s += 0.1 * min(n_files, total) / max(n_files, total)
+    return s
+
+
+@dataclass
+class AlbumMatch:
+    """Outcome of album mode for one group of files."""
+
+    album: Optional[dict]
+    assigned: Dict[Path, Candidate]  # file -> album track (scored for that file)
+    pool: Optional[CandidatePool]
+    calls: int
+
+
+def find_album(sp, lts: Sequence[LocalTrack], market: Optional[str]) -> Tuple[Optional[dict], int]:
+    """Search the album of a group of files; returns (album item or None, API calls)."""
+    name = text_forms(lts[0].album or "").stripped
+    artist = _album_artist(lts)
+    queries = [f'album:"{name}" artist:"{artist}"' if artist else f'album:"{name}"']
+    queries.append(f"{name} {artist}" if artist else name)
+    calls = 0
+    for q in queries:
+        for m in dict.fromkeys([market, None]):
+            with api_calls.tagged("album"):
+                resp = call_spotify_with_retries(sp.search, q=q, type="album", market=m, limit=10)
+            calls += 1
+            items = (resp or {}).get("albums", {}).get("items", [])
+            scored = [(_album_score(a, name, artist, len(lts)), i, a) for i, a in enumerate(items) if a]
+            if scored:
+                best, _, album = max(scored, key=lambda t: (t[0], -t[1]))
+                if best >= ALBUM_MIN_MATCH:
+                    return album, calls
+    return None, calls
+
+
+def fetch_album_tracks(sp, album: dict, market: Optional[str]) -> Tuple[List[Candidate], int]:
+    """Tracklist of an album as candidates (album name/year filled in); returns (cands, calls)."""
+    album_info = {"name": album.get("name", ""), "release_date": album.get("release_date")}
+    cands: List[Candidate] = []
+    calls = 0
+    offset = 0
+    while True:
+        resp = call_spotify_with_retries(sp.album_tracks, album["id"], limit=50, offset=offset, market=market)
+        calls += 1
+        items = (resp or {}).get("items", [])
+        call_id = api_calls.last_call_id()
+        cands.extend(
+            _cand_from_item({**it, "album": album_info}, market, call_id) for it in items if it and it.get("uri")
+        )
+        if not (resp or {}).get("next") or not items:
+            return cands, calls
+        offset += len(items)
+
+
+def match_album(
+    sp, group: Sequence[Tuple[Path, LocalTrack]], market: Optional[str], min_score: float = ALBUM_MIN_SCORE
+) -> AlbumMatch:
+    """Resolve a group of files against one album with a global assignment.
+
+    Pairs are chosen to maximize the total score (title, artist, album, duration,
+    track number) over the whole folder, so two files never get the same track.
+    """
+    lts = [lt for _, lt in group]
+    album, calls = find_album(sp, lts, market)
+    if album is None:
+        return AlbumMatch(None, {}, None, calls)
+    tracks, n = fetch_album_tracks(sp, album, market)
+    calls += n
+    if not tracks:
+        return AlbumMatch(album, {}, None, calls)
+    pool = CandidatePool(tracks)
+    scores = pool.score_matrix(lts)
+    assigned: Dict[Path, Candidate] = {}
+    for i, j in linear_assignment(scores):
+        sc = float(scores[i][j])
+        if sc >= min_score:
+            assigned[group[i][0]] = replace(pool.cands[j], score=sc)
+    return AlbumMatch(album, assigned, pool, calls)
+
+
+def album_candidates(m: AlbumMatch, path: Path, lt: LocalTrack, limit: int) -> List[Candidate]:
+    """Candidates shown for an assigned file: its assigned track first, then the rest of the album."""
+    chosen = m.assigned[path]
+    others = [c for c in m.pool.ranked(lt) if c.uri != chosen.uri] if m.pool is not None else []
+    return [chosen] + others[: max(limit, 1) - 1]
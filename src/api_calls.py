@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Accounting of Spotify API calls: call_spotify_with_retries records every call
+# (endpoint, market, latency, attempts, 429s) in the active ApiCallLog; the matcher
+# tags its calls with the query strategy, and the CLI marks the call that produced
+# each accepted candidate.
+
+_local = threading.local()
+_active: Optional["ApiCallLog"] = None
+
+
+@dataclass
+class ApiCall:
+    """One logical API call (all its retries included)."""
+
+    endpoint: str
+    market: Optional[str]
+    strategy: Optional[str] = None
+    attempts: int = 0
+    throttled: int = 0  # 429 responses
+    cached: bool = False  # answered by the search response cache
+    ok: bool = True
+    ms: float = 0.0
+    id: Optional[int] = None
+    _t0: float = field(default_factory=time.perf_counter, repr=False)
+
+
+@dataclass
+class CallTotals:
+    calls: int = 0
+    cached: int = 0
+    failed: int = 0
+    retries: int = 0
+    throttled: int = 0
+    ms: float = 0.0
+    accepted: int = 0
+
+
+def set_active(log: Optional["ApiCallLog"]) -> None:
+    """Make ``log`` receive every call (None stops the accounting)."""
+    global _active
+    _active = log
+
+
+@contextmanager
+def tagged(strategy: Optional[str]) -> Iterator[None]:
+    """Attribute the calls made by this thread inside the block to ``strategy``."""
+    previous = getattr(_local, "strategy", None)
+    _local.strategy = strategy
+    try:
+        yield
+    finally:
+        _local.strategy = previous
+
+
+def start(endpoint: str, market: Optional[str]) -> ApiCall:
+    call = ApiCall(endpoint, market, getattr(_local, "strategy", None))
+    _local.current = call
+    return call
+
+
+def note_cached() -> None:
+    """Called by the response cache when the current call needs no request."""
+    call = getattr(_local, "current", None)
+    if call is not None:
+        call.cached = True
+
+
+def finish(call: ApiCall) -> None:
+    call.ms = (time.perf_counter() - call._t0) * 1000.0
+    _local.current = None
+    log = _active
+    if log is not None:
+        log.record(call)
+    _local.last = call
+
+
+def accepted(call_id: Optional[int], uri: str) -> None:
+    """Credit the call that produced an accepted candidate in the active log."""
+    log = _active
+    if log is not None:
+        log.accepted(call_id, uri)
+
+
+def last_call_id() -> Optional[int]:
+    """Id of the last call finished by this thread (None when not recorded)."""
+    call = getattr(_local, "last", None)
+    return call.id if call is not None else None
+
+
+class ApiCallLog:
+    """Per-call NDJSON log of a run plus totals by (endpoint, strategy, market).
+
+    Call records are written as they happen; ``accepted`` appends a record naming
+    the call that produced an accepted candidate. Safe to share between threads.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = self.path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self._keys: Dict[int, Tuple[str, str, str]] = {}
+        self.totals: Dict[Tuple[str, str, str], CallTotals] = {}
+
+    @staticmethod
+    def _key(call: ApiCall) -> Tuple[str, str, str]:
+        return call.endpoint, call.strategy or "-", call.market or "global"
+
+    def record(self, call: ApiCall) -> None:
+        key = self._key(call)
+        with self._lock:
+            call.id = self._next_id
+            self._next_id += 1
+            self._keys[call.id] = key
+            t = self.totals.setdefault(key, CallTotals())
+            t.calls += 1
+            t.cached += call.cached
+            t.failed += not call.ok
+            t.retries += max(0, call.attempts - 1)
+            t.throttled += call.throttled
+            t.ms += call.ms
+            rec = {
+                "call": call.id,
+                "endpoint": call.endpoint,
+                "strategy": call.strategy,
+                "market": call.market,
+                "ms": round(call.ms, 1),
+                "attempts": call.attempts,
+                "throttled": call.throttled,
+                "cached": call.cached,
+                "ok": call.ok,
+            }
+            self._fh.write(json.dumps(rec) + "\n")
+
+    def accepted(self, call_id: Optional[int], uri: str) -> None:
+        """Mark the call that produced an accepted candidate."""
+        with self._lock:
+            key = self._keys.get(call_id) if call_id is not None else None
+            if key is None:
+                return
+            self.totals[key].accepted += 1
+            self._fh.write(json.dumps({"accepted": call_id, "uri": uri}) + "\n")
+
+    def rows(self) -> List[Tuple[Tuple[str, str, str], CallTotals]]:
+        with self._lock:
+            return sorted(self.totals.items(), key=lambda kv: (-kv[1].calls, kv[0]))
+
+    def close(self) -> None:
+        with self._lock:
+            self._fh.close()
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from rapidfuzz import fuzz
+
+from . import api_calls
+from .matcher import CandidatePool, _cand_from_item
+from .types import Candidate, LocalTrack
+from .utils import call_spotify_with_retries, chunked, text_forms
+
+# Artist prefetch: for artists with many local files, the artist's discography is
+# fetched once (bulk album endpoints, max page sizes) and matched locally before
+# any per-track search.
+
+ARTIST_MIN_TRACKS = 10  # smaller groups are searched per track
+ARTIST_MIN_MATCH = 0.9  # artist search result accepted from this name similarity
+ARTIST_MAX_ALBUMS = 200  # bound the prefetch for huge catalogs
+ARTIST_GROUPS = "album,single,compilation"
+ALBUMS_BATCH = 20  # sp.albums accepts 20 ids per call
+PAGE_SIZE = 50
+
+
+def artist_key(lt: LocalTrack) -> str:
+    return text_forms(lt.artist or "").folded
+
+
+def group_by_artist(
+    tracks: Iterable[Tuple[Path, LocalTrack]], min_tracks: int = ARTIST_MIN_TRACKS
+) -> Dict[str, List[Tuple[Path, LocalTrack]]]:
+    """Group files by normalized artist; only artists with >= min_tracks files are kept."""
+    groups: Dict[str, List[Tuple[Path, LocalTrack]]] = defaultdict(list)
+    for path, lt in tracks:
+        key = artist_key(lt)
+        if key:
+            groups[key].append((path, lt))
+    return {k: g for k, g in groups.items() if len(g) >= max(1, min_tracks)}
+
+
+@dataclass
+class ArtistCatalog:
+    """Prefetched discography of one artist."""
+
+    artist: Optional[dict]
+    pool: Optional[CandidatePool]
+    calls: int
+
+
+def find_artist(sp, name: str, market: Optional[str]) -> Tuple[Optional[dict], int]:
+    """Resolve an artist name to its Spotify artist item; returns (item or None, API calls)."""
+    with api_calls.tagged("artist"):
+        resp = call_spotify_with_retries(sp.search, q=f'artist:"{name}"', type="artist", market=market, limit=10)
+    items = [a for a in (resp or {}).get("artists", {}).get("items", []) if a]
+    folded = text_forms(name).folded
+    scored = [
+        (fuzz.ratio(folded, text_forms(a.get("name", "")).folded) / 100.0, a.get("popularity") or 0, -i, a)
+        for i, a in enumerate(items)
+    ]
+    scored = [t for t in scored if t[0] >= ARTIST_MIN_MATCH]
+    if not scored:
+        return None, 1
+    return max(scored, key=lambda t: t[:3])[3], 1
+
+
+def fetch_artist_tracks(sp, artist_id: str, market: Optional[str]) -> Tuple[List[Candidate], int]:
+    """Every track of the artist's albums/singles/compilations; returns (cands, API calls)."""
+    calls = 0
+    album_ids: List[str] = []
+    offset = 0
+    while len(album_ids) < ARTIST_MAX_ALBUMS:
+        resp = call_spotify_with_retries(
+            sp.artist_albums, artist_id, album_type=ARTIST_GROUPS, country=market, limit=PAGE_SIZE, offset=offset
+        )
+        calls += 1
+        items = (resp or {}).get("items", [])
+        album_ids.extend(a["id"] for a in items if a and a.get("id"))
+        if not (resp or {}).get("next") or not items:
+            break
+        offset += len(items)
+    album_ids = list(dict.fromkeys(album_ids))[:ARTIST_MAX_ALBUMS]
+
+    cands: List[Candidate] = []
+    for batch in chunked(album_ids, ALBUMS_BATCH):
+        resp = call_spotify_with_retries(sp.albums, batch, market=market)
+        call_id = api_calls.last_call_id()
+        calls += 1
+        for album in (resp or {}).get("albums", []):
+            if not album:
+                continue
+            info = {"name": album.get("name", ""), "release_date": album.get("release_date")}
+            page = album.get("tracks") or {}
+            tracks = list(page.get("items", []))
+            # Albums longer than the embedded page (50 tracks)
+            while page.get("next"):
+                page = call_spotify_with_retries(
+                    sp.album_tracks, album["id"], limit=PAGE_SIZE, offset=len(tracks), market=market
+                ) or {}
+                calls += 1
+                if not page.get("items"):
+                    break
+                tracks.extend(page["items"])
+            cands.extend(_cand_from_item({**t, "album": info}, market, call_id) for t in tracks if t and t.get("uri"))
+    return cands, calls
+
+
+def prefetch_artist(sp, group: Sequence[Tuple[Path, LocalTrack]], market: Optional[str]) -> ArtistCatalog:
+    """Resolve the artist of a group once and load its discography into a CandidatePool."""
+    name = text_forms(group[0][1].artist or "").defeat
+    artist, calls = find_artist(sp, name, market)
+    if artist is None:
+        return ArtistCatalog(None, None, calls)
+    cands, n = fetch_artist_tracks(sp, artist["id"], market)
+    return ArtistCatalog(artist, CandidatePool(cands) if cands else None, calls + n)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .utils import text_forms
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS tracks (
+        id TEXT PRIMARY KEY,
+        isrc TEXT,
+        market TEXT,
+        ngrams INTEGER NOT NULL,
+        item BLOB NOT NULL,
+        seen REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS tracks_isrc ON tracks(isrc)",
+    "CREATE TABLE IF NOT EXISTS tokens (token TEXT NOT NULL, id TEXT NOT NULL, PRIMARY KEY (token, id)) WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS trigrams (gram TEXT NOT NULL, id TEXT NOT NULL, PRIMARY KEY (gram, id)) WITHOUT ROWID",
+]
+
+_token_re = re.compile(r"\w+")
+# Bound the size of the IN (...) lists sent to SQLite
+_MAX_QUERY_TERMS = 200
+
+
+def _index_text(title: str, artist: str) -> str:
+    return " ".join(x for x in (text_forms(title or "").folded, text_forms(artist or "").folded) if x)
+
+
+def _tokens(text: str) -> Set[str]:
+    return set(_token_re.findall(text))
+
+
+def _trigrams(text: str) -> Set[str]:
+    # Word boundaries count: "a b" and "ab" must not look identical
+    s = f" {text} "
+    return {s[i : i + 3] for i in range(len(s) - 2)}
+
+
+class TrackCatalog:
+    """Local catalog of every Spotify track item seen in search responses (SQLite).
+
+    Track items are indexed by ISRC, by token and by character trigram of the
+    normalized "title artist" string, so that a later run can find them again
+    without calling the API. ``lookup`` only retrieves; scoring is left to the matcher.
+    Safe to share between threads.
+    """
+
+    def __init__(self, db_path: Path | str = Path(".cache") / "catalog.sqlite", commit_every: int = 200):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for stmt in _SCHEMA:
+            self._conn.execute(stmt)
+        self._conn.commit()
+        self._commit_every = max(1, commit_every)
+        self._pending = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM tracks").fetchone()[0]
+
+    def add_items(self, items: Iterable[dict], market: Optional[str]) -> None:
+        """Store the track items of a search response returned for ``market``."""
+        now = time.time()
+        with self._lock:
+            for it in items:
+                tid = it.get("id")
+                if not tid:
+                    continue
+                artist = ", ".join(a.get("name", "") for a in it.get("artists", []))
+                text = _index_text(it.get("name", ""), artist)
+                grams = _trigrams(text)
+                isrc = ((it.get("external_ids") or {}).get("isrc") or "").upper() or None
+                blob = zlib.compress(json.dumps(it, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+                known = self._conn.execute("SELECT market FROM tracks WHERE id = ?", (tid,)).fetchone()
+                if known is not None:
+                    # Keep the response of the first market; refresh the item itself
+                    self._conn.execute("UPDATE tracks SET item = ?, seen = ? WHERE id = ?", (blob, now, tid))
+                    continue
+                self._conn.execute(
+                    "INSERT INTO tracks (id, isrc, market, ngrams, item, seen) VALUES (?, ?, ?, ?, ?, ?)",
+                    (tid, isrc, market, len(grams), blob, now),
+                )
+                self._conn.executemany("INSERT OR IGNORE INTO tokens VALUES (?, ?)", [(t, tid) for t in _tokens(text)])
+                self._conn.executemany("INSERT OR IGNORE INTO trigrams VALUES (?, ?)", [(g, tid) for g in grams])
+                self._pending += 1
+            if self._pending >= self._commit_every:
+                self._conn.commit()
+                self._pending = 0
+
+    def lookup(
+        self, title: Optional[str], artist: Optional[str], isrc: Optional[str] = None, limit: int = 50
+    ) -> List[Tuple[dict, Optional[str]]]:
+        """Return up to ``limit`` (track item, market) pairs resembling title/artist.
+
+        ISRC matches come first, then tracks ranked by token overlap and trigram
+        similarity (Dice coefficient) with the normalized query.
+        """
+        text = _index_text(title or "", artist or "")
+        tokens = sorted(_tokens(text))[:_MAX_QUERY_TERMS]
+        grams = sorted(_trigrams(text))[:_MAX_QUERY_TERMS] if text else []
+        ranked: Dict[str, float] = {}
+        with self._lock:
+            if isrc:
+                for (tid,) in self._conn.execute("SELECT id FROM tracks WHERE isrc = ?", (isrc.upper(),)):
+                    ranked[tid] = 2.0
+            if tokens:
+                rows = self._conn.execute(
+                    f"SELECT id, COUNT(*) FROM tokens WHERE token IN ({','.join('?' * len(tokens))})"
+                    " GROUP BY id ORDER BY COUNT(*) DESC LIMIT ?",
+                    (*tokens, limit * 4),
+                )
+                for tid, n in rows:
+                    ranked[tid] = max(ranked.get(tid, 0.0), n / len(tokens))
+            if grams:
+                rows = self._conn.execute(
+                    f"SELECT t.id, COUNT(*), t.ngrams FROM trigrams g JOIN tracks t ON t.id = g.id"
+                    f" WHERE g.gram IN ({','.join('?' * len(grams))})"
+                    " GROUP BY t.id ORDER BY COUNT(*) DESC LIMIT ?",
+                    (*grams, limit * 4),
+                )
+                for tid, n, total in rows:
+                    ranked[tid] = max(ranked.get(tid, 0.0), 2.0 * n / (len(grams) + total))
+            best = sorted(ranked, key=lambda tid: (-ranked[tid], tid))[:limit]
+            rows = []
+            if best:
+                rows = self._conn.execute(
+                    f"SELECT id, market, item FROM tracks WHERE id IN ({','.join('?' * len(best))})", best
+                ).fetchall()
+        by_id = {tid: (json.loads(zlib.decompress(blob).decode("utf-8")), market) for tid, market, blob in rows}
+        return [by_id[tid] for tid in best if tid in by_id]
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._pending:
+                self._conn.commit()
+                self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._conn.close()
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
+import logging
+import time
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Dict, List, Optional, Set, IO
+from typing import Dict, Iterator, List, Optional, Set, Tuple, IO
 
 from rich.console import Console
+from rich.table import Table
 from tqdm import tqdm
 
+from .album import ALBUM_MIN_TRACKS, AlbumMatch, album_candidates, group_by_album, match_album
+from .artist import ARTIST_MIN_TRACKS, artist_key, group_by_artist, prefetch_artist
 from .auth import get_spotify_client
 from .log_utils import init_summaries, setup_logging, write_summary_row
-from .matcher import _UserQuit, decide_with_auto_or_menu, search_candidates, score_candidate
-from .metadata import infer_from_filename, read_tags
+from . import api_calls
+from .markets import GLOBAL, MarketScheduler, MarketStats
+from .matcher import TRACKS_BATCH, CandidatePool, _UserQuit, decide_with_auto_or_menu, lookup_tracks
+from .metadata import iter_local_tracks, load_local_track
 from .playlist import (
     add_tracks_batched,
     ensure_playlist_create,
@@ -20,10 +29,16 @@ from .playlist import (
     list_user_playlists,
     safe_select_playlist_interactive,
 )
-from .types import ADDED, AMBIGUOUS, DUPLICATE, NOT_FOUND, PLANNED_ADD, LocalTrack
+from .playlist_cache import PlaylistCache
+from .response_cache import CachedSearchClient, SearchResponseCache
+from .catalog import TrackCatalog
+from .review import ReviewQueue
+from .search_engine import SearchEngine
+from .types import ADDED, AMBIGUOUS, DUPLICATE, NOT_FOUND, PLANNED_ADD, Candidate, LocalTrack, PlaylistInfo
 from .utils import DEFAULT_EXTS
-from .utils import strip_suffixes, remove_feat
-from .scanner import iter_audio_files
+from .tag_cache import TagCache, stat_key
+from .dedupe import cluster_by_audio
+from .scanner import ScanManifest, default_manifest_path, iter_audio_files
 from .advanced import enhance_from_filename_anime
 
 console = Console()
@@ -34,7 +49,7 @@ def parse_args() -> argparse.Namespace:
         prog="spotify-playlist-importer",
         description="Importer des fichiers audio locaux vers une playlist Spotify (matching)",
     )
-    p.add_argument("--path-import", required=True, help="Chemin du dossier à scanner")
+    p.add_argument("--path-import", help="Chemin du dossier à scanner")
     p.add_argument("--market", default="FR")
     p.add_argument("--public", action="store_true")
     p.add_argument("--private", action="store_true")
@@ -55,6 +70,109 @@ def parse_args() -> argparse.Namespace:
     p.add_argument("--no-follow-symlinks", action="store_true")
     p.add_argument("--ignore-hidden", action="store_true")
     p.add_argument("--no-recursive", action="store_true", help="Ne pas descendre dans les sous-dossiers du dossier fourni")
+    p.add_argument(
+        "--incremental-scan",
+        action="store_true",
+        help="Scan incrémental: ne relister que les dossiers modifiés depuis le dernier run (manifeste dans .cache/)",
+    )
+    p.add_argument(
+        "--search-workers",
+        type=int,
+        default=1,
+        help="Requêtes Spotify en parallèle (par titre et sur les titres suivants), 1 = séquentiel",
+    )
+    p.add_argument(
+        "--prefetch",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Lecture anticipée: tags et recherche des N fichiers suivants pendant que le menu est affiché (0 = désactivé)",
+    )
+    p.add_argument(
+        "--market-order",
+        choices=["auto", "fixed"],
+        default="auto",
+        help="Ordre des marchés: 'auto' selon l'écriture du titre/artiste et les statistiques des runs précédents, "
+        "'fixed' = marché principal, JP, US, global (défaut: auto)",
+    )
+    p.add_argument("--market-stats", action="store_true", help="Afficher les statistiques de marchés par artiste et quitter")
+    p.add_argument("--reset-market-stats", action="store_true", help="Effacer les statistiques de marchés et quitter")
+    p.add_argument(
+        "--no-search-cache",
+        action="store_true",
+        help="Désactiver le cache disque des réponses de recherche (.cache/search.sqlite)",
+    )
+    p.add_argument(
+        "--no-catalog",
+        action="store_true",
+        help="Ne pas utiliser le catalogue local des titres déjà vus (.cache/catalog.sqlite)",
+    )
+    p.add_argument(
+        "--no-playlist-cache",
+        action="store_true",
+        help="Toujours relire la playlist cible (sinon réutilisée depuis .cache/playlists.sqlite si son snapshot_id n'a pas changé)",
+    )
+    p.add_argument("--search-cache-ttl", type=float, default=168.0, help="Durée de vie du cache de recherche, en heures (défaut: 168)")
+    p.add_argument("--search-cache-max-mb", type=float, default=200.0, help="Taille max du cache de recherche en Mo (éviction LRU)")
+    p.add_argument(
+        "--tag-workers",
+        type=int,
+        default=0,
+        help="Lire les tags dans N processus en parallèle (0 = séquentiel)",
+    )
+    p.add_argument(
+        "--no-tag-cache",
+        action="store_true",
+        help="Désactiver le cache des tags (.cache/tags.sqlite, invalidé par taille/mtime)",
+    )
+    p.add_argument(
+        "--album-mode",
+        action="store_true",
+        help="Regrouper les fichiers par dossier + album : une recherche d'album et sa tracklist pour tout le dossier",
+    )
+    p.add_argument(
+        "--album-min-tracks",
+        type=int,
+        default=ALBUM_MIN_TRACKS,
+        help=f"Taille minimale d'un groupe pour le mode album (défaut: {ALBUM_MIN_TRACKS})",
+    )
+    p.add_argument(
+        "--artist-prefetch",
+        action="store_true",
+        help="Pour les artistes très présents, charger leur discographie une fois et chercher d'abord dedans",
+    )
+    p.add_argument(
+        "--artist-min-tracks",
+        type=int,
+        default=ARTIST_MIN_TRACKS,
+        help=f"Nombre minimal de fichiers d'un artiste pour --artist-prefetch (défaut: {ARTIST_MIN_TRACKS})",
+    )
+    p.add_argument(
+        "--defer-review",
+        action="store_true",
+        help="Ne pas bloquer sur le menu : les titres incertains sont mis en file de revue, traitée en fin de run",
+    )
+    p.add_argument(
+        "--review",
+        action="store_true",
+        help="Traiter uniquement la file de revue d'une session précédente (pas de scan)",
+    )
+    p.add_argument(
+        "--review-queue",
+        default=str(Path(".cache") / "review-queue.ndjson"),
+        help="Fichier de la file de revue (défaut: .cache/review-queue.ndjson)",
+    )
+    p.add_argument(
+        "--cluster-duplicates",
+        action="store_true",
+        help="Regrouper les fichiers dont l'audio est identique (tags exclus) et ne chercher qu'une fois par groupe",
+    )
+    p.add_argument(
+        "--watch",
+        action="store_true",
+        help="Après le traitement, surveiller --path-import et importer les nouveaux fichiers au fil de l'eau",
+    )
+    p.add_argument("--watch-interval", type=float, default=30.0, help="Intervalle de scrutation en secondes (mode --watch)")
     p.add_argument(
         "--advanced-search",
         type=str,
@@ -62,7 +180,10 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Active une recherche avancée en fonction du nom de fichier (ex: 'anime')",
     )
-    return p.parse_args()
+    args = p.parse_args()
+    if not args.path_import and not (args.review or args.market_stats or args.reset_market_stats):
+        p.error("l'argument --path-import est requis")
+    return args
 
 
 def prompt_main_menu() -> str:
@@ -123,7 +244,17 @@ def decide_status(best_uri: Optional[str], existing: Set[str], dry_run: bool, as
     return PLANNED_ADD if dry_run else ADDED
 
 
-def log_and_append_summary(csv_path: Path, json_path: Path, path: Path, lt: LocalTrack, best_uri: Optional[str], status: str, score: Optional[float]) -> None:
+def log_and_append_summary(
+    csv_path: Path,
+    json_path: Path,
+    path: Path,
+    lt: LocalTrack,
+    best_uri: Optional[str],
+    status: str,
+    score: Optional[float],
+    alternates: Optional[List[str]] = None,
+    track: Optional[Candidate] = None,
+) -> None:
     row = {
         "path": str(path),
         "title": lt.title,
@@ -135,7 +266,13 @@ def log_and_append_summary(csv_path: Path, json_path: Path, path: Path, lt: Loca
         "decision": status,
         "score": score,
         "uri": best_uri,
+        "track_name": track.name if track else None,
+        "track_artists": ", ".join(track.artists) if track else None,
+        "track_duration_ms": track.duration_ms if track else None,
     }
+    if alternates:
+        # Same recording under other markets/releases (JSON only)
+        row["alternates"] = alternates
     write_summary_row(csv_path, json_path, row)
 
 
@@ -161,7 +298,11 @@ def _load_resume(resume_path: Optional[str]) -> Dict[str, dict]:
                             continue
                         path = obj.get("path")
                         if path:
-                            processed[str(path)] = {"uri": obj.get("uri"), "score": obj.get("score")}
+                            processed[str(path)] = {
+                                "uri": obj.get("uri"),
+                                "score": obj.get("score"),
+                                "status": obj.get("decision"),
+                            }
                 if processed:
                     return {"processed": processed}
             except Exception:
@@ -177,10 +318,501 @@ def _save_resume(resume_path: Optional[str], state: Dict[str, dict]) -> None:
     p.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
+def _norm_key(p: Path | str) -> str:
+    """Normalized resume key (case-insensitive, resolved path)."""
+    try:
+        pp = Path(p).resolve(strict=False)
+    except Exception:
+        pp = Path(str(p))
+    # Normalize to lowercase for Windows case-insensitivity and use as_posix for slashes
+    return pp.as_posix().casefold()
+
+
+def _tags_key(lt: LocalTrack) -> str:
+    """Short fingerprint of the tags a search depends on, kept in the resume state."""
+    fields = (lt.title, lt.artist, lt.album, lt.duration_ms, lt.isrc)
+    return hashlib.sha1("\x1f".join(str(f or "") for f in fields).encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class ImportRun:
+    """Mutable state of an import run, shared by the batch loop and watch mode."""
+
+    args: argparse.Namespace
+    sp: object
+    pl: PlaylistInfo
+    logger: logging.Logger
+    existing: Set[str]
+    state: Dict[str, dict]
+    csv_path: Path
+    json_path: Path
+    status_fhs: Dict[str, IO[str]]
+    engine: SearchEngine
+    to_add_batch: List[str] = field(default_factory=list)
+    counts: Dict[str, int] = field(
+        default_factory=lambda: {"added": 0, "skipped": 0, "not_found": 0, "ambiguous": 0, "duplicates": 0}
+    )
+    # --cluster-duplicates: path -> audio digest, digest -> (uri, score) decided for the cluster
+    clusters: Dict[Path, str] = field(default_factory=dict)
+    cluster_reps: Set[Path] = field(default_factory=set)
+    cluster_decisions: Dict[str, Tuple[Optional[str], Optional[float]]] = field(default_factory=dict)
+    # --defer-review: tracks that would prompt, decided after the batch (or with --review)
+    review: Optional[ReviewQueue] = None
+    # Decisions whose URI did not come from a search (pasted links, reused decisions), as
+    # record_decision arguments (path, lt, uri, status, score, alternates), until sp.tracks
+    # has checked them; tracks_info: uri -> track info from searches or sp.tracks (None = does not exist)
+    unverified: List[tuple] = field(default_factory=list)
+    tracks_info: Dict[str, Optional[Candidate]] = field(default_factory=dict)
+    # path -> _tags_key of the tags as read, saved with the decision (watch mode compares it)
+    read_tags: Dict[Path, str] = field(default_factory=dict)
+    # --album-mode: file -> album it was assigned to
+    album_matches: Dict[Path, AlbumMatch] = field(default_factory=dict)
+    # --artist-prefetch: normalized artist -> discography pool
+    artist_pools: Dict[str, CandidatePool] = field(default_factory=dict)
+    # URI set of the playlist per snapshot_id, updated after each playlist_add_items
+    playlist_cache: Optional[PlaylistCache] = None
+
+
+def _scan_files(
+    args, exts: List[str], exclude_dirs_list: List[str], manifest: Optional[ScanManifest]
+) -> Tuple[List[Path], int]:
+    """Scan --path-import and apply --exclude; returns (files, number excluded by keyword)."""
+    files = list(
+        iter_audio_files(
+            Path(args.path_import),
+            exts=exts,
+            follow_symlinks=not args.no_follow_symlinks,
+            ignore_hidden=args.ignore_hidden,
+            recursive=not args.no_recursive,
+            exclude_dirs=exclude_dirs_list,
+            manifest=manifest,
+        )
+    )
+    # Filter files based on --exclude parameter
+    excluded_count = 0
+    if args.exclude:
+        exclude_keywords = [kw.strip().lower() for kw in args.exclude.split(',') if kw.strip()]
+        if exclude_keywords:
+            original_count = len(files)
+            files = [
+                f for f in files
+                if not any(keyword in f.name.lower() for keyword in exclude_keywords)
+            ]
+            excluded_count = original_count - len(files)
+    return files, excluded_count
+
+
+def verify_pending(run: ImportRun) -> None:
+    """Check the deferred URIs with sp.tracks (50 per call), then record their decisions."""
+    pending, run.unverified = run.unverified, []
+    if not pending:
+        return
+    unknown = [uri for _, _, uri, _, _, _ in pending if uri not in run.tracks_info]
+    if unknown:
+        run.tracks_info.update(lookup_tracks(run.sp, unknown, market=run.args.market))
+    for path, lt, uri, status, score, alternates in pending:
+        if run.tracks_info.get(uri) is None:
+            run.existing.discard(uri)
+        record_decision(run, path, lt, uri, status, score, alternates)
+
+
+def flush_adds(run: ImportRun, force: bool = True) -> None:
+    """Send the pending URIs to the playlist (by 100, or everything if force)."""
+    if force:
+        verify_pending(run)
+    if run.args.dry_run or not run.to_add_batch:
+        return
+    if not force and len(run.to_add_batch) < 100:
+        return
+    if not force:
+        console.print("Ajout des 100 premiers titres…")
+    add_tracks_batched(run.sp, run.pl.id, run.to_add_batch, cache=run.playlist_cache)
+    run.to_add_batch.clear()
+
+
+def resolve_albums(run: ImportRun, tracks: List[Tuple[Path, LocalTrack]]) -> None:
+    """--album-mode: match each folder/album group against a Spotify album tracklist.
+
+    Assigned files skip the per-track search; the others are searched as usual.
+    """
+    groups = group_by_album(tracks, min_tracks=run.args.album_min_tracks)
+    if not groups:
+        return
+    calls = albums = files = 0
+    for group in tqdm(groups, desc="Albums"):
+        m = match_album(run.sp, group, run.args.market)
+        calls += m.calls
+        files += len(group)
+        if m.album is not None:
+            albums += 1
+            run.logger.debug(f"Album {m.album.get('name')!r}: {len(m.assigned)}/{len(group)} fichiers attribués")
+        for path in m.assigned:
+            run.album_matches[path] = m
+    console.print(
+        f"Mode album: {albums}/{len(groups)} albums trouvés, {len(run.album_matches)}/{files} fichiers attribués "
+        f"({calls} requêtes)"
+    )
+
+
+def prefetch_artists(run: ImportRun, tracks: List[Tuple[Path, LocalTrack]]) -> None:
+    """--artist-prefetch: load the discography of every artist-dominant group once.
+
+    Files already assigned by --album-mode are not counted.
+    """
+    groups = group_by_artist(
+        [(p, lt) for p, lt in tracks if p not in run.album_matches], min_tracks=run.args.artist_min_tracks
+    )
+    if not groups:
+        return
+    calls = n_tracks = 0
+    for key, group in tqdm(groups.items(), desc="Artistes"):
+        cat = prefetch_artist(run.sp, group, run.args.market)
+        calls += cat.calls
+        if cat.pool is not None:
+            run.artist_pools[key] = cat.pool
+            n_tracks += len(cat.pool)
+            run.logger.debug(f"Artiste {cat.artist.get('name')!r}: {len(cat.pool)} titres pour {len(group)} fichiers")
+    console.print(
+        f"Préchargement artistes: {len(run.artist_pools)}/{len(groups)} artistes, {n_tracks} titres ({calls} requêtes)"
+    )
+
+
+def review_deferred(run: ImportRun) -> None:
+    """Work through the review queue with the usual menu; [q] keeps the rest for later."""
+    queue = run.review
+    if queue is None or not len(queue):
+        return
+    console.print(f"[bold]Revue[/bold]: {len(queue)} titres en attente ([q] pour reprendre plus tard avec --review)")
+    processed = run.state.get("processed", {})
+    for path, lt, cands in queue:
+        # Entries without a status were only saved by a [q]: still to review
+        if processed.get(_norm_key(path), {}).get("status") is None:
+            decide_and_record(run, path, lt, cands)
+        queue.remove(path)
+    flush_adds(run)
+
+
+def prepare_track(run: ImportRun, path: Path, lt: LocalTrack) -> Tuple[LocalTrack, Optional[List[Candidate]]]:
+    """Metadata enhancement + candidate search for one file (safe to run ahead in a thread).
+
+    Returns (possibly enhanced LocalTrack, scored candidates); candidates are None for
+    cluster members that will reuse the decision of their representative.
+    """
+    args, logger = run.args, run.logger
+    if path in run.clusters and path not in run.cluster_reps:
+        return lt, None
+    album = run.album_matches.get(path)
+    if album is not None:
+        return lt, album_candidates(album, path, lt, run.engine.limit)
+    pool = run.artist_pools.get(artist_key(lt))
+    if pool is not None:
+        # Prefetched discography first; the planned search only if nothing is confident enough
+        ranked = pool.ranked(lt)
+        if ranked and ranked[0].score >= float(args.auto_accept):
+            return lt, ranked[: run.engine.limit]
+
+    # Try advanced anime search FIRST if enabled (before normal search)
+    anime_enhanced = False
+    if args.advanced_search == "anime":
+        try:
+            improved = enhance_from_filename_anime(path)
+            if improved and (improved.get("title") or improved.get("artist")):
+                logger.info(f"Anime metadata found: {improved.get('title')} by {improved.get('artist')}")
+                # Build a transient LocalTrack-like context with improved metadata
+                lt = replace(
+                    lt, title=improved.get("title") or lt.title, artist=improved.get("artist") or lt.artist
+                )
+                anime_enhanced = True
+        except Exception as e:
+            logger.debug(f"Anime search failed: {e}")
+
+    # In-run cache on normalized title/artist, only if we didn't enhance with anime data
+    cands = run.engine.candidates(lt, use_cache=not anime_enhanced)
+    return lt, cands
+
+
+def process_track(
+    run: ImportRun, path: Path, lt: LocalTrack, prepared: Optional[Tuple[LocalTrack, Optional[List[Candidate]]]] = None
+) -> None:
+    """Search, decide and record one local file. Raises _UserQuit after saving state."""
+    args, logger = run.args, run.logger
+    run.read_tags[path] = _tags_key(lt)
+
+    digest = run.clusters.get(path)
+    if digest is not None and digest in run.cluster_decisions:
+        # Same audio as an already decided file: reuse its decision without searching
+        best_uri, best_score = run.cluster_decisions[digest]
+        status = decide_status(best_uri, run.existing, args.dry_run)
+        logger.debug(f"Cluster {digest[:8]}: {path} -> {best_uri} ({status})")
+        record_decision(run, path, lt, best_uri, status, best_score)
+        return
+
+    if prepared is None or prepared[1] is None:
+        run.cluster_reps.add(path)
+        prepared = prepare_track(run, path, lt)
+    lt, cands = prepared
+
+    if run.review is not None and needs_review(run, cands):
+        # --defer-review: park it with its candidates and keep the pipeline moving
+        run.review.add(path, lt, cands[: max(1, min(5, int(args.max_candidates)))])
+        logger.debug(f"Revue différée: {path}")
+        return
+    decide_and_record(run, path, lt, cands)
+
+
+def needs_review(run: ImportRun, cands: Optional[List[Candidate]]) -> bool:
+    """True if deciding these candidates would prompt: the menu, or the duplicate question."""
+    if not cands:
+        return False
+    if cands[0].score >= float(run.args.auto_accept):
+        return cands[0].uri in run.existing
+    return run.args.auto_deny is None or cands[0].score > float(run.args.auto_deny)
+
+
+def decide_and_record(run: ImportRun, path: Path, lt: LocalTrack, cands: Optional[List[Candidate]]) -> None:
+    """Auto-decide or prompt for one file, then record the decision. Raises _UserQuit after saving state."""
+    args, logger = run.args, run.logger
+    key_cur = _norm_key(path)
+    digest = run.clusters.get(path)
+
+    best_uri = None
+    best_score = None
+    if cands:
+        best_uri = cands[0].uri
+        best_score = cands[0].score
+    # If under auto-accept, show interactive
+    try:
+        best_uri = decide_with_auto_or_menu(
+            cands,
+            lt,
+            float(args.auto_accept),
+            args.dry_run,
+            sp=run.sp,
+            market=args.market,
+            max_candidates=max(1, min(5, int(args.max_candidates))),
+            local_path=str(path),
+            auto_deny=float(args.auto_deny) if args.auto_deny is not None else None,
+        )
+        # Find track info for duplicate detection
+        track_info = None
+        chosen: Optional[Candidate] = None
+        alternates: List[str] = []
+        if best_uri and cands:
+            for c in cands:
+                if c.uri == best_uri:
+                    best_score = c.score
+                    track_info = f'"{c.name}" — {", ".join(c.artists)}'
+                    chosen = c
+                    alternates = [a.uri for a in c.alternates]
+                    break
+    except _UserQuit:
+        logger.info("Arrêt demandé par l'utilisateur. Sauvegarde de l'état.")
+        run.state.setdefault("processed", {})[key_cur] = {"uri": best_uri, "score": best_score}
+        _save_resume(args.resume, run.state)
+        raise
+
+    status = decide_status(best_uri, run.existing, args.dry_run, ask_on_duplicate=True, track_info=track_info)
+    record_decision(run, path, lt, best_uri, status, best_score, alternates, track=chosen)
+    if chosen is not None:
+        api_calls.accepted(chosen.call_id, chosen.uri)
+    if digest is not None:
+        run.cluster_decisions[digest] = (best_uri, best_score)
+
+
+def record_decision(
+    run: ImportRun,
+    path: Path,
+    lt: LocalTrack,
+    best_uri: Optional[str],
+    status: str,
+    best_score: Optional[float],
+    alternates: Optional[List[str]] = None,
+    track: Optional[Candidate] = None,
+) -> None:
+    """Update counters, pending adds, summaries and resume state for a decided file.
+
+    An accepted URI without track info (pasted link, reused decision) is deferred to
+    run.unverified and recorded once sp.tracks has confirmed it exists.
+    """
+    if status in (ADDED, PLANNED_ADD):
+        if track is not None:
+            run.tracks_info.setdefault(best_uri, track)  # type: ignore
+        elif best_uri not in run.tracks_info:
+            run.existing.add(best_uri)  # type: ignore  # later copies are duplicates
+            run.unverified.append((path, lt, best_uri, status, best_score, alternates))
+            if len(run.unverified) >= TRACKS_BATCH:
+                verify_pending(run)
+            return
+        else:
+            track = run.tracks_info[best_uri]  # type: ignore
+            if track is None:
+                run.logger.warning(f"URI inexistante ignorée: {best_uri} ({path})")
+                best_uri, status = None, NOT_FOUND
+
+    # Append path to per-status list file (once)
+    try:
+        if status in run.status_fhs:
+            run.status_fhs[status].write(str(path) + "\n")
+    except Exception:
+        pass
+
+    if status == ADDED or status == PLANNED_ADD:
+        run.to_add_batch.append(best_uri)  # type: ignore
+        run.existing.add(best_uri)  # type: ignore
+        run.counts["added"] += 1
+        flush_adds(run, force=False)
+    elif status == DUPLICATE:
+        run.counts["duplicates"] += 1
+    elif status == NOT_FOUND:
+        run.counts["not_found"] += 1
+    else:
+        run.counts["skipped"] += 1
+
+    log_and_append_summary(run.csv_path, run.json_path, path, lt, best_uri, status, best_score, alternates, track)
+
+    entry = {"uri": best_uri, "score": best_score, "status": status}
+    tags = run.read_tags.pop(path, None)
+    if tags is not None:
+        entry["tags"] = tags
+    run.state.setdefault("processed", {})[_norm_key(path)] = entry
+    _save_resume(run.args.resume, run.state)
+
+
+def lookahead_tracks(
+    args: argparse.Namespace, files: List[Path], tag_cache: Optional[TagCache]
+) -> Iterator[Tuple[Path, Optional[LocalTrack]]]:
+    """(path, LocalTrack) in order for the analysis loop.
+
+    With --prefetch and no --tag-workers, the tracks are None: the look-ahead threads
+    read the tags themselves. With --tag-workers, the process pool reads them ahead
+    of the look-ahead searches.
+    """
+    workers = max(0, int(args.tag_workers))
+    if int(args.prefetch) > 0 and workers <= 1:
+        return ((f, None) for f in files)
+    return iter_local_tracks(files, tag_cache=tag_cache, workers=workers)
+
+
+def watch_loop(
+    run: ImportRun,
+    exts: List[str],
+    exclude_dirs_list: List[str],
+    manifest: ScanManifest,
+    tag_cache: Optional[TagCache],
+    known: Dict[Path, Optional[tuple]],
+) -> None:
+    """Poll --path-import and import new or changed files in micro-batches.
+
+    The Spotify client, the playlist's URI set and the search cache stay in memory.
+    A file is processed once its size/mtime is stable across two polls, so files
+    still being copied are not read half-written. An already processed file is only
+    searched again if the tags the search uses changed. Nothing prompts while
+    watching: tracks that would are queued for review, which starts on Ctrl+C.
+    """
+    args, logger = run.args, run.logger
+    interval = max(1.0, float(args.watch_interval))
+    unstable: Dict[Path, Optional[tuple]] = {}
+    if run.review is None:
+        run.review = ReviewQueue(args.review_queue)
+    console.print(f"[bold]Mode watch[/bold]: surveillance de {args.path_import} toutes les {interval:.0f}s (Ctrl+C pour arrêter)")
+    try:
+        while True:
+            time.sleep(interval)
+            files, _ = _scan_files(args, exts, exclude_dirs_list, manifest)
+            ready: List[Path] = []
+            for f in files:
+                # Stat every file: an in-place edit (re-tagging) leaves the directory mtime unchanged
+                sk = stat_key(f)
+                if f in known and known[f] == sk:
+                    continue
+                if unstable.get(f) == sk and sk is not None:
+                    unstable.pop(f, None)
+                    known[f] = sk
+                    if f not in run.review:
+                        ready.append(f)
+                else:
+                    unstable[f] = sk
+            if not ready:
+                continue
+            processed = run.state.get("processed", {})
+            changed = 0
+            for path, lt in iter_local_tracks(ready, tag_cache=tag_cache):
+                done = processed.get(_norm_key(path))
+                if done is not None and done.get("status") is not None and done.get("tags") in (None, _tags_key(lt)):
+                    continue  # already decided and searched with the same tags
+                changed += 1
+                process_track(run, path, lt)
+            if changed:
+                logger.info(f"Watch: {changed} fichier(s) nouveau(x) ou modifié(s)")
+            flush_adds(run)
+            if tag_cache is not None:
+                tag_cache.flush()
+    except KeyboardInterrupt:
+        logger.info("Watch arrêté.")
+        flush_adds(run)
+        review_deferred(run)
+
+
+def show_market_stats(stats: MarketStats, top: int = 50) -> None:
+    """--market-stats: table of the markets where each artist was found."""
+    rows = stats.rows()
+    if not rows:
+        console.print(f"Aucune statistique de marché ({stats.path})")
+        return
+    table = Table(title=f"Statistiques de marchés — {len(rows)} artistes ({stats.path})")
+    table.add_column("Artiste")
+    table.add_column("Trouvé dans")
+    table.add_column("Sans résultat dans")
+
+    def by_market(counts: Dict[str, int]) -> str:
+        return ", ".join(
+            f"{'global' if m == GLOBAL else m}: {n}" for m, n in sorted(counts.items(), key=lambda kv: -kv[1])
+        ) or "-"
+
+    for artist, hits, misses in rows[:top]:
+        table.add_row(artist, by_market(hits), by_market(misses))
+    console.print(table)
+
+
+def show_api_calls(log: api_calls.ApiCallLog) -> None:
+    """End of run: API calls by endpoint, query strategy and market."""
+    rows = log.rows()
+    if not rows:
+        return
+    table = Table(title="Appels API Spotify")
+    table.add_column("Endpoint")
+    table.add_column("Stratégie")
+    table.add_column("Marché")
+    for name in ("Appels", "Cache", "Latence moy. (ms)", "Retries", "429", "Échecs", "Acceptés"):
+        table.add_column(name, justify="right")
+    for (endpoint, strategy, market), t in rows:
+        table.add_row(
+            endpoint,
+            strategy,
+            market,
+            str(t.calls),
+            str(t.cached),
+            f"{t.ms / t.calls:.0f}",
+            str(t.retries),
+            str(t.throttled),
+            str(t.failed),
+            str(t.accepted),
+        )
+    console.print(table)
+    console.print(f"Détail par appel: {log.path}")
+
+
 def main() -> None:
     args = parse_args()
+    if args.market_stats or args.reset_market_stats:
+        stats = MarketStats()
+        if args.reset_market_stats:
+            stats.reset()
+            console.print(f"Statistiques de marchés effacées ({stats.path})")
+        else:
+            show_market_stats(stats)
+        return
     exts = [e.strip().lstrip(".") for e in args.extensions.split(",") if e.strip()]
-    follow_symlinks = not args.no_follow_symlinks
 
     logger, log_path = setup_logging()
     csv_path, json_path = init_summaries()
@@ -196,11 +828,24 @@ def main() -> None:
             status_fhs[name] = p.open("a", encoding="utf-8")
     except Exception:
         status_fhs = {}
+    api_log = api_calls.ApiCallLog(reports_dir / f"api-calls-{ts}.ndjson")
+    api_calls.set_active(api_log)
 
     console.print("Connexion à Spotify → navigateur ouvert…")
     sp = get_spotify_client(
         scopes=["playlist-read-private", "playlist-modify-private", "playlist-modify-public"]
     )
+    response_cache = None
+    if not args.no_search_cache:
+        response_cache = SearchResponseCache(
+            ttl_seconds=float(args.search_cache_ttl) * 3600,
+            max_bytes=int(float(args.search_cache_max_mb) * 1024 * 1024),
+        )
+        sp = CachedSearchClient(sp, response_cache)
+    catalog = None if args.no_catalog else TrackCatalog()
+    playlist_cache = None if args.no_playlist_cache else PlaylistCache()
+    market_stats = MarketStats() if args.market_order == "auto" else None
+    scheduler = MarketScheduler(args.market, market_stats) if market_stats is not None else None
     me = sp.me()
     console.print(f"✔ Connecté en tant que {me.get('display_name') or me.get('id')}")
 
@@ -209,11 +854,13 @@ def main() -> None:
     if action == "create":
         meta = prompt_new_playlist_meta(args)  # name/public/collab/desc
         pl = ensure_playlist_create(sp, **meta)
+        if playlist_cache is not None:
+            playlist_cache.drop_listing(me.get("id"))
         console.print(
             f"Créée: '{pl.name}' — Public={'Oui' if pl.public else 'Non'} • Collaborative={'Oui' if pl.collaborative else 'Non'}"
         )
     elif action == "update":
-        pls = list_user_playlists(sp)
+        pls = list_user_playlists(sp, cache=playlist_cache, user_id=me.get("id"))
         pl = safe_select_playlist_interactive(pls)
         if not pl:
             return
@@ -221,52 +868,58 @@ def main() -> None:
     else:
         return
 
-    existing = get_playlist_track_uris(sp, pl.id)
-    to_add_batch: List[str] = []
+    existing = get_playlist_track_uris(sp, pl.id, cache=playlist_cache)
 
     # Load resume state and build a normalized processed set (case-insensitive, resolved paths)
-    def _norm_key(p: Path | str) -> str:
-        try:
-            pp = Path(p).resolve(strict=False)
-        except Exception:
-            pp = Path(str(p))
-        # Normalize to lowercase for Windows case-insensitivity and use as_posix for slashes
-        return pp.as_posix().casefold()
-
     state = _load_resume(args.resume)
     processed_norm = { _norm_key(k) for k in state.get("processed", {}).keys() }
 
+    run = ImportRun(
+        args=args,
+        sp=sp,
+        pl=pl,
+        logger=logger,
+        existing=existing,
+        state=state,
+        csv_path=csv_path,
+        json_path=json_path,
+        status_fhs=status_fhs,
+        engine=SearchEngine(
+            sp,
+            args.market,
+            workers=max(1, int(args.search_workers)),
+            stop_score=float(args.auto_accept),
+            catalog=catalog,
+            scheduler=scheduler,
+        ),
+        playlist_cache=playlist_cache,
+    )
+
     # Parse excluded directories
     exclude_dirs_list = []
     if args.exclude_dirs:
         exclude_dirs_list = [d.strip() for d in args.exclude_dirs.split(',') if d.strip()]
         if exclude_dirs_list:
             console.print(f"[yellow]Exclusion de dossiers: {', '.join(exclude_dirs_list)}[/yellow]")
-    
-    files = list(
-        iter_audio_files(
-            Path(args.path_import), 
-            exts=exts, 
-            follow_symlinks=follow_symlinks, 
-            ignore_hidden=args.ignore_hidden, 
-            recursive=not args.no_recursive,
-            exclude_dirs=exclude_dirs_list
-        )
-    )
-    
-    # Filter files based on --exclude parameter
-    if args.exclude:
+
+    if args.defer_review or args.review:
+        run.review = ReviewQueue(args.review_queue)
+        if len(run.review):
+            console.print(f"File de revue: {len(run.review)} titres en attente ({args.review_queue})")
+
+    manifest = None
+    if (args.incremental_scan or args.watch) and not args.no_recursive and not args.review:
+        manifest = ScanManifest(default_manifest_path(args.path_import))
+    if args.review:
+        files, excluded_count = [], 0
+    else:
+        files, excluded_count = _scan_files(args, exts, exclude_dirs_list, manifest)
+    if manifest is not None:
+        logger.info(f"Scan incrémental: {manifest.hits} dossiers inchangés, {manifest.misses} relistés")
+    if excluded_count:
         exclude_keywords = [kw.strip().lower() for kw in args.exclude.split(',') if kw.strip()]
-        if exclude_keywords:
-            original_count = len(files)
-            files = [
-                f for f in files
-                if not any(keyword in f.name.lower() for keyword in exclude_keywords)
-            ]
-            excluded_count = original_count - len(files)
-            if excluded_count:
-                console.print(f"[yellow]Exclusion: {excluded_count} fichiers ignorés (mots-clés: {', '.join(exclude_keywords)})[/yellow]")
-    
+        console.print(f"[yellow]Exclusion: {excluded_count} fichiers ignorés (mots-clés: {', '.join(exclude_keywords)})[/yellow]")
+
     console.print(f"Scan des fichiers…  {len(files)} trouvés")
     # If resuming, show how many will be skipped
     try:
@@ -278,127 +931,107 @@ def main() -> None:
     if args.dry_run:
         console.print("[bold yellow]Mode DRY-RUN: aucun ajout ne sera effectué[/bold yellow]")
 
-    added = skipped = not_found = ambiguous = duplicates = 0
-    # Simple in-run cache: normalized (title, artist) -> list[Candidate] without relying on previous scores
-    search_cache: dict[tuple[str, str], list] = {}
+    tag_cache = None if args.no_tag_cache else TagCache()
 
-    try:
-        for path in tqdm(files, desc="Analyse"):
-            key_cur = _norm_key(path)
-            if key_cur in processed_norm:
-                continue
-
-            lt = read_tags(path)
-            lt = infer_from_filename(path, lt)
+    pending_files = [
+        f for f in files if _norm_key(f) not in processed_norm and not (run.review is not None and f in run.review)
+    ]
+    seen_digests: Set[str] = set()
+    if args.cluster_duplicates and pending_files:
+        run.clusters = cluster_by_audio(
+            pending_files, progress=lambda it, total: tqdm(it, total=total, desc="Empreintes audio")
+        )
+        for f in pending_files:
+            digest = run.clusters.get(f)
+            if digest is not None and digest not in seen_digests:
+                seen_digests.add(digest)
+                run.cluster_reps.add(f)
+        n_groups = len(seen_digests)
+        if n_groups:
+            console.print(
+                f"Doublons audio: {len(run.clusters)} fichiers en {n_groups} groupes (une recherche par groupe)"
+            )
+    ahead = max(0, int(args.prefetch))
+    if args.album_mode or args.artist_prefetch:
+        # Grouping needs every tag up front
+        local_tracks = iter_local_tracks(pending_files, tag_cache=tag_cache, workers=max(0, int(args.tag_workers)))
+        tracks = list(tqdm(local_tracks, total=len(pending_files), desc="Tags"))
+        if args.album_mode:
+            resolve_albums(run, tracks)
+        if args.artist_prefetch:
+            prefetch_artists(run, tracks)
+        local_tracks = (t for t in tracks)
+    else:
+        local_tracks = lookahead_tracks(args, pending_files, tag_cache)
 
-            # Try advanced anime search FIRST if enabled (before normal search)
-            anime_enhanced = False
-            if args.advanced_search == "anime":
-                try:
-                    improved = enhance_from_filename_anime(path)
-                    if improved and (improved.get("title") or improved.get("artist")):
-                        logger.info(f"Anime metadata found: {improved.get('title')} by {improved.get('artist')}")
-                        # Build a transient LocalTrack-like context with improved metadata
-                        lt = LocalTrack(
-                            path=lt.path,
-                            title=improved.get("title") or lt.title,
-                            artist=improved.get("artist") or lt.artist,
-                            album=lt.album,
-                            duration_ms=lt.duration_ms,
-                            year=lt.year,
-                            isrc=lt.isrc,
-                            tracknumber=lt.tracknumber,
-                        )
-                        anime_enhanced = True
-                except Exception as e:
-                    logger.debug(f"Anime search failed: {e}")
-
-            # Build cache key on normalized title/artist
-            key = (strip_suffixes(lt.title or "").lower().strip(), remove_feat(lt.artist or "").lower().strip())
-            if key in search_cache and not anime_enhanced:
-                # Use cache only if we didn't enhance with anime data
-                cands = search_cache[key]
-                # Re-score for this local track context
-                for c in cands:
-                    c.score = score_candidate(lt, c)
-                cands = sorted(cands, key=lambda c: c.score, reverse=True)
-            else:
-                cands = search_candidates(sp, lt, args.market, limit=20)
-                if not anime_enhanced:
-                    search_cache[key] = cands[:]
-            
-            best_uri = None
-            best_score = None
-            if cands:
-                best_uri = cands[0].uri
-                best_score = cands[0].score
-            # If under auto-accept, show interactive
-            try:
-                best_uri = decide_with_auto_or_menu(
-                    cands,
-                    lt,
-                    float(args.auto_accept),
-                    args.dry_run,
-                    sp=sp,
-                    market=args.market,
-                    max_candidates=max(1, min(5, int(args.max_candidates))),
-                    local_path=str(path),
-                    auto_deny=float(args.auto_deny) if args.auto_deny is not None else None,
-                )
-                # Find track info for duplicate detection
-                track_info = None
-                if best_uri and cands:
-                    for c in cands:
-                        if c.uri == best_uri:
-                            best_score = c.score
-                            track_info = f'"{c.name}" — {", ".join(c.artists)}'
-                            break
-            except _UserQuit:
-                logger.info("Arrêt demandé par l'utilisateur. Sauvegarde de l'état.")
-                state.setdefault("processed", {})[key_cur] = {"uri": best_uri, "score": best_score}
-                _save_resume(args.resume, state)
-                return
-
-            status = decide_status(best_uri, existing, args.dry_run, ask_on_duplicate=True, track_info=track_info)
-            # Append path to per-status list file (once)
-            try:
-                if status in status_fhs:
-                    status_fhs[status].write(str(path) + "\n")
-            except Exception:
-                pass
+    def _prepare(item):
+        path, lt = item
+        if lt is None:
+            lt = load_local_track(path, tag_cache)
+        return lt, prepare_track(run, path, lt)
 
-            if status == ADDED or status == PLANNED_ADD:
-                to_add_batch.append(best_uri)  # type: ignore
-                existing.add(best_uri)  # type: ignore
-                added += 1
-                if len(to_add_batch) >= 100 and not args.dry_run:
-                    console.print("Ajout des 100 premiers titres…")
-                    add_tracks_batched(sp, pl.id, to_add_batch)
-                    to_add_batch.clear()
-            elif status == DUPLICATE:
-                duplicates += 1
-            elif status == NOT_FOUND:
-                not_found += 1
-            else:
-                skipped += 1
+    # With --search-workers N, up to N upcoming files are searched while the current one is decided;
+    # --prefetch N keeps the next N files resolved in the background (one thread unless --search-workers)
+    workers = max(1, int(args.search_workers))
+    window = max(workers if workers > 1 else 0, ahead + 1 if ahead else 0)
+    prepared_tracks = run.engine.run_ahead(_prepare, local_tracks, window=window, threads=workers)
 
-            log_and_append_summary(csv_path, json_path, path, lt, best_uri, status, best_score)
+    try:
+        for (path, _), (lt, prepared) in tqdm(prepared_tracks, total=len(pending_files), desc="Analyse"):
+            process_track(run, path, lt, prepared)
 
-            state.setdefault("processed", {})[key_cur] = {"uri": best_uri, "score": best_score}
-            _save_resume(args.resume, state)
+        flush_adds(run)
+        review_deferred(run)
 
-        if to_add_batch and not args.dry_run:
-            add_tracks_batched(sp, pl.id, to_add_batch)
-            to_add_batch.clear()
+        if args.watch:
+            if manifest is None:
+                logger.warning("--watch nécessite un scan récursif (incompatible avec --no-recursive).")
+            else:
+                known = {f: stat_key(f) for f in files}
+                watch_loop(run, exts, exclude_dirs_list, manifest, tag_cache, known)
+    except _UserQuit:
+        return
     finally:
+        # On quit, drop the look-ahead: nothing new is read or searched
+        run.engine.cancel()
+        prepared_tracks.close()
+        local_tracks.close()
+        run.engine.close()
+        # Decisions taken before a [q]uit or an error: check the pending URIs, send the last batch
+        try:
+            flush_adds(run)
+        except Exception as e:
+            logger.error(f"Envoi des derniers ajouts impossible: {e}")
+        c = run.counts
         # Print final totals
         console.print("\nRésumé:")
         console.print(
-            f" ADDED={added}  SKIPPED={skipped}  NOT_FOUND={not_found}  AMBIGUOUS={ambiguous}  DUPLICATE={duplicates}"
+            f" ADDED={c['added']}  SKIPPED={c['skipped']}  NOT_FOUND={c['not_found']}  AMBIGUOUS={c['ambiguous']}  DUPLICATE={c['duplicates']}"
         )
+        console.print(run.engine.stats.report())
+        api_calls.set_active(None)
+        show_api_calls(api_log)
+        api_log.close()
         console.print(f"Log: {log_path}")
         console.print(f"CSV: {csv_path}")
         console.print(f"JSON: {json_path}")
+        if response_cache is not None:
+            logger.info(f"Cache recherche: {response_cache.hits} hits, {response_cache.misses} appels réseau")
+            response_cache.close()
+        if catalog is not None:
+            logger.info(f"Catalogue local: {len(catalog)} titres")
+            catalog.close()
+        if market_stats is not None:
+            market_stats.save()
+        if playlist_cache is not None:
+            playlist_cache.close()
+        if tag_cache is not None:
+            logger.info(f"Cache tags: {tag_cache.hits} hits, {tag_cache.misses} lectures")
+            tag_cache.close()
+        if run.review is not None:
+            if len(run.review):
+                console.print(f"Revue: {len(run.review)} titres en attente — reprendre avec --review")
+            run.review.close()
         # Close any open status files
         try:
             for fh in status_fhs.values():
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import hashlib
+import struct
+from collections import defaultdict
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Audio payload hashing: byte-identical audio with different tags gives the same digest.
+# Each container parser yields the (start, end) byte ranges holding audio data only.
+
+_ASF_HEADER_GUID = bytes.fromhex("3026b2758e66cf11a6d900aa0062ce6c")
+_ASF_DATA_GUID = bytes.fromhex("3626b2758e66cf11a6d900aa0062ce6c")
+_CHUNK = 1 << 20
+# Payload bytes hashed by audio_signature to split files of the same payload size
+PREFIX_BYTES = 64 * 1024
+
+
+def _skip_id3v2(f: BinaryIO, pos: int) -> int:
+    # Several ID3v2 tags may be stacked at the start of the file
+    while True:
+        f.seek(pos)
+        head = f.read(10)
+        if len(head) < 10 or head[:3] != b"ID3":
+            return pos
+        size = (head[6] << 21) | (head[7] << 14) | (head[8] << 7) | head[9]
+        footer = 10 if head[5] & 0x10 else 0
+        pos += 10 + size + footer
+
+
+def _mpeg_ranges(f: BinaryIO, start: int, size: int) -> Iterator[Tuple[int, int]]:
+    # MP3/AAC (ADTS) and unknown formats: drop ID3v2 head, ID3v1 and APEv2 tails
+    end = size
+    if end - start >= 128:
+        f.seek(end - 128)
+        if f.read(3) == b"TAG":
+            end -= 128
+    if end - start >= 32:
+        f.seek(end - 32)
+        footer = f.read(32)
+        if footer[:8] == b"APETAGEX":
+            tag_size, flags = struct.unpack("<I4xI", footer[12:24])
+            end -= tag_size + (32 if flags & 0x80000000 else 0)
+    yield start, max(start, end)
+
+
+def _flac_ranges(f: BinaryIO, start: int, size: int) -> Iterator[Tuple[int, int]]:
+    pos = start + 4
+    while True:
+        f.seek(pos)
+        head = f.read(4)
+        if len(head) < 4:
+            return
+        pos += 4 + int.from_bytes(head[1:4], "big")
+        if head[0] & 0x80:
+            break
+    yield pos, size
+
+
+def _mp4_ranges(f: BinaryIO, start: int, size: int) -> Iterator[Tuple[int, int]]:
+    pos = start
+    while pos + 8 <= size:
+        f.seek(pos)
+        atom_size, kind = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if atom_size == 1:
+            atom_size = struct.unpack(">Q", f.read(8))[0]
+            header = 16
+        elif atom_size == 0:
+            atom_size = size - pos
+        if atom_size < header:
+            return
+        if kind == b"mdat":
+            yield pos + header, min(size, pos + atom_size)
+        pos += atom_size
+
+
+def _riff_ranges(f: BinaryIO, start: int, size: int, big_endian: bool, wanted: bytes) -> Iterator[Tuple[int, int]]:
+    # WAV ("data" chunk, little-endian) and AIFF ("SSND" chunk, big-endian)
+    fmt = ">4sI" if big_endian else "<4sI"
+    pos = start + 12
+    while pos + 8 <= size:
+        f.seek(pos)
+        kind, length = struct.unpack(fmt, f.read(8))
+        if kind == wanted:
+            yield pos + 8, min(size, pos + 8 + length)
+        pos += 8 + length + (length & 1)
+
+
+def _ogg_ranges(f: BinaryIO, start: int, size: int) -> Iterator[Tuple[int, int]]:
+    # Page bodies of audio pages only; header pages (granule position 0) carry the comments
+    pos = start
+    while pos + 27 <= size:
+        f.seek(pos)
+        head = f.read(27)
+        if head[:4] != b"OggS":
+            return
+        granule = struct.unpack("<q", head[6:14])[0]
+        nsegs = head[26]
+        lacing = f.read(nsegs)
+        body_start = pos + 27 + nsegs
+        body_end = body_start + sum(lacing)
+        if granule != 0:
+            yield body_start, min(size, body_end)
+        pos = body_end
+
+
+def _asf_ranges(f: BinaryIO, start: int, size: int) -> Iterator[Tuple[int, int]]:
+    pos = start
+    while pos + 24 <= size:
+        f.seek(pos)
+        guid = f.read(16)
+        obj_size = struct.unpack("<Q", f.read(8))[0]
+        if obj_size < 24:
+            return
+        if guid == _ASF_DATA_GUID:
+            yield pos + 24, min(size, pos + obj_size)
+            return
+        pos += obj_size
+
+
+def audio_payload_ranges(f: BinaryIO, size: int) -> List[Tuple[int, int]]:
+    """Return the byte ranges of the audio payload, excluding tag blocks."""
+    start = _skip_id3v2(f, 0)
+    f.seek(start)
+    magic = f.read(12)
+    if magic[:4] == b"fLaC":
+        return list(_flac_ranges(f, start, size))
+    if magic[:4] == b"OggS":
+        return list(_ogg_ranges(f, start, size))
+    if magic[:4] == b"RIFF" and magic[8:12] == b"WAVE":
+        return list(_riff_ranges(f, start, size, big_endian=False, wanted=b"data"))
+    if magic[:4] == b"FORM" and magic[8:12] in (b"AIFF", b"AIFC"):
+        return list(_riff_ranges(f, start, size, big_endian=True, wanted=b"SSND"))
+    if magic[4:8] == b"ftyp":
+        return list(_mp4_ranges(f, start, size))
+    f.seek(start)
+    if f.read(16) == _ASF_HEADER_GUID:
+        return list(_asf_ranges(f, start, size))
+    return list(_mpeg_ranges(f, start, size))
+
+
+def _payload(f: BinaryIO) -> List[Tuple[int, int]]:
+    size = f.seek(0, 2)
+    try:
+        ranges = audio_payload_ranges(f, size)
+    except (struct.error, OSError, ValueError):
+        ranges = []
+    # Unknown/garbled layout: fall back to the whole file
+    return ranges or [(0, size)]
+
+
+def _hash_ranges(f: BinaryIO, ranges: List[Tuple[int, int]], limit: Optional[int] = None) -> Tuple[str, int]:
+    """Digest of the bytes in ``ranges`` (the first ``limit`` only), and how many were read."""
+    h = hashlib.blake2b(digest_size=16)
+    hashed = 0
+    for start, end in ranges:
+        f.seek(start)
+        remaining = end - start if limit is None else min(end - start, limit - hashed)
+        while remaining > 0:
+            buf = f.read(min(_CHUNK, remaining))
+            if not buf:
+                break
+            h.update(buf)
+            remaining -= len(buf)
+            hashed += len(buf)
+        if limit is not None and hashed >= limit:
+            break
+    return h.hexdigest(), hashed
+
+
+def audio_hash(path: Path) -> Optional[str]:
+    """Digest of the audio payload of a file (tags excluded), or None if unreadable."""
+    try:
+        with open(path, "rb") as f:
+            digest, hashed = _hash_ranges(f, _payload(f))
+            # No audio bytes: nothing meaningful to compare
+            return digest if hashed else None
+    except OSError:
+        return None
+
+
+def audio_signature(path: Path) -> Optional[Tuple[int, str]]:
+    """(payload size, digest of its first PREFIX_BYTES): equal payloads have equal signatures.
+
+    Only the container headers and the start of the payload are read.
+    """
+    try:
+        with open(path, "rb") as f:
+            ranges = _payload(f)
+            size = sum(max(0, end - start) for start, end in ranges)
+            if not size:
+                return None
+            digest, hashed = _hash_ranges(f, ranges, limit=PREFIX_BYTES)
+            return (size, digest) if hashed else None
+    except OSError:
+        return None
+
+
+def cluster_by_audio(paths: Iterable[Path], workers: int = 4, progress=None) -> Dict[Path, str]:
+    """Hash files concurrently and return {path: digest} for clusters of 2+ files only.
+
+    Files are first bucketed by audio_signature; the full payload is only hashed
+    for files sharing a bucket, so a library of mostly unique files is not read in full.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = list(paths)
+    buckets: Dict[Tuple[int, str], List[Path]] = defaultdict(list)
+    groups: Dict[str, List[Path]] = defaultdict(list)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as ex:
+        signatures = ex.map(audio_signature, paths)
+        if progress is not None:
+            signatures = progress(signatures, total=len(paths))
+        for p, sig in zip(paths, signatures):
+            if sig:
+                buckets[sig].append(p)
+        candidates = [p for members in buckets.values() if len(members) > 1 for p in members]
+        for p, digest in zip(candidates, ex.map(audio_hash, candidates)):
+            if digest:
+                groups[digest].append(p)
+    return {p: digest for digest, members in groups.items() if len(members) > 1 for p in members}
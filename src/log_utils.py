@@ -76,6 +76,9 @@ def write_summary_row(csv_path: Path, json_path: Path, row: Dict[str, Any]) -> N
         "decision",
         "score",
         "uri",
+        "track_name",
+        "track_artists",
+        "track_duration_ms",
     ]
     _csv_write_header_if_empty(csv_path, fieldnames)
     # CSV
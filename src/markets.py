@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import unicodedata
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from .matcher import markets_for
+from .types import Candidate, LocalTrack
+from .utils import text_forms
+
+# Market scheduling: the fixed sweep [market, JP, US, global] is reordered per track.
+# Markets where the artist was found in earlier runs come first, then the markets
+# suggested by the scripts of the title/artist, then the sweep. A market that keeps
+# failing for an artist is only tried after the global pass, i.e. when nothing else
+# found the track; a hit there promotes it again.
+
+# Markets tried first for text written in a given script
+SCRIPT_MARKETS: Dict[str, Tuple[str, ...]] = {
+    "kana": ("JP",),
+    "han": ("JP", "TW"),
+    "hangul": ("KR",),
+    "cyrillic": ("UA",),
+    "greek": ("GR",),
+    "arabic": ("SA",),
+    "hebrew": ("IL",),
+    "thai": ("TH",),
+    "devanagari": ("IN",),
+}
+
+_SCRIPT_PREFIXES = {
+    "HIRAGANA": "kana",
+    "KATAKANA": "kana",
+    "CJK": "han",
+    "HANGUL": "hangul",
+    "LATIN": "latin",
+    "CYRILLIC": "cyrillic",
+    "GREEK": "greek",
+    "ARABIC": "arabic",
+    "HEBREW": "hebrew",
+    "THAI": "thai",
+    "DEVANAGARI": "devanagari",
+}
+
+GLOBAL = "*"  # key of the global pass (market=None) in the statistics file
+
+# Searches of an artist without any hit in a market before that market is tried last
+DEMOTE_AFTER_MISSES = 3
+
+
+def scripts_of(text: str) -> Set[str]:
+    """Unicode scripts of the letters of text ("latin", "kana", "han", "hangul", ...)."""
+    if text.isascii():
+        return {"latin"} if any(ch.isalpha() for ch in text) else set()
+    found: Set[str] = set()
+    for ch in text:
+        if not ch.isalpha():
+            continue
+        word = unicodedata.name(ch, "").split(" ", 1)[0]
+        script = _SCRIPT_PREFIXES.get(word)
+        if script is not None:
+            found.add(script)
+    return found
+
+
+def script_markets(lt: LocalTrack) -> List[str]:
+    """Markets suggested by the scripts of the title and artist, most specific first."""
+    scripts = scripts_of(f"{lt.title or ''} {lt.artist or ''}")
+    if "kana" in scripts:
+        scripts.discard("han")  # kanji next to kana: Japanese
+    markets: List[str] = []
+    for script in sorted(scripts):
+        markets.extend(SCRIPT_MARKETS.get(script, ()))
+    return list(dict.fromkeys(markets))
+
+
+class MarketStats:
+    """Per-artist hit counts by market, saved across runs (JSON).
+
+    For each artist (normalized name) and market: how many searches found the
+    accepted candidate there (hits), and how many searched it without finding
+    anything confident (misses). Safe to share between threads.
+    """
+
+    VERSION = 2
+
+    def __init__(self, path: Path | str = Path(".cache") / "market-stats.json"):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._artists: Dict[str, dict] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == self.VERSION:
+                self._artists = data.get("artists", {}) or {}
+        except Exception:
+            self._artists = {}
+
+    def __len__(self) -> int:
+        return len(self._artists)
+
+    @staticmethod
+    def key(lt: LocalTrack) -> str:
+        return text_forms(lt.artist or "").folded
+
+    def record(self, lt: LocalTrack, searched: Sequence[Optional[str]], hit: bool) -> None:
+        """Count one search of lt's artist over ``searched`` markets, in order.
+
+        With ``hit``, the last market found the accepted candidate and the others
+        are misses; otherwise every market is a miss.
+        """
+        key = self.key(lt)
+        if not key or not searched:
+            return
+        missed = searched[:-1] if hit else searched
+        with self._lock:
+            entry = self._artists.setdefault(key, {"hits": {}, "misses": {}})
+            if hit:
+                m = searched[-1] or GLOBAL
+                entry["hits"][m] = entry["hits"].get(m, 0) + 1
+            for market in missed:
+                m = market or GLOBAL
+                entry["misses"][m] = entry["misses"].get(m, 0) + 1
+            self._dirty = True
+
+    def counts(self, lt: LocalTrack) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """(hits, misses) by market for lt's artist."""
+        with self._lock:
+            entry = self._artists.get(self.key(lt), {})
+            return dict(entry.get("hits", {})), dict(entry.get("misses", {}))
+
+    def rows(self) -> List[Tuple[str, Dict[str, int], Dict[str, int]]]:
+        """(artist, hits by market, misses by market), most searched artists first."""
+        with self._lock:
+            items = [(k, dict(v.get("hits", {})), dict(v.get("misses", {}))) for k, v in self._artists.items()]
+        return sorted(items, key=lambda r: (-(sum(r[1].values()) + sum(r[2].values())), r[0]))
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(
+                json.dumps({"version": self.VERSION, "artists": self._artists}, ensure_ascii=False), encoding="utf-8"
+            )
+            os.replace(tmp, self.path)
+            self._dirty = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self._artists = {}
+            self._dirty = False
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class MarketScheduler:
+    """Order the markets searched for each local track.
+
+    Order: markets where the artist was found before (most hits first), markets
+    suggested by the scripts of the title/artist, then the fixed sweep (primary
+    market, JP, US, global). Every market of the sweep is kept: one that searched
+    this artist ``demote_after`` times without a hit is moved after the global
+    pass, so it is only reached when no other market found the track.
+    """
+
+    def __init__(
+        self, market: Optional[str], stats: Optional[MarketStats] = None, demote_after: int = DEMOTE_AFTER_MISSES
+    ):
+        self.market = market
+        self.stats = stats
+        self.demote_after = demote_after
+
+    def markets(self, lt: LocalTrack) -> List[Optional[str]]:
+        hits: Dict[str, int] = {}
+        misses: Dict[str, int] = {}
+        if self.stats is not None:
+            hits, misses = self.stats.counts(lt)
+        learned = [m for m in sorted(hits, key=lambda m: (-hits[m], m)) if m != GLOBAL]
+        order: List[Optional[str]] = list(dict.fromkeys([*learned, *script_markets(lt), *markets_for(self.market), None]))
+        failing = [
+            m
+            for m in order
+            if m not in (self.market, None) and not hits.get(m) and misses.get(m, 0) >= self.demote_after
+        ]
+        return [m for m in order if m not in failing] + failing
+
+    def record(
+        self, lt: LocalTrack, cands: Sequence[Candidate], threshold: float, markets: Sequence[Optional[str]]
+    ) -> None:
+        """Feed the outcome of a search over ``markets`` (as scheduled) back into the statistics."""
+        if self.stats is None:
+            return
+        best = cands[0] if cands else None
+        if best is not None and best.score >= threshold:
+            # Markets before the one that found it were searched without success
+            searched = list(markets[: markets.index(best.market) + 1]) if best.market in markets else [best.market]
+            self.stats.record(lt, searched, hit=True)
+        else:
+            self.stats.record(lt, list(markets), hit=False)
@@ -1,17 +1,23 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import re
+import threading
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from rapidfuzz import fuzz
 
+from . import api_calls
 from .types import Candidate, LocalTrack
 from .utils import (
     call_spotify_with_retries,
+    chunked,
     clamp,
     format_duration,
     normalize_str,
     remove_feat,
     strip_suffixes,
+    text_forms,
 )
 
 
@@ -36,13 +42,13 @@ def score_candidate(lt: LocalTrack, cand: Candidate) -> float:
     Bonuses: year +/-1 (+0.02), tracknumber exact (+0.02) or +/-1 (+0.01)
     """
     # Normalize strings and strip noisy suffixes
-    lt_title = strip_suffixes(lt.title or "")
-    lt_artist = remove_feat(lt.artist or "")
-    lt_album = strip_suffixes(lt.album or "")
+    lt_title = text_forms(lt.title or "").stripped
+    lt_artist = text_forms(lt.artist or "").defeat
+    lt_album = text_forms(lt.album or "").stripped
 
-    cand_title = strip_suffixes(cand.name)
+    cand_title = text_forms(cand.name or "").stripped
     cand_artist = _artist_join(cand.artists)
-    cand_album = strip_suffixes(cand.album)
+    cand_album = text_forms(cand.album or "").stripped
 
     t_score = fuzz.token_set_ratio(lt_title, cand_title) / 100.0 if lt_title and cand_title else 0.0
     a_score = fuzz.token_set_ratio(lt_artist, cand_artist) / 100.0 if lt_artist and cand_artist else 0.0
@@ -76,8 +82,143 @@ def score_candidate(lt: LocalTrack, cand: Candidate) -> float:
     return clamp(base + bonus, 0.0, 1.0)
 
 
-def _cand_from_item(item) -> Candidate:
-    artists = [a.get("name", "") for a in item.get("artists", [])]
+def _np():
+    """numpy + rapidfuzz.process, or None if numpy is not installed (loop fallback)."""
+    try:
+        import numpy as np  # type: ignore
+        from rapidfuzz import process  # type: ignore
+    except Exception:  # pragma: no cover
+        return None
+    return np, process
+
+
+class CandidatePool:
+    """Immutable set of candidates with their scoring features computed once.
+
+    Any number of local tracks can be scored against the pool; each call returns a
+    new score vector and never touches the candidates, so one pool (e.g. a cached
+    search result) can be shared between tracks and threads without copying.
+    Scores are the same as score_candidate(lt, cand).
+    """
+
+    __slots__ = ("cands", "_title", "_artist", "_album", "_title_ok", "_artist_ok", "_album_ok", "_ms", "_year", "_tn")
+
+    def __init__(self, cands: Sequence[Candidate]):
+        self.cands: Tuple[Candidate, ...] = tuple(cands)
+        self._title = [text_forms(c.name or "").stripped for c in self.cands]
+        self._artist = [_artist_join(c.artists) for c in self.cands]
+        self._album = [text_forms(c.album or "").stripped for c in self.cands]
+        mods = _np()
+        if mods is None:
+            return
+        np = mods[0]
+
+        def frozen(values, dtype):
+            arr = np.array(values, dtype=dtype)[None, :]
+            arr.setflags(write=False)
+            return arr
+
+        self._title_ok = frozen([bool(x) for x in self._title], bool)
+        self._artist_ok = frozen([bool(x) for x in self._artist], bool)
+        self._album_ok = frozen([bool(x) for x in self._album], bool)
+        self._ms = frozen([c.duration_ms or 0 for c in self.cands], np.float64)
+        self._year = frozen([c.release_year or 0 for c in self.cands], np.int64)
+        self._tn = frozen([c.track_number or 0 for c in self.cands], np.int64)
+
+    def __len__(self) -> int:
+        return len(self.cands)
+
+    def score_matrix(self, lts: Sequence[LocalTrack], workers: int = 1):
+        """Scores of every local track against the pool, shape (len(lts), len(pool)).
+
+        The title/artist/album similarities come from rapidfuzz.process.cdist.
+        Returns a list of lists when numpy is unavailable.
+        """
+        mods = _np()
+        if mods is None:
+            return [[score_candidate(lt, c) for c in self.cands] for lt in lts]
+        np, process = mods
+        if not lts or not self.cands:
+            return np.zeros((len(lts), len(self.cands)), dtype=np.float64)
+
+        lt_title = [text_forms(lt.title or "").stripped for lt in lts]
+        lt_artist = [text_forms(lt.artist or "").defeat for lt in lts]
+        lt_album = [text_forms(lt.album or "").stripped for lt in lts]
+
+        def sim(a: List[str], b: List[str], b_ok):
+            m = process.cdist(a, b, scorer=fuzz.token_set_ratio, dtype=np.float64, workers=workers) / 100.0
+            mask = np.array([bool(x) for x in a])[:, None] & b_ok
+            return np.where(mask, m, 0.0), mask
+
+        t, used_t = sim(lt_title, self._title, self._title_ok)
+        a, used_a = sim(lt_artist, self._artist, self._artist_ok)
+        al, mask_al = sim(lt_album, self._album, self._album_ok)
+        used_al = (al > 0) & mask_al
+
+        l_ms = np.array([lt.duration_ms or 0 for lt in lts], dtype=np.float64)[:, None]
+        used_d = (l_ms != 0) & (self._ms != 0)
+        delta = np.abs(l_ms - self._ms)
+        d = np.where(delta <= 3000, 1.0, np.clip(1.0 - (delta - 3000) / 27000.0, 0.0, 1.0))
+
+        # Same weights and summation order as score_candidate
+        wt_t, wt_a, wt_al, wt_d = 0.4, 0.4, 0.1, 0.1
+        num = (
+            np.where(used_t, wt_t * t, 0.0)
+            + np.where(used_a, wt_a * a, 0.0)
+            + np.where(used_al, wt_al * al, 0.0)
+            + np.where(used_d, wt_d * d, 0.0)
+        )
+        total_w = (
+            np.where(used_t, wt_t, 0.0)
+            + np.where(used_a, wt_a, 0.0)
+            + np.where(used_al, wt_al, 0.0)
+            + np.where(used_d, wt_d, 0.0)
+        )
+        base = num / np.where(total_w == 0, 1.0, total_w)
+
+        l_year = np.array([lt.year or 0 for lt in lts])[:, None]
+        year_ok = (l_year != 0) & (self._year != 0) & (np.abs(l_year - self._year) <= 1)
+        l_tn = np.array([lt.tracknumber or 0 for lt in lts])[:, None]
+        has_tn = (l_tn != 0) & (self._tn != 0)
+        tn_delta = np.abs(l_tn - self._tn)
+        bonus = np.where(year_ok, 0.02, 0.0) + np.where(
+            has_tn & (tn_delta == 0), 0.02, np.where(has_tn & (tn_delta == 1), 0.01, 0.0)
+        )
+        return np.clip(base + bonus, 0.0, 1.0)
+
+    def scores(self, lt: LocalTrack, workers: int = 1) -> List[float]:
+        """Score vector of lt against the pool, in pool order."""
+        if not self.cands:
+            return []
+        return [float(x) for x in self.score_matrix([lt], workers=workers)[0]]
+
+    def ranked(self, lt: LocalTrack, workers: int = 1) -> List[Candidate]:
+        """Scored copies of the candidates for lt, best first."""
+        ranked = [replace(c, score=sc) for c, sc in zip(self.cands, self.scores(lt, workers=workers))]
+        ranked.sort(key=lambda c: c.score, reverse=True)
+        return ranked
+
+
+def score_matrix(lts: Sequence[LocalTrack], cands: Sequence[Candidate], workers: int = 1):
+    """Scores of every local track against every candidate, shape (len(lts), len(cands)).
+
+    Same values as score_candidate(lt, cand); see CandidatePool.score_matrix.
+    """
+    return CandidatePool(cands).score_matrix(lts, workers=workers)
+
+
+def score_candidates(lt: LocalTrack, cands: Sequence[Candidate], workers: int = 1) -> List[float]:
+    """Batch version of score_candidate for one local track."""
+    return CandidatePool(cands).scores(lt, workers=workers)
+
+
+def rank_candidates(lt: LocalTrack, cands: Sequence[Candidate], workers: int = 1) -> List[Candidate]:
+    """Return copies of cands scored for lt, sorted by descending score."""
+    return CandidatePool(cands).ranked(lt, workers=workers)
+
+
+def _cand_from_item(item, market: Optional[str] = None, call_id: Optional[int] = None) -> Candidate:
+    artists = tuple(a.get("name", "") for a in item.get("artists", []))
     album = (item.get("album") or {}).get("name", "")
     duration_ms = int(item.get("duration_ms") or 0)
     release_date = (item.get("album") or {}).get("release_date")
@@ -102,42 +243,147 @@ def _cand_from_item(item) -> Candidate:
         score=0.0,
         release_year=release_year,
         track_number=track_number,
+        isrc=((item.get("external_ids") or {}).get("isrc") or "").upper() or None,
+        market=market,
+        call_id=call_id,
     )
 
 
-def search_candidates(sp, lt: LocalTrack, market: str, limit: int) -> List[Candidate]:
-    """Search Spotify for candidates using a strategy of queries, then score locally.
-    
-    Tries multiple markets (primary, JP, US, global) to find tracks not available in all regions.
+def _identity_keys(item) -> List[str]:
+    # Keys under which two search items are the same recording
+    keys = [f"id:{item.get('id')}"]
+    linked = (item.get("linked_from") or {}).get("id")
+    if linked:
+        keys.append(f"id:{linked}")
+    isrc = (item.get("external_ids") or {}).get("isrc")
+    if isrc:
+        keys.append(f"isrc:{isrc.upper()}")
+    return keys
+
+
+_Hit = Tuple[List[str], int, Candidate]  # (identity keys, market rank, candidate)
+
+
+def _hits(items, found_in: Optional[str], market: Optional[str], call_id: Optional[int] = None) -> List[_Hit]:
+    """Compact form of search items: only what deduplication and scoring need."""
+    return [
+        (_identity_keys(it), _market_rank(it, found_in, market), _cand_from_item(it, found_in, call_id))
+        for it in items
+        if it.get("id")
+    ]
+
+
+def _market_rank(item, found_in: Optional[str], market: Optional[str]) -> int:
+    """Lower is better: playable in the user's market > playable elsewhere > unknown/unplayable."""
+    playable = item.get("is_playable")
+    if found_in == market and playable is not False:
+        return 0
+    if playable:
+        return 1
+    return 2
+
+
+# Spotify's maximum page size for search: one call returns as many items as 2.5 calls at 20
+SEARCH_LIMIT = 50
+MAX_ITEMS = 50
+
+
+@dataclass
+class SearchStats:
+    """Per-run counters of the query planner (thread-safe)."""
+
+    naive: int = 0  # calls the unplanned sweep would have made (all variants x all markets)
+    executed: int = 0
+    deduped: int = 0  # saved by dropping identical query strings
+    early: int = 0  # saved by stopping on an ISRC hit / confident candidate / 50 items
+    early_stops: int = 0
+    collapsed: int = 0  # candidates merged into another one (same ISRC / relinked track)
+    offline: int = 0  # saved by tracks resolved from the local catalog
+    pruned: int = 0  # saved by skipping markets (MarketScheduler); negative if it added some
+    local_hits: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add(self, **counts: int) -> None:
+        with self._lock:
+            for k, v in counts.items():
+                setattr(self, k, getattr(self, k) + v)
+
+    @property
+    def saved(self) -> int:
+        return self.deduped + self.early + self.offline + self.pruned
+
+    def report(self) -> str:
+        pct = 100.0 * self.saved / self.naive if self.naive else 0.0
+        text = (
+            f"Requêtes de recherche: {self.executed} exécutées / {self.naive} sans planification "
+            f"({self.saved} économisées, {pct:.0f}% — doublons: {self.deduped}, arrêt anticipé: {self.early})"
+        )
+        if self.pruned:
+            text += f"; marchés écartés: {self.pruned} requêtes"
+        if self.local_hits:
+            text += f"; résolus hors ligne (catalogue local): {self.local_hits} titres, {self.offline} requêtes"
+        if self.collapsed:
+            text += f"; candidats fusionnés (ISRC/relink): {self.collapsed}"
+        return text
+
+
+def plan_queries(lt: LocalTrack) -> List[Tuple[str, str]]:
+    """(strategy, query) pairs tried for a local track, most precise first.
+
+    Identical query strings are only kept once (e.g. the "cleaned" variants of a
+    title that has no suffix and no feat.).
     """
-    queries: List[str] = []
+    queries: List[Tuple[str, str]] = []
     if lt.isrc:
-        queries.append(f"isrc:{lt.isrc}")
+        queries.append(("isrc", f"isrc:{lt.isrc}"))
 
-    title = strip_suffixes(lt.title or "")
-    artist = remove_feat(lt.artist or "")
+    title = text_forms(lt.title or "").stripped
+    artist = text_forms(lt.artist or "").defeat
 
     if title and artist:
         # Strategy 1: Structured queries with quotes (most precise)
-        queries.append(f'track:"{title}" artist:"{artist}"')
+        queries.append(("quoted", f'track:"{title}" artist:"{artist}"'))
         # Strategy 2: Simple combined search (like Spotify UI - often most effective)
-        queries.append(f"{title} {artist}")
+        queries.append(("plain", f"{title} {artist}"))
         # Strategy 3: Without quotes for more flexibility
-        queries.append(f"track:{title} artist:{artist}")
+        queries.append(("unquoted", f"track:{title} artist:{artist}"))
         # Strategy 4: Cleaned versions
-        queries.append(f"{strip_suffixes(title)} {artist}")
-        queries.append(f"{remove_feat(title)} {remove_feat(artist)}")
+        queries.append(("cleaned", f"{strip_suffixes(title)} {artist}"))
+        queries.append(("cleaned", f"{remove_feat(title)} {remove_feat(artist)}"))
     elif title:
-        queries.append(f'track:"{title}"')
-        queries.append(title)
+        queries.append(("quoted", f'track:"{title}"'))
+        queries.append(("plain", title))
     elif artist:
-        queries.append(f'artist:"{artist}"')
+        queries.append(("quoted", f'artist:"{artist}"'))
 
-    seen_ids = set()
-    items = []
-    
-    # Try multiple markets: primary market, then JP (for anime), US, and global
-    # This is crucial for finding region-locked content (e.g., Japanese anime songs)
+    seen = set()
+    planned: List[Tuple[str, str]] = []
+    for strategy, q in queries:
+        norm = " ".join(q.split()).casefold()
+        if norm in seen:
+            continue
+        seen.add(norm)
+        planned.append((strategy, q))
+    return planned
+
+
+def _naive_query_count(lt: LocalTrack) -> int:
+    # Number of variants the sweep used to send before planning
+    title = text_forms(lt.title or "").stripped
+    artist = text_forms(lt.artist or "").defeat
+    n = 1 if lt.isrc else 0
+    if title and artist:
+        return n + 5
+    if title:
+        return n + 2
+    return n + (1 if artist else 0)
+
+
+def markets_for(market: Optional[str]) -> List[Optional[str]]:
+    """Markets to sweep: primary market, then JP (for anime), US, and global.
+
+    This is crucial for finding region-locked content (e.g., Japanese anime songs).
+    """
     markets_to_try = [market]
     if market != "JP":
         markets_to_try.append("JP")
@@ -145,27 +391,213 @@ def search_candidates(sp, lt: LocalTrack, market: str, limit: int) -> List[Candi
         markets_to_try.append("US")
     if market is not None:
         markets_to_try.append(None)  # Global search
+    return markets_to_try
 
-    for current_market in markets_to_try:
-        for q in queries:
-            resp = call_spotify_with_retries(sp.search, q=q, type="track", market=current_market, limit=20)
-            tracks = (resp or {}).get("tracks", {})
-            for it in tracks.get("items", []):
-                tid = it.get("id")
-                if not tid or tid in seen_ids:
-                    continue
-                seen_ids.add(tid)
-                items.append(it)
-            if len(items) >= 50:  # Stop if we have enough candidates
+
+def _search_items(sp, q: str, market: Optional[str], limit: int = SEARCH_LIMIT) -> list:
+    resp = call_spotify_with_retries(sp.search, q=q, type="track", market=market, limit=limit)
+    return (resp or {}).get("tracks", {}).get("items", [])
+
+
+def _search_hits(
+    sp, q: str, found_in: Optional[str], market: Optional[str], catalog=None, strategy: Optional[str] = None
+) -> List[_Hit]:
+    # Raw response dicts die here: only compact candidates are kept (and queued in futures)
+    with api_calls.tagged(strategy):
+        items = _search_items(sp, q, found_in)
+    if catalog is not None:
+        catalog.add_items(items, found_in)
+    return _hits(items, found_in, market, api_calls.last_call_id())
+
+
+# sp.tracks accepts up to 50 ids per call; ids are 22 base62 characters
+TRACKS_BATCH = 50
+_track_id_re = re.compile(r"^[0-9A-Za-z]{22}$")
+# Track id in a pasted link: https://open.spotify.com/track/ID?si=..., spotify:track:ID
+_track_link_re = re.compile(r"(?:track[/:]|tracks/)([0-9A-Za-z]{22})(?![0-9A-Za-z])")
+
+
+def lookup_tracks(sp, uris: Sequence[str], market: Optional[str] = None) -> Dict[str, Optional[Candidate]]:
+    """Check track URIs with sp.tracks, TRACKS_BATCH per call.
+
+    Returns {uri: Candidate (name, artists, album, duration) or None if the track does not exist}.
+    Malformed URIs are rejected without any call.
+    """
+    found: Dict[str, Optional[Candidate]] = {}
+    ids: Dict[str, str] = {}
+    for uri in dict.fromkeys(uris):
+        tid = (uri or "").rsplit(":", 1)[-1]
+        if (uri or "").startswith("spotify:track:") and _track_id_re.match(tid):
+            ids[tid] = uri
+        else:
+            found[uri] = None
+    for batch in chunked(list(ids), TRACKS_BATCH):
+        resp = call_spotify_with_retries(sp.tracks, batch, market=market)
+        # One entry per requested id, in order; null for unknown ids
+        for tid, item in zip(batch, (resp or {}).get("tracks") or []):
+            found[ids[tid]] = _cand_from_item(item) if item else None
+    for uri in ids.values():
+        found.setdefault(uri, None)
+    return found
+
+
+class _RecordingSet:
+    """Candidates collected for one local track, one per recording.
+
+    The same recording comes back under several markets (relinked ids) or releases
+    (same ISRC): it is kept once, preferring the URI playable in the user's market,
+    and the other URIs go to ``Candidate.alternates``.
+    """
+
+    def __init__(self):
+        self.cands: List[Candidate] = []
+        self.collapsed = 0
+        self._seen_ids = set()
+        self._groups: Dict[str, int] = {}  # identity key -> position in cands
+        self._ranks: List[int] = []
+        self._alternates: List[List[Candidate]] = []
+
+    def add(self, hits: Sequence[_Hit]) -> List[int]:
+        """Merge search hits; return the positions of the candidates to (re)score."""
+        fresh: Dict[int, None] = {}  # positions, in order
+        for keys, rank, cand in hits:
+            if keys[0] in self._seen_ids:
+                continue  # same track id already seen (other query/market)
+            self._seen_ids.add(keys[0])
+            pos = next((self._groups[k] for k in keys if k in self._groups), None)
+            if pos is None:
+                pos = len(self.cands)
+                self.cands.append(cand)
+                self._ranks.append(rank)
+                self._alternates.append([])
+                fresh[pos] = None
+            else:
+                self.collapsed += 1
+                if rank < self._ranks[pos]:
+                    self._alternates[pos].insert(0, self.cands[pos])
+                    self.cands[pos], self._ranks[pos] = cand, rank
+                    fresh[pos] = None
+                else:
+                    self._alternates[pos].append(cand)
+            for k in keys:
+                self._groups.setdefault(k, pos)
+        return list(fresh)
+
+    def rescore(self, lt: LocalTrack, positions: Sequence[int]) -> List[float]:
+        scores = score_candidates(lt, [self.cands[p] for p in positions])
+        for p, sc in zip(positions, scores):
+            self.cands[p] = replace(self.cands[p], score=sc)
+        return scores
+
+    def result(self, limit: int) -> List[Candidate]:
+        """Best candidates first, with their alternates attached."""
+        order = sorted(range(len(self.cands)), key=lambda p: self.cands[p].score, reverse=True)[: max(limit, 1)]
+        return [
+            replace(self.cands[p], alternates=tuple(self._alternates[p])) if self._alternates[p] else self.cands[p]
+            for p in order
+        ]
+
+
+def search_candidates(
+    sp,
+    lt: LocalTrack,
+    market: str,
+    limit: int,
+    executor=None,
+    stop_score: Optional[float] = None,
+    stats: Optional[SearchStats] = None,
+    catalog=None,
+    markets: Optional[Sequence[Optional[str]]] = None,
+    cancelled: Optional[threading.Event] = None,
+) -> List[Candidate]:
+    """Search Spotify for candidates using a planned sequence of queries, scoring as results arrive.
+    
+    Tries multiple markets (primary, JP, US, global) to find tracks not available in all regions;
+    ``markets`` replaces that sweep (see MarketScheduler).
+    Results of the same recording (same ISRC, or relinked via linked_from) are collapsed
+    into one candidate whose URI is the one playable in ``market`` when available; the
+    others are kept in ``Candidate.alternates``.
+    With a TrackCatalog, tracks already seen in earlier responses are tried first and
+    the network is only used when none of them scores >= stop_score; every response
+    is added to the catalog.
+    Stops as soon as an ISRC query returns a hit, a candidate scores >= stop_score,
+    or 50 candidates have been collected.
+    With an executor, the queries of a market are sent concurrently; responses are
+    merged in query order so the result is the same as the serial path.
+    Once ``cancelled`` is set, no further query is sent (queued ones are cancelled)
+    and the candidates found so far are returned.
+    """
+    plan = plan_queries(lt)
+    sweep = markets_for(market)
+    markets = list(markets) if markets is not None else sweep
+    naive = _naive_query_count(lt) * len(sweep)
+
+    if catalog is not None and stop_score is not None:
+        local = _RecordingSet()
+        for it, found_in in catalog.lookup(lt.title, lt.artist, isrc=lt.isrc, limit=MAX_ITEMS):
+            local.add(_hits([it], found_in, market))
+        if max(local.rescore(lt, range(len(local.cands))), default=0.0) >= stop_score:
+            if stats is not None:
+                stats.add(
+                    naive=naive,
+                    deduped=(naive // len(sweep) - len(plan)) * len(sweep),
+                    offline=len(plan) * len(sweep),
+                    local_hits=1,
+                    collapsed=local.collapsed,
+                )
+            return local.result(limit)
+
+    found = _RecordingSet()
+    executed = 0
+    done = False
+
+    for current_market in markets:
+        if cancelled is not None and cancelled.is_set():
+            break
+        if executor is not None:
+            futures = [
+                executor.submit(_search_hits, sp, q, current_market, market, catalog, strategy) for strategy, q in plan
+            ]
+        else:
+            futures = []
+        consumed = 0
+        for i, (strategy, q) in enumerate(plan):
+            if cancelled is not None and cancelled.is_set():
+                break
+            if futures:
+                page = futures[i].result()
+            else:
+                page = _search_hits(sp, q, current_market, market, catalog, strategy)
+            consumed += 1
+            scores = found.rescore(lt, found.add(page))
+            if stop_score is not None and max(scores, default=0.0) >= stop_score:
+                done = True
+            if strategy == "isrc" and page:
+                done = True
+            if len(found.cands) >= MAX_ITEMS:  # Stop if we have enough candidates
+                done = True
+            if done:
                 break
-        if len(items) >= 50:
+        if futures:
+            # Calls already sent (or finished) could not be cancelled: they count as executed
+            executed += sum(1 for f in futures if not f.cancel())
+        else:
+            executed += consumed
+        if done:
             break
 
-    cands = [_cand_from_item(it) for it in items]
-    for c in cands:
-        c.score = score_candidate(lt, c)
-    cands.sort(key=lambda c: c.score, reverse=True)
-    return cands[: max(limit, 1)]
+    if stats is not None:
+        stats.add(
+            naive=naive,
+            executed=executed,
+            deduped=(naive // len(sweep) - len(plan)) * len(sweep),
+            early=len(plan) * len(markets) - executed,
+            pruned=len(plan) * (len(sweep) - len(markets)),
+            early_stops=1 if done else 0,
+            collapsed=found.collapsed,
+        )
+
+    return found.result(limit)
 
 
 class _UserQuit(Exception):
@@ -193,7 +625,7 @@ def _print_candidates(cands: List[Candidate], max_to_show: int = 5) -> None:
             c.album,
             format_duration(c.duration_ms),
             f"{c.score:.2f}",
-            c.uri,
+            c.uri + (f" (+{len(c.alternates)})" if c.alternates else ""),
         )
     console.print(table)
 
@@ -267,18 +699,25 @@ def decide_with_auto_or_menu(
             link = input("Collez le lien Spotify (ex: https://open.spotify.com/track/...): ").strip()
             if not link:
                 continue
-            # Extract track ID from various Spotify URL formats
-            import re
-            # Patterns: https://open.spotify.com/track/ID or spotify:track:ID
-            match = re.search(r'(?:track[/:]|tracks/)([a-zA-Z0-9]+)', link)
-            if match:
-                track_id = match.group(1)
-                track_uri = f"spotify:track:{track_id}"
-                print(f"✓ URI extrait: {track_uri}")
-                return track_uri
-            else:
+            match = _track_link_re.search(link)
+            if not match:
                 print("❌ Lien invalide. Format attendu: https://open.spotify.com/track/ID")
                 continue
+            track_uri = f"spotify:track:{match.group(1)}"
+            if sp is not None:
+                # Checked now, while a corrected link can still be pasted
+                try:
+                    track = lookup_tracks(sp, [track_uri], market=current_market).get(track_uri)
+                except Exception as e:
+                    print(f"❌ Vérification du lien impossible: {e}")
+                    continue
+                if track is None:
+                    print(f"❌ Titre introuvable sur Spotify: {track_uri}")
+                    continue
+                print(f"✓ {track.name} — {', '.join(track.artists)} ({track_uri})")
+            else:
+                print(f"✓ URI extrait: {track_uri}")
+            return track_uri
         if choice in {"c", "change", "market"}:
             # Change market dynamically
             print(f"Marché actuel: {current_market or 'FR'}")
@@ -317,10 +756,7 @@ def decide_with_auto_or_menu(
                 if len(items) >= 50:
                     break
             
-            cands = [_cand_from_item(it) for it in items]
-            for c in cands:
-                c.score = score_candidate(lt, c)
-            cands.sort(key=lambda c: c.score, reverse=True)
+            cands = rank_candidates(lt, [_cand_from_item(it) for it in items])
             _print_candidates(cands, max_to_show=max_candidates)
             continue
         if choice in {"a", "autre"}:
@@ -381,10 +817,7 @@ def decide_with_auto_or_menu(
                 if len(items) >= 50:
                     break
             
-            cands = [_cand_from_item(it) for it in items]
-            for c in cands:
-                c.score = score_candidate(lt, c)
-            cands.sort(key=lambda c: c.score, reverse=True)
+            cands = rank_candidates(lt, [_cand_from_item(it) for it in items])
             _print_candidates(cands, max_to_show=max_candidates)
             continue
         if choice.isdigit():
@@ -1,11 +1,39 @@
 from __future__ import annotations
 
+import functools
 import re
+from dataclasses import replace
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Tuple
 
 from .types import LocalTrack
-from .utils import remove_feat, strip_suffixes, safe_int
+from .utils import iter_ordered, remove_feat, strip_suffixes, safe_int, text_forms
+
+
+def _first(v):
+    """First value of a multi-valued tag, as a stripped string (or None)."""
+    if v is None:
+        return None
+    if isinstance(v, (list, tuple)):
+        if not v:
+            return None
+        v = v[0]
+    try:
+        s = str(v).strip()
+    except Exception:
+        return None
+    return s or None
+
+
+_year_re = re.compile(r"(\d{4})")
+
+
+def _year_of(v) -> Optional[int]:
+    s = _first(v)
+    if not s:
+        return None
+    m = _year_re.search(s)
+    return int(m.group(1)) if m else None
 
 
 def _extract_isrc_generic(tags) -> Optional[str]:
@@ -13,133 +41,165 @@ def _extract_isrc_generic(tags) -> Optional[str]:
         return None
     # Try common keys across formats
     for key in ("isrc", "TSRC", "TXXX:ISRC", "itunesisrc", "ISRC"):
-        v = tags.get(key)
-        if not v:
-            continue
-        if isinstance(v, (list, tuple)):
-            v = v[0]
-        try:
-            s = str(v)
-        except Exception:
-            continue
-        s = s.strip()
+        s = _first(tags.get(key))
         if s:
             return s
     return None
 
 
-def read_tags(path: Path) -> LocalTrack:
-    """Read tags via mutagen and return LocalTrack skeleton.
+def _id3_text(tags, key: str) -> Optional[str]:
+    frame = tags.get(key)
+    if frame is None:
+        return None
+    return _first(getattr(frame, "text", None))
 
-    Tries easy tags first; extracts title, artist, album, tracknumber, year/date,
-    duration_ms and ISRC if available.
-    """
-    # Lazy import mutagen to keep this module importable without the package
+
+def _extract_id3(tags) -> dict:
+    # MP3, AAC (ADTS), WAV and AIFF all expose ID3 frames
+    date = _id3_text(tags, "TDRC") or _id3_text(tags, "TYER")
+    return {
+        "title": _id3_text(tags, "TIT2"),
+        "artist": _id3_text(tags, "TPE1"),
+        "album": _id3_text(tags, "TALB"),
+        "tracknumber": safe_int(_id3_text(tags, "TRCK")),
+        "year": _year_of(date),
+        "isrc": _id3_text(tags, "TSRC") or _id3_text(tags, "TXXX:ISRC"),
+    }
+
+
+def _extract_vorbis(tags) -> dict:
+    # FLAC, Ogg Vorbis and Opus comments (case-insensitive keys)
+    return {
+        "title": _first(tags.get("title")),
+        "artist": _first(tags.get("artist")),
+        "album": _first(tags.get("album")),
+        "tracknumber": safe_int(_first(tags.get("tracknumber"))),
+        "year": _year_of(tags.get("date") or tags.get("year")),
+        "isrc": _first(tags.get("isrc")),
+    }
+
+
+def _mp4_freeform(v) -> Optional[str]:
+    if isinstance(v, (list, tuple)) and v:
+        v = v[0]
+    if isinstance(v, (bytes, bytearray)):
+        v = bytes(v).decode("utf-8", "replace")
+    return _first(v)
+
+
+def _extract_mp4(tags) -> dict:
+    # M4A / ALAC atoms
+    trkn = tags.get("trkn")
+    tracknumber = None
+    if trkn:
+        try:
+            tracknumber = int(trkn[0][0]) or None
+        except Exception:
+            tracknumber = None
+    return {
+        "title": _first(tags.get("©nam")),
+        "artist": _first(tags.get("©ART")) or _first(tags.get("aART")),
+        "album": _first(tags.get("©alb")),
+        "tracknumber": tracknumber,
+        "year": _year_of(tags.get("©day")),
+        "isrc": _mp4_freeform(tags.get("----:com.apple.iTunes:ISRC")),
+    }
+
+
+def _extract_asf(tags) -> dict:
+    # WMA attributes
+    return {
+        "title": _first(tags.get("Title")),
+        "artist": _first(tags.get("Author")) or _first(tags.get("WM/AlbumArtist")),
+        "album": _first(tags.get("WM/AlbumTitle")),
+        "tracknumber": safe_int(_first(tags.get("WM/TrackNumber"))),
+        "year": _year_of(tags.get("WM/Year")),
+        "isrc": _first(tags.get("WM/ISRC")),
+    }
+
+
+def _extract_generic(tags) -> dict:
+    # APEv2 and any other dict-like tag container
+    artist = None
+    for key in ("artist", "TPE1", "©ART", "ARTIST", "Artist"):
+        artist = _first(tags.get(key))
+        if artist:
+            break
+    return {
+        "title": _first(tags.get("title") or tags.get("Title")),
+        "artist": artist,
+        "album": _first(tags.get("album") or tags.get("Album")),
+        "tracknumber": safe_int(_first(tags.get("tracknumber") or tags.get("Track"))),
+        "year": _year_of(tags.get("date") or tags.get("year") or tags.get("Year")),
+        "isrc": _extract_isrc_generic(tags),
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _mutagen():
+    """Import mutagen once; returns (File, {tag class: extractor}) or (None, {})."""
     try:
         from mutagen import File as MutagenFile  # type: ignore
-        from mutagen.id3 import ID3, TSRC  # type: ignore
+        from mutagen._vorbis import VComment  # type: ignore
+        from mutagen.asf import ASFTags  # type: ignore
+        from mutagen.id3 import ID3Tags  # type: ignore
+        from mutagen.mp4 import MP4Tags  # type: ignore
     except Exception:  # pragma: no cover
-        MutagenFile = None  # type: ignore
-        ID3 = None  # type: ignore
-        TSRC = None  # type: ignore
+        return None, {}
+    return MutagenFile, {
+        ID3Tags: _extract_id3,
+        VComment: _extract_vorbis,
+        MP4Tags: _extract_mp4,
+        ASFTags: _extract_asf,
+    }
+
+
+def extract_fields(tags) -> dict:
+    """Read title/artist/album/tracknumber/year/isrc from a mutagen tag container in one pass."""
+    if not tags:
+        return {}
+    _, extractors = _mutagen()
+    extractor = _extract_generic
+    for cls in type(tags).__mro__:
+        if cls in extractors:
+            extractor = extractors[cls]
+            break
+    try:
+        return extractor(tags)
+    except Exception:
+        return {}
+
+
+def read_tags(path: Path) -> LocalTrack:
+    """Read tags via mutagen and return LocalTrack skeleton.
 
+    The file is opened and parsed once; a per-format extractor (ID3, Vorbis/FLAC,
+    MP4, ASF, generic) reads title, artist, album, tracknumber, year/date and ISRC,
+    and duration_ms comes from the stream info.
+    """
+    MutagenFile, _ = _mutagen()
     audio = MutagenFile(path) if MutagenFile else None
-    title = artist = album = None
     duration_ms = None
-    year = None
-    isrc = None
-    tracknum = None
+    fields: dict = {}
 
     if audio is not None:
-        # duration
-        try:
-            if getattr(audio, "info", None) and getattr(audio.info, "length", None):
-                duration_ms = int(audio.info.length * 1000)
-        except Exception:
-            pass
-
-        tags = getattr(audio, "tags", None)
-        # Try easy-like and multiple tag formats
-        try:
-            title = (
-                (tags.get("title")[0] if isinstance(tags.get("title"), list) else tags.get("title"))
-                if tags and tags.get("title")
-                else None
-            )
-        except Exception:
-            pass
-        try:
-            # Try multiple artist tag formats (artist, TPE1, ©ART, etc.)
-            artist = None
-            for key in ("artist", "TPE1", "©ART", "ARTIST"):
-                if tags and tags.get(key):
-                    val = tags.get(key)
-                    artist = val[0] if isinstance(val, list) else val
-                    # Convert to string if it's a tag object
-                    if artist:
-                        artist = str(artist) if not isinstance(artist, str) else artist
-                        break
-        except Exception:
-            pass
-        try:
-            album = (
-                (tags.get("album")[0] if isinstance(tags.get("album"), list) else tags.get("album"))
-                if tags and tags.get("album")
-                else None
-            )
-        except Exception:
-            pass
-        try:
-            tn = (
-                (tags.get("tracknumber")[0] if isinstance(tags.get("tracknumber"), list) else tags.get("tracknumber"))
-                if tags and tags.get("tracknumber")
-                else None
-            )
-            tracknum = safe_int(tn)
-        except Exception:
-            pass
-        # Year/date
-        try:
-            y = None
-            for k in ("date", "year"):  # many formats
-                v = tags.get(k) if tags else None
-                if v:
-                    if isinstance(v, list):
-                        v = v[0]
-                    y = str(v)
-                    break
-            if y:
-                y = re.findall(r"(\d{4})", y)
-                if y:
-                    year = int(y[0])
-        except Exception:
-            pass
-
-        # ISRC generic
         try:
-            isrc = _extract_isrc_generic(tags)
+            length = audio.info.length
+            if length:
+                duration_ms = int(length * 1000)
         except Exception:
             pass
-
-        # Specific ID3 TSRC frame for MP3
-        if isrc is None and ID3 and TSRC:
-            try:
-                id3 = ID3(path)
-                frame = id3.get("TSRC")
-                if frame and isinstance(frame, TSRC):
-                    isrc = str(frame.text[0]) if frame.text else None
-            except Exception:
-                pass
+        fields = extract_fields(getattr(audio, "tags", None))
 
     return LocalTrack(
         path=path,
-        title=title.strip() if isinstance(title, str) else title,
-        artist=artist.strip() if isinstance(artist, str) else artist,
-        album=album.strip() if isinstance(album, str) else album,
+        title=fields.get("title"),
+        artist=fields.get("artist"),
+        album=fields.get("album"),
         duration_ms=duration_ms,
-        year=year,
-        isrc=isrc,
-        tracknumber=tracknum,
+        year=fields.get("year"),
+        isrc=fields.get("isrc"),
+        tracknumber=fields.get("tracknumber"),
     )
 
 
@@ -160,43 +220,78 @@ def infer_from_filename(path: Path, lt: LocalTrack) -> LocalTrack:
 
     if lt.title and lt.artist:
         # Already present, still normalize title by stripping suffixes
-        return LocalTrack(
-            path=lt.path,
-            title=strip_suffixes(lt.title),
-            artist=lt.artist,
-            album=lt.album,
-            duration_ms=lt.duration_ms,
-            year=lt.year,
-            isrc=lt.isrc,
-            tracknumber=lt.tracknumber,
-        )
+        return replace(lt, title=strip_suffixes(lt.title))
 
     parts = _artist_title_sep.split(cleaned)
     if len(parts) >= 2:
         artist = parts[0].strip()
         title = "-".join(parts[1:]).strip()
         artist = remove_feat(artist)
-        title = remove_feat(strip_suffixes(title))
-        return LocalTrack(
-            path=lt.path,
-            title=lt.title or title,
-            artist=lt.artist or artist,
-            album=lt.album,
-            duration_ms=lt.duration_ms,
-            year=lt.year,
-            isrc=lt.isrc,
-            tracknumber=lt.tracknumber,
-        )
+        title = text_forms(title).clean
+        return replace(lt, title=lt.title or title, artist=lt.artist or artist)
 
     # If unable to split, fall back to stem as title
-    title = remove_feat(strip_suffixes(cleaned))
-    return LocalTrack(
-        path=lt.path,
-        title=lt.title or title,
-        artist=lt.artist,
-        album=lt.album,
-        duration_ms=lt.duration_ms,
-        year=lt.year,
-        isrc=lt.isrc,
-        tracknumber=lt.tracknumber,
-    )
+    title = text_forms(cleaned).clean
+    return replace(lt, title=lt.title or title)
+
+
+def _load_local_track(item) -> Tuple[Optional[LocalTrack], LocalTrack]:
+    """Worker: read tags (unless already cached) and apply the filename fallback.
+
+    item is (path, cached LocalTrack or None, stat key). Returns (raw tags to store
+    in the cache or None, finished LocalTrack).
+    """
+    path, cached, _ = item
+    raw = None
+    if cached is None:
+        raw = read_tags(path)
+    return raw, infer_from_filename(path, cached or raw)
+
+
+def load_local_track(path: Path, tag_cache=None) -> LocalTrack:
+    """Read one file like iter_local_tracks (tag cache, tags, filename fallback)."""
+    cached, sk = tag_cache.lookup(path) if tag_cache is not None else (None, None)
+    raw, lt = _load_local_track((path, cached, sk))
+    if raw is not None and tag_cache is not None:
+        tag_cache.store(path, sk, raw)
+    return lt
+
+
+def iter_local_tracks(
+    paths: Iterable[Path],
+    tag_cache=None,
+    workers: int = 0,
+    window: int = 0,
+) -> Iterator[Tuple[Path, LocalTrack]]:
+    """Yield (path, LocalTrack) in input order.
+
+    With workers > 1, read_tags/infer_from_filename run in a process pool; at most
+    ``window`` files (default 4 * workers) are in flight. Cache lookups and writes
+    stay in the calling process.
+    """
+
+    def _items():
+        for path in paths:
+            cached, sk = tag_cache.lookup(path) if tag_cache is not None else (None, None)
+            yield path, cached, sk
+
+    def _finish(item, result):
+        path, _, sk = item
+        raw, lt = result
+        if raw is not None and tag_cache is not None:
+            tag_cache.store(path, sk, raw)
+        return path, lt
+
+    if workers <= 1:
+        for item in _items():
+            yield _finish(item, _load_local_track(item))
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        for item, result in iter_ordered(executor, _load_local_track, _items(), window or 4 * workers):
+            yield _finish(item, result)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -2,17 +2,25 @@ from __future__ import annotations
 
 import logging
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Sequence, Set
 
 from rich.console import Console
 from rich.table import Table
 
+from .playlist_cache import PlaylistCache
 from .types import PlaylistInfo
-from .utils import brief_id, chunked
+from .utils import brief_id, call_spotify_with_retries, chunked
 
 console = Console()
 
+# Only the URIs are read: the rest of each track object is not downloaded
+PLAYLIST_ITEMS_FIELDS = "items(track(uri)),total"
+PLAYLIST_PAGE_SIZE = 100
+PLAYLIST_PAGE_WORKERS = 4
+
 
 def ensure_playlist_create(
     sp,
@@ -72,40 +80,95 @@ def ensure_playlist_create(
     )
 
 
-def list_user_playlists(sp, page_size: int = 50) -> List[PlaylistInfo]:
-    items: List[PlaylistInfo] = []
-    offset = 0
-    while True:
-        resp = sp.current_user_playlists(limit=page_size, offset=offset)
-        for it in resp.get("items", []):
-            owner = it.get("owner", {})
-            items.append(
-                PlaylistInfo(
-                    id=it["id"],
-                    name=it["name"],
-                    owner_id=owner.get("id", ""),
-                    owner_name=owner.get("display_name") or owner.get("id", ""),
-                    public=bool(it.get("public")),
-                    collaborative=bool(it.get("collaborative")),
-                    tracks_total=(it.get("tracks") or {}).get("total", 0),
-                )
-            )
-        if resp.get("next"):
-            offset += page_size
-        else:
-            break
+def _playlist_info(it: dict) -> PlaylistInfo:
+    owner = it.get("owner", {})
+    return PlaylistInfo(
+        id=it["id"],
+        name=it["name"],
+        owner_id=owner.get("id", ""),
+        owner_name=owner.get("display_name") or owner.get("id", ""),
+        public=bool(it.get("public")),
+        collaborative=bool(it.get("collaborative")),
+        tracks_total=(it.get("tracks") or {}).get("total", 0),
+    )
+
+
+def list_user_playlists(
+    sp,
+    page_size: int = 50,
+    workers: int = PLAYLIST_PAGE_WORKERS,
+    cache: Optional[PlaylistCache] = None,
+    user_id: Optional[str] = None,
+) -> List[PlaylistInfo]:
+    """Playlists of the current user, in Spotify's order.
+
+    With a PlaylistCache (and the user's id), a listing younger than its TTL is
+    reused. Otherwise the first page gives ``total`` and the other pages are
+    fetched concurrently under the shared RateGate.
+    """
+    if cache is not None and user_id:
+        cached = cache.get_listing(user_id)
+        if cached is not None:
+            return cached
+
+    def page(offset: int) -> dict:
+        return call_spotify_with_retries(sp.current_user_playlists, limit=page_size, offset=offset) or {}
+
+    first = page(0)
+    pages = [first]
+    offsets = range(page_size, int(first.get("total") or 0), page_size)
+    if offsets:
+        with ThreadPoolExecutor(max(1, min(workers, len(offsets))), thread_name_prefix="playlists") as ex:
+            pages.extend(ex.map(page, offsets))
+    items = [_playlist_info(it) for p in pages for it in p.get("items", []) if it]
+    if cache is not None and user_id:
+        cache.put_listing(user_id, items)
     return items
 
 
+class PlaylistIndex:
+    """N-gram index of playlist names for the selection menu filter.
+
+    Same results as a case-insensitive substring match on the names, without
+    scanning every name: the posting lists of the query's n-grams (up to
+    ``GRAM`` characters) are intersected, then the few survivors are checked.
+    """
+
+    GRAM = 3
+
+    def __init__(self, playlists: Sequence[PlaylistInfo]):
+        self.playlists = list(playlists)
+        self._names = [p.name.lower() for p in self.playlists]
+        self._grams: Dict[str, List[int]] = defaultdict(list)
+        for i, name in enumerate(self._names):
+            grams = {name[j : j + n] for n in range(1, self.GRAM + 1) for j in range(len(name) - n + 1)}
+            for g in grams:
+                self._grams[g].append(i)
+
+    def search(self, query: str) -> List[PlaylistInfo]:
+        q = query.strip().lower()
+        if not q:
+            return list(self.playlists)
+        n = min(len(q), self.GRAM)
+        postings = sorted((self._grams.get(q[j : j + n], []) for j in range(len(q) - n + 1)), key=len)
+        hits = set(postings[0])
+        for posting in postings[1:]:
+            hits.intersection_update(posting)
+            if not hits:
+                break
+        return [self.playlists[i] for i in sorted(hits) if q in self._names[i]]
+
+
 def safe_select_playlist_interactive(playlists: List[PlaylistInfo]) -> Optional[PlaylistInfo]:
     filtered = playlists
+    index = PlaylistIndex(playlists)
     page = 0
     page_size = 10
 
     while True:
         filt = input("Filtre (laisser vide pour tout) : ").strip().lower()
         if filt:
-            filtered = [p for p in playlists if filt in p.name.lower()]
+            filtered = index.search(filt)
         else:
             filtered = playlists
         if not filtered:
@@ -174,39 +237,55 @@ def ensure_rights_or_fail(sp, pl: PlaylistInfo) -> None:
         )
 
 
-def get_playlist_track_uris(sp, playlist_id: str) -> Set[str]:
+def _playlist_page(sp, playlist_id: str, offset: int) -> dict:
+    return call_spotify_with_retries(
+        sp.playlist_items, playlist_id, fields=PLAYLIST_ITEMS_FIELDS, limit=PLAYLIST_PAGE_SIZE, offset=offset
+    ) or {}
+
+
+def get_playlist_track_uris(
+    sp, playlist_id: str, workers: int = PLAYLIST_PAGE_WORKERS, cache: Optional[PlaylistCache] = None
+) -> Set[str]:
+    """URIs of every track of a playlist.
+
+    With a PlaylistCache, one ``playlist(fields="snapshot_id")`` call decides whether
+    the stored set is still valid. Otherwise the first page gives ``total`` and the
+    other pages are fetched concurrently (``workers`` threads, 429s paused for every
+    thread by the shared RateGate).
+    """
+    snapshot_id = None
+    if cache is not None:
+        snapshot_id = (call_spotify_with_retries(sp.playlist, playlist_id, fields="snapshot_id") or {}).get(
+            "snapshot_id"
+        )
+        cached = cache.get(playlist_id, snapshot_id)
+        if cached is not None:
+            return cached
+    first = _playlist_page(sp, playlist_id, 0)
+    pages = [first]
+    offsets = range(PLAYLIST_PAGE_SIZE, int(first.get("total") or 0), PLAYLIST_PAGE_SIZE)
+    if offsets:
+        with ThreadPoolExecutor(max(1, min(workers, len(offsets))), thread_name_prefix="playlist") as ex:
+            pages.extend(ex.map(lambda off: _playlist_page(sp, playlist_id, off), offsets))
     uris: Set[str] = set()
-    limit = 100
-    offset = 0
-    while True:
-        try:
-            resp = sp.playlist_items(playlist_id, fields=None, limit=limit, offset=offset)
-        except Exception as e:
-            status = getattr(e, "http_status", None)
-            if status == 429:
-                ra = int(getattr(e, "headers", {}).get("Retry-After", 1))
-                time.sleep(ra + 1)
-                continue
-            else:
-                raise
-        items = resp.get("items", [])
-        for it in items:
-            track = it.get("track") or {}
-            uri = track.get("uri")
+    for page in pages:
+        for it in page.get("items", []):
+            uri = (it.get("track") or {}).get("uri")
             if uri:
                 uris.add(uri)
-        if resp.get("next"):
-            offset += limit
-        else:
-            break
+    if cache is not None:
+        # Snapshot read before the pages: a concurrent change only costs a refetch next time
+        cache.put(playlist_id, snapshot_id, uris)
     return uris
 
 
-def add_tracks_batched(sp, playlist_id: str, uris: List[str]) -> None:
+def add_tracks_batched(sp, playlist_id: str, uris: List[str], cache: Optional[PlaylistCache] = None) -> None:
     for batch in chunked(uris, 100):
         while True:
             try:
-                sp.playlist_add_items(playlist_id, batch)
+                resp = sp.playlist_add_items(playlist_id, batch)
+                if cache is not None:
+                    cache.add(playlist_id, (resp or {}).get("snapshot_id"), batch)
                 break
             except Exception as e:
                 status = getattr(e, "http_status", None)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import asdict
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Set
+
+from .types import PlaylistInfo
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS playlists (
+    id TEXT PRIMARY KEY,
+    snapshot_id TEXT NOT NULL,
+    uris BLOB NOT NULL,
+    updated REAL NOT NULL
+)
+"""
+_LISTINGS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    user_id TEXT PRIMARY KEY,
+    playlists BLOB NOT NULL,
+    fetched REAL NOT NULL
+)
+"""
+
+# The listing has no snapshot id: it is only trusted for a short time
+LISTING_TTL_SECONDS = 600
+
+
+def _pack(uris: Iterable[str]) -> bytes:
+    return zlib.compress(json.dumps(sorted(uris), separators=(",", ":")).encode("utf-8"))
+
+
+def _unpack(blob: bytes) -> Set[str]:
+    return set(json.loads(zlib.decompress(blob).decode("utf-8")))
+
+
+class PlaylistCache:
+    """Persistent URI set of each playlist, keyed by its ``snapshot_id`` (SQLite).
+
+    ``get`` only returns the cached set when the snapshot given by Spotify is the
+    one stored with it; ``add`` updates the set after our own additions, using the
+    snapshot id returned by ``playlist_add_items``. The user's playlist listing is
+    kept too, for ``listing_ttl`` seconds. Safe to share between threads.
+    """
+
+    def __init__(
+        self, db_path: Path | str = Path(".cache") / "playlists.sqlite", listing_ttl: float = LISTING_TTL_SECONDS
+    ):
+        self.db_path = Path(db_path)
+        self.listing_ttl = listing_ttl
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute(_LISTINGS_SCHEMA)
+        self._conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, playlist_id: str, snapshot_id: Optional[str]) -> Optional[Set[str]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT snapshot_id, uris FROM playlists WHERE id = ?", (playlist_id,)
+            ).fetchone()
+            if row is None or not snapshot_id or row[0] != snapshot_id:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return _unpack(row[1])
+
+    def put(self, playlist_id: str, snapshot_id: Optional[str], uris: Iterable[str]) -> None:
+        if not snapshot_id:
+            return
+        blob = _pack(uris)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO playlists (id, snapshot_id, uris, updated) VALUES (?, ?, ?, ?)",
+                (playlist_id, snapshot_id, blob, time.time()),
+            )
+            self._conn.commit()
+
+    def add(self, playlist_id: str, snapshot_id: Optional[str], uris: Iterable[str]) -> None:
+        """Record URIs we just added; ``snapshot_id`` is the one returned by Spotify."""
+        with self._lock:
+            # Track counts shown in the listing are now stale
+            self._conn.execute("DELETE FROM listings")
+            row = self._conn.execute("SELECT uris FROM playlists WHERE id = ?", (playlist_id,)).fetchone()
+            if row is not None and not snapshot_id:
+                # Unknown new snapshot: the entry can no longer be trusted
+                self._conn.execute("DELETE FROM playlists WHERE id = ?", (playlist_id,))
+            elif row is not None:
+                current = _unpack(row[0])
+                current.update(uris)
+                self._conn.execute(
+                    "UPDATE playlists SET snapshot_id = ?, uris = ?, updated = ? WHERE id = ?",
+                    (snapshot_id, _pack(current), time.time(), playlist_id),
+                )
+            self._conn.commit()
+
+    def get_listing(self, user_id: str) -> Optional[List[PlaylistInfo]]:
+        """The user's playlists as listed less than ``listing_ttl`` seconds ago, else None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT playlists, fetched FROM listings WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.listing_ttl:
+            return None
+        return [PlaylistInfo(**d) for d in json.loads(zlib.decompress(row[0]).decode("utf-8"))]
+
+    def put_listing(self, user_id: str, playlists: Sequence[PlaylistInfo]) -> None:
+        blob = zlib.compress(json.dumps([asdict(p) for p in playlists], ensure_ascii=False).encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO listings (user_id, playlists, fetched) VALUES (?, ?, ?)",
+                (user_id, blob, time.time()),
+            )
+            self._conn.commit()
+
+    def drop_listing(self, user_id: str) -> None:
+        """Forget the listing (e.g. after creating a playlist)."""
+        with self._lock:
+            self._conn.execute("DELETE FROM listings WHERE user_id = ?", (user_id,))
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
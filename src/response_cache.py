@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Optional
+
+from . import api_calls
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_access REAL NOT NULL
+)
+"""
+
+
+def normalize_query(q: str) -> str:
+    # Spotify search is case-insensitive and ignores repeated whitespace
+    return " ".join((q or "").split()).casefold()
+
+
+class SearchResponseCache:
+    """Persistent cache of raw ``sp.search`` responses (SQLite, zlib-compressed JSON).
+
+    Keyed by normalized (query, market, type, limit, offset). Entries older than
+    ``ttl_seconds`` are ignored; when the stored size exceeds ``max_bytes`` the least
+    recently used entries are evicted. Safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        db_path: Path | str = Path(".cache") / "search.sqlite",
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_bytes: int = 200 * 1024 * 1024,
+    ):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses(last_access)")
+        self._conn.commit()
+        self._total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(q: str, market: Optional[str], type: str, limit: int, offset: int = 0) -> str:
+        raw = json.dumps([normalize_query(q), (market or "").upper(), type, int(limit), int(offset)])
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, size, created FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            if now - row[2] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self._total -= row[1]
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+
+    def put(self, key: str, value: Any) -> None:
+        blob = zlib.compress(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 6)
+        now = time.time()
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created, last_access) VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now, now),
+            )
+            self._total += len(blob) - (old[0] if old else 0)
+            if self._total > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        # Drop least recently used entries down to 90% of the budget
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC").fetchall()
+        doomed = []
+        for key, size in rows:
+            if self._total <= target:
+                break
+            doomed.append((key,))
+            self._total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+
+class CachedSearchClient:
+    """Spotify client proxy whose ``search`` goes through a SearchResponseCache.
+
+    Every other attribute is delegated to the wrapped client.
+    """
+
+    def __init__(self, sp, cache: SearchResponseCache):
+        self._sp = sp
+        self.cache = cache
+
+    def search(self, q, limit=10, offset=0, type="track", market=None):
+        key = self.cache.make_key(q, market, type, limit, offset)
+        resp = self.cache.get(key)
+        if resp is not None:
+            api_calls.note_cached()
+            return resp
+        resp = self._sp.search(q=q, limit=limit, offset=offset, type=type, market=market)
+        if resp is not None:
+            self.cache.put(key, resp)
+        return resp
+
+    def __getattr__(self, name):
+        return getattr(self._sp, name)
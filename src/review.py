@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from .types import Candidate, LocalTrack
+
+
+def _track_to_json(lt: LocalTrack) -> dict:
+    d = asdict(lt)
+    d["path"] = str(lt.path)
+    return d
+
+
+def _track_from_json(d: dict) -> LocalTrack:
+    return LocalTrack(**{**d, "path": Path(d["path"])})
+
+
+def _cand_to_json(c: Candidate) -> dict:
+    d = asdict(c)
+    d.pop("call_id", None)  # only meaningful within the run that made the call
+    d["alternates"] = [_cand_to_json(a) for a in c.alternates]
+    return d
+
+
+def _cand_from_json(d: dict) -> Candidate:
+    return Candidate(
+        **{
+            **d,
+            "artists": tuple(d.get("artists") or ()),
+            "alternates": tuple(_cand_from_json(a) for a in d.get("alternates") or ()),
+        }
+    )
+
+
+def _add_record(key: str, lt: LocalTrack, cands: Sequence[Candidate]) -> dict:
+    return {"op": "add", "path": key, "track": _track_to_json(lt), "candidates": [_cand_to_json(c) for c in cands]}
+
+
+class ReviewQueue:
+    """Persistent queue of tracks waiting for a manual decision (--defer-review).
+
+    Append-only NDJSON log of "add"/"done" records, so that queueing a track costs
+    one small write; the file is compacted (pending entries only) when opened and
+    closed. Entries keep the scored candidates, so a review needs no new search.
+    """
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._entries: Dict[str, Tuple[LocalTrack, List[Candidate]]] = {}
+        if self.path.exists():
+            with self.path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        rec = json.loads(line)
+                        if rec.get("op") == "add":
+                            self._entries[rec["path"]] = (
+                                _track_from_json(rec["track"]),
+                                [_cand_from_json(c) for c in rec["candidates"]],
+                            )
+                        elif rec.get("op") == "done":
+                            self._entries.pop(rec["path"], None)
+                    except (ValueError, KeyError, TypeError):
+                        continue  # torn last line after a crash
+        self._compact()
+        self._fh = self.path.open("a", encoding="utf-8")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, path: Path) -> bool:
+        return str(path) in self._entries
+
+    def __iter__(self) -> Iterator[Tuple[Path, LocalTrack, List[Candidate]]]:
+        for key, (lt, cands) in list(self._entries.items()):
+            yield Path(key), lt, cands
+
+    def _write(self, rec: dict) -> None:
+        self._fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+        self._fh.flush()
+
+    def add(self, path: Path, lt: LocalTrack, cands: Sequence[Candidate]) -> None:
+        self._entries[str(path)] = (lt, list(cands))
+        self._write(_add_record(str(path), lt, cands))
+
+    def remove(self, path: Path) -> None:
+        if self._entries.pop(str(path), None) is not None:
+            self._write({"op": "done", "path": str(path)})
+
+    def _compact(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            for key, (lt, cands) in self._entries.items():
+                f.write(json.dumps(_add_record(key, lt, cands), ensure_ascii=False) + "\n")
+        os.replace(tmp, self.path)
+
+    def close(self) -> None:
+        self._fh.close()
+        self._compact()
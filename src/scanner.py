@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import time
 from pathlib import Path
-from typing import Generator, Iterable, Iterator, List, Sequence
+from typing import Dict, Generator, Iterable, Iterator, List, Optional, Sequence
 
 
 def _is_hidden(path: Path) -> bool:
@@ -13,6 +16,140 @@ def _is_hidden(path: Path) -> bool:
     return False
 
 
+def _ext_of(name: str) -> str:
+    # Same semantics as Path(name).suffix, without building a Path per entry
+    i = name.rfind(".")
+    if i <= 0:
+        return ""
+    return name[i + 1 :].lower()
+
+
+class ScanManifest:
+    """Manifeste disque des dossiers déjà scannés (mtime + entrées).
+
+    Pour chaque dossier on conserve le ``st_mtime_ns`` et la liste brute de ses
+    entrées (fichiers, sous-dossiers, sous-dossiers symlinks). Si le mtime n'a pas
+    changé, le listing est réutilisé sans ``scandir``. Les filtres (extensions,
+    cachés, exclusions) sont appliqués à chaque run, le manifeste reste donc valable
+    quels que soient les options.
+    """
+
+    VERSION = 1
+    # A directory modified this recently may still change within the same mtime tick
+    # ("racy" entry): it is stored but will be listed again on the next run.
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._old: Dict[str, dict] = {}
+        self._new: Dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == self.VERSION:
+                self._old = data.get("dirs", {}) or {}
+        except Exception:
+            self._old = {}
+
+    def start(self) -> None:
+        """Reset per-scan counters before a new walk."""
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, dirpath: str, mtime_ns: int) -> Optional[dict]:
+        entry = self._old.get(dirpath)
+        if entry is not None and entry.get("mtime") == mtime_ns:
+            self.hits += 1
+            self._new[dirpath] = entry
+            return entry
+        self.misses += 1
+        return None
+
+    def store(self, dirpath: str, mtime_ns: int, entry: dict) -> None:
+        racy = time.time_ns() - mtime_ns < self.RACY_WINDOW_NS
+        entry["mtime"] = None if racy else mtime_ns
+        self._new[dirpath] = entry
+
+    def save(self) -> None:
+        """Persist the directories visited during this run (others are dropped)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps({"version": self.VERSION, "dirs": self._new}), encoding="utf-8")
+        os.replace(tmp, self.path)
+        self._old = self._new
+        self._new = {}
+
+
+def _list_dir(dirpath: str) -> Optional[dict]:
+    """List a directory with ``os.scandir``; returns None if it cannot be read."""
+    files: List[str] = []
+    dirs: List[str] = []
+    dir_links: List[str] = []
+    try:
+        with os.scandir(dirpath) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    if entry.is_symlink():
+                        dir_links.append(entry.name)
+                    else:
+                        dirs.append(entry.name)
+                else:
+                    files.append(entry.name)
+    except OSError:
+        return None
+    return {"files": files, "dirs": dirs, "dir_links": dir_links}
+
+
+def _walk_scandir(
+    root: str,
+    allowed: set,
+    follow_symlinks: bool,
+    ignore_hidden: bool,
+    excluded_dirs: set,
+    manifest: Optional[ScanManifest],
+) -> Iterator[Path]:
+    # Top-down, like os.walk: files of a directory are yielded before its subdirectories
+    stack = [root]
+    while stack:
+        dirpath = stack.pop()
+        listing = None
+        if manifest is not None:
+            try:
+                mtime_ns = os.stat(dirpath).st_mtime_ns
+            except OSError:
+                continue
+            listing = manifest.lookup(dirpath, mtime_ns)
+        if listing is None:
+            listing = _list_dir(dirpath)
+            if listing is None:
+                continue
+            if manifest is not None:
+                manifest.store(dirpath, mtime_ns, listing)
+
+        dpath = Path(dirpath)
+        for fn in listing["files"]:
+            if ignore_hidden and fn.startswith("."):
+                continue
+            if _ext_of(fn) in allowed:
+                yield dpath / fn
+
+        subdirs = list(listing["dirs"])
+        if follow_symlinks:
+            subdirs.extend(listing["dir_links"])
+        if ignore_hidden:
+            subdirs = [d for d in subdirs if not d.startswith(".")]
+        if excluded_dirs:
+            subdirs = [d for d in subdirs if d.lower() not in excluded_dirs]
+        # Reverse so that the stack pops subdirectories in listing order
+        for d in reversed(subdirs):
+            stack.append(os.path.join(dirpath, d))
+
+
 def iter_audio_files(
     root: Path | str,
     exts: Sequence[str],
@@ -20,6 +157,7 @@ def iter_audio_files(
     ignore_hidden: bool,
     recursive: bool = True,
     exclude_dirs: Sequence[str] = None,
+    manifest: Optional[ScanManifest] = None,
 ) -> Iterator[Path]:
     """Yield Path des fichiers audio valides.
 
@@ -27,6 +165,8 @@ def iter_audio_files(
     - exts: extensions autorisées, sans point (ex: ["mp3", "flac"]).
     - recursive: si False, ne pas descendre dans les sous-dossiers.
     - exclude_dirs: noms de dossiers à exclure (ex: ["AMV", "Covers"]).
+    - manifest: si fourni, scan incrémental (seuls les dossiers dont le mtime a
+      changé sont relistés) ; le manifeste est sauvegardé en fin de parcours.
     """
     root_path = Path(root)
     allowed = {e.lower().lstrip(".") for e in exts}
@@ -49,22 +189,25 @@ def iter_audio_files(
                 yield p
         return
 
-    for dirpath, dirnames, filenames in os.walk(root_path, followlinks=follow_symlinks):
-        dpath = Path(dirpath)
-        if ignore_hidden and _is_hidden(dpath):
-            # Skip hidden directories entirely
-            dirnames[:] = []
-            continue
-        # Optionally skip hidden subdirs
-        if ignore_hidden:
-            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-        # Skip excluded directories
-        if excluded_dirs:
-            dirnames[:] = [d for d in dirnames if d.lower() not in excluded_dirs]
-        for fn in filenames:
-            p = dpath / fn
-            if ignore_hidden and _is_hidden(p):
-                continue
-            ext = p.suffix.lower().lstrip(".")
-            if ext in allowed:
-                yield p
+    if ignore_hidden and _is_hidden(root_path):
+        return
+
+    if manifest is not None:
+        manifest.start()
+    yield from _walk_scandir(
+        os.fspath(root_path),
+        allowed,
+        follow_symlinks=follow_symlinks,
+        ignore_hidden=ignore_hidden,
+        excluded_dirs=excluded_dirs,
+        manifest=manifest,
+    )
+    if manifest is not None:
+        manifest.save()
+
+
+def default_manifest_path(root: Path | str, cache_dir: Path | str = ".cache") -> Path:
+    """Chemin du manifeste pour un dossier racine donné (un fichier par racine)."""
+    key = Path(root).resolve(strict=False).as_posix().casefold()
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return Path(cache_dir) / f"scan-manifest-{digest}.json"
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from .matcher import CandidatePool, SearchStats, search_candidates
+from .types import Candidate, LocalTrack
+from .utils import iter_ordered, text_forms
+
+T = TypeVar("T")
+
+
+class SearchCancelled(Exception):
+    """Raised by searches started after SearchEngine.cancel()."""
+
+
+class SearchEngine:
+    """Concurrent front-end for search_candidates with an in-run cache.
+
+    - the queries of one track run on a query pool (``workers`` threads);
+    - several tracks can be resolved ahead of the decision loop (``run_ahead``);
+      ``cancel`` stops that look-ahead when the user quits;
+    - the cache is keyed on normalized (title, artist) and shared across threads;
+      identical keys in flight are searched once;
+    - with a TrackCatalog, tracks seen in earlier runs are matched offline first;
+    - with a MarketScheduler, the markets are chosen per track and the outcome of
+      each search is recorded in its statistics.
+
+    Results are the same as the serial path: search_candidates merges responses in
+    query order. Cached results are immutable CandidatePools: each local track gets
+    its own score vector and scored copies, the pool itself is never modified.
+    """
+
+    def __init__(
+        self,
+        sp,
+        market: Optional[str],
+        workers: int = 1,
+        limit: int = 20,
+        stop_score: Optional[float] = None,
+        catalog=None,
+        scheduler=None,
+    ):
+        self.sp = sp
+        self.market = market
+        self.limit = limit
+        self.stop_score = stop_score
+        self.catalog = catalog
+        self.scheduler = scheduler
+        self.stats = SearchStats()
+        self.workers = max(1, int(workers))
+        self._query_pool = ThreadPoolExecutor(self.workers, thread_name_prefix="search-q") if self.workers > 1 else None
+        self._track_pool: Optional[ThreadPoolExecutor] = None
+        self._cache: Dict[Tuple[str, str], CandidatePool] = {}
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+
+    @staticmethod
+    def cache_key(lt: LocalTrack) -> Tuple[str, str]:
+        return (text_forms(lt.title or "").stripped_key, text_forms(lt.artist or "").defeat_key)
+
+    def _search(self, lt: LocalTrack) -> List[Candidate]:
+        if self._cancelled.is_set():
+            raise SearchCancelled()
+        markets = self.scheduler.markets(lt) if self.scheduler is not None else None
+        cands = search_candidates(
+            self.sp,
+            lt,
+            self.market,
+            limit=self.limit,
+            executor=self._query_pool,
+            stop_score=self.stop_score,
+            stats=self.stats,
+            catalog=self.catalog,
+            markets=markets,
+            cancelled=self._cancelled,
+        )
+        if self._cancelled.is_set():
+            raise SearchCancelled()  # partial result: neither cached nor recorded
+        if self.scheduler is not None and self.stop_score is not None:
+            self.scheduler.record(lt, cands, self.stop_score, markets)
+        return cands
+
+    def candidates(self, lt: LocalTrack, use_cache: bool = True) -> List[Candidate]:
+        """Return scored candidates for lt, from the in-run cache when possible."""
+        if not use_cache:
+            return self._search(lt)
+        key = self.cache_key(lt)
+        owner = False
+        with self._lock:
+            cached = self._cache.get(key)
+            fut = self._inflight.get(key)
+            if cached is None and fut is None:
+                fut = Future()
+                self._inflight[key] = fut
+                owner = True
+        if cached is not None:
+            return cached.ranked(lt)
+        if not owner:
+            return fut.result().ranked(lt)
+        try:
+            cands = self._search(lt)
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            fut.set_exception(e)
+            raise
+        pool = CandidatePool(cands)
+        with self._lock:
+            self._cache[key] = pool
+            self._inflight.pop(key, None)
+        fut.set_result(pool)
+        return cands
+
+    def run_ahead(
+        self, fn: Callable[[T], object], items: Iterable[T], window: int, threads: Optional[int] = None
+    ) -> Iterator[Tuple[T, object]]:
+        """Apply fn to items on a track pool, yielding (item, result) in order.
+
+        Up to ``window`` items are in flight (the one being consumed included), on
+        ``threads`` threads (default: window); window <= 1 runs inline.
+        """
+        if window <= 1:
+            for item in items:
+                yield item, fn(item)
+            return
+        if self._track_pool is None:
+            self._track_pool = ThreadPoolExecutor(max(1, threads or window), thread_name_prefix="search-t")
+        yield from iter_ordered(self._track_pool, fn, items, window)
+
+    def cancel(self) -> None:
+        """Stop the look-ahead: queued tracks are dropped and no new search starts.
+
+        Searches already running stop before their next query and raise SearchCancelled.
+        """
+        self._cancelled.set()
+        if self._track_pool is not None:
+            self._track_pool.shutdown(wait=False, cancel_futures=True)
+
+    def close(self) -> None:
+        for pool in (self._track_pool, self._query_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
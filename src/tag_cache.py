@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from .types import LocalTrack
+
+# Bump when read_tags() output changes so that stale rows are ignored
+TAG_CACHE_VERSION = 2
+
+StatKey = Tuple[int, int]  # (size, mtime_ns)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tags (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    title TEXT,
+    artist TEXT,
+    album TEXT,
+    duration_ms INTEGER,
+    year INTEGER,
+    isrc TEXT,
+    tracknumber INTEGER
+)
+"""
+
+
+def stat_key(path: Path) -> Optional[StatKey]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+class TagCache:
+    """Cache SQLite persistant des tags lus par ``read_tags``.
+
+    Clé: chemin absolu + taille + mtime. Une entrée est ignorée (puis réécrite)
+    dès que la taille ou le mtime du fichier change. Utilisable depuis plusieurs
+    threads (lecture anticipée, ``--prefetch``).
+    """
+
+    def __init__(self, db_path: Path | str = Path(".cache") / "tags.sqlite", commit_every: int = 500):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._commit_every = max(1, commit_every)
+        self._pending = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return os.path.abspath(path)
+
+    def lookup(self, path: Path) -> Tuple[Optional[LocalTrack], Optional[StatKey]]:
+        """Return (cached track or None, current stat key of the file)."""
+        sk = stat_key(path)
+        with self._lock:
+            if sk is None:
+                self.misses += 1
+                return None, None
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, version, title, artist, album, duration_ms, year, isrc, tracknumber"
+                " FROM tags WHERE path = ?",
+                (self._key(path),),
+            ).fetchone()
+            if row is None or (row[0], row[1]) != sk or row[2] != TAG_CACHE_VERSION:
+                self.misses += 1
+                return None, sk
+            self.hits += 1
+        return (
+            LocalTrack(
+                path=path,
+                title=row[3],
+                artist=row[4],
+                album=row[5],
+                duration_ms=row[6],
+                year=row[7],
+                isrc=row[8],
+                tracknumber=row[9],
+            ),
+            sk,
+        )
+
+    def store(self, path: Path, sk: Optional[StatKey], lt: LocalTrack) -> None:
+        if sk is None:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tags"
+                " (path, size, mtime_ns, version, title, artist, album, duration_ms, year, isrc, tracknumber)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._key(path),
+                    sk[0],
+                    sk[1],
+                    TAG_CACHE_VERSION,
+                    lt.title,
+                    lt.artist,
+                    lt.album,
+                    lt.duration_ms,
+                    lt.year,
+                    lt.isrc,
+                    lt.tracknumber,
+                ),
+            )
+            self._pending += 1
+            if self._pending >= self._commit_every:
+                self._conn.commit()
+                self._pending = 0
+
+    def read(self, path: Path, loader: Callable[[Path], LocalTrack]) -> LocalTrack:
+        """Return cached tags for path, calling ``loader`` (e.g. read_tags) on a miss."""
+        lt, sk = self.lookup(path)
+        if lt is not None:
+            return lt
+        lt = loader(path)
+        self.store(path, sk, lt)
+        return lt
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._pending:
+                self._conn.commit()
+                self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            self._conn.close()
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, Tuple
 
 
-@dataclass
+# LocalTrack/Candidate: one instance per file / search result, so they are slotted
+# (no per-instance __dict__) and frozen; derive modified copies with dataclasses.replace()
+@dataclass(frozen=True, slots=True)
 class LocalTrack:
     """Local audio track metadata extracted from tags and/or filename."""
     path: Path
@@ -18,16 +20,21 @@ class LocalTrack:
     tracknumber: Optional[int] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Candidate:
     uri: str
     name: str
-    artists: List[str]
+    artists: Tuple[str, ...]
     album: str
     duration_ms: int
     score: float
     release_year: Optional[int] = None
     track_number: Optional[int] = None
+    isrc: Optional[str] = None
+    market: Optional[str] = None  # market of the search that returned it (None = global)
+    # Same recording under other markets/releases (same ISRC or relinked), collapsed into this one
+    alternates: Tuple["Candidate", ...] = field(default=(), repr=False)
+    call_id: Optional[int] = field(default=None, repr=False, compare=False)  # API call that returned it (api_calls)
 
 
 @dataclass
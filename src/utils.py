@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import csv
+import functools
 import os
 import re
+import threading
 import time
+import unicodedata
+from collections import deque
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable, Iterator, List, Sequence, Tuple, TypeVar
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Sequence, Tuple, TypeVar
 
-from tenacity import retry, stop_after_attempt, wait_random_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+
+from . import api_calls
 
 T = TypeVar("T")
 
@@ -50,6 +56,28 @@ def chunked(seq: Sequence[T] | Iterable[T], n: int) -> Iterator[List[T]]:
         yield buf
 
 
+def iter_ordered(executor, fn: Callable, items: Iterable[T], window: int) -> Iterator[Tuple[T, object]]:
+    """Map fn over items on an executor, yielding (item, result) in input order.
+
+    At most ``window`` calls are in flight, so memory stays bounded on large inputs.
+    Pending calls are cancelled if the consumer stops early.
+    """
+    window = max(1, window)
+    pending: deque = deque()
+    try:
+        for item in items:
+            pending.append((item, executor.submit(fn, item)))
+            if len(pending) >= window:
+                it, fut = pending.popleft()
+                yield it, fut.result()
+        while pending:
+            it, fut = pending.popleft()
+            yield it, fut.result()
+    finally:
+        for _, fut in pending:
+            fut.cancel()
+
+
 def format_duration(ms: int | None) -> str:
     if not ms or ms <= 0:
         return "--:--"
@@ -64,19 +92,48 @@ _brackets_re = re.compile(r"\s*[\[(].*?[\])]", re.IGNORECASE)
 _ws_re = re.compile(r"\s+")
 
 
+class TextForms(NamedTuple):
+    """Every derived form of a string, computed once by text_forms()."""
+
+    stripped: str  # strip_suffixes(): no (Live)/[Remastered]/bracketed noise
+    defeat: str  # remove_feat(): no "feat. X" tail
+    clean: str  # remove_feat(strip_suffixes())
+    stripped_key: str  # stripped, lowercased (cache keys)
+    defeat_key: str  # defeat, lowercased (cache keys)
+    folded: str  # clean, NFKC (full/half width folded), casefolded, single spaces
+
+
+TEXT_FORMS_CACHE_SIZE = 65536
+
+
+@functools.lru_cache(maxsize=TEXT_FORMS_CACHE_SIZE)
+def text_forms(text: str) -> TextForms:
+    """Normalize a title/artist/album once; memoized (bounded LRU, thread-safe)."""
+    stripped = _ws_re.sub(" ", _brackets_re.sub("", _paren_re.sub("", text))).strip()
+    defeat = _feat_re.sub("", text).strip()
+    clean = _feat_re.sub("", stripped).strip() if stripped else stripped
+    folded = _ws_re.sub(" ", unicodedata.normalize("NFKC", clean).casefold()).strip()
+    return TextForms(
+        stripped=stripped,
+        defeat=defeat,
+        clean=clean,
+        stripped_key=stripped.lower().strip(),
+        defeat_key=defeat.lower().strip(),
+        folded=folded,
+    )
+
+
 def strip_suffixes(text: str) -> str:
     """Remove common suffixes like (Live), (Remastered 2011), [Radio Edit]."""
     if not text:
         return text
-    t = _paren_re.sub("", text)
-    t = _brackets_re.sub("", t)
-    return _ws_re.sub(" ", t).strip()
+    return text_forms(text).stripped
 
 
 def remove_feat(text: str) -> str:
     if not text:
         return text
-    return _feat_re.sub("", text).strip()
+    return text_forms(text).defeat
 
 
 def normalize_str(s: str | None) -> str:
@@ -111,6 +168,12 @@ def _is_rate_limited_exception(e: Exception) -> bool:
     return getattr(e, "http_status", None) == 429
 
 
+def _is_retryable_exception(e: BaseException) -> bool:
+    # 4xx other than 429 (bad id, missing or private playlist...) will not succeed on retry
+    status = getattr(e, "http_status", None)
+    return not (isinstance(status, int) and 400 <= status < 500 and status != 429)
+
+
 def _retry_after_seconds(e: Exception) -> int:
     try:
         headers = getattr(e, "headers", {}) or {}
@@ -120,16 +183,63 @@ def _retry_after_seconds(e: Exception) -> int:
         return 1
 
 
-@retry(reraise=True, stop=stop_after_attempt(6), wait=wait_random_exponential(multiplier=1, max=10))
-def call_spotify_with_retries(func, *args, **kwargs):
-    """Call a Spotify client method with retry/backoff and 429 handling.
+class RateGate:
+    """Process-wide pause shared by all threads after a 429.
 
-    If a 429 occurs and Retry-After header is present, sleep that duration then retry.
-    Uses exponential backoff with jitter for other transient exceptions.
+    When one call is rate limited, every caller waits until Retry-After has
+    elapsed instead of hammering the API in parallel.
     """
+
+    def __init__(self) -> None:
+        self._until = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        delay = self._until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def block(self, seconds: float) -> None:
+        with self._lock:
+            self._until = max(self._until, time.monotonic() + seconds)
+
+
+rate_gate = RateGate()
+
+
+@retry(
+    reraise=True,
+    retry=retry_if_exception(_is_retryable_exception),
+    stop=stop_after_attempt(6),
+    wait=wait_random_exponential(multiplier=1, max=10),
+)
+def _call_with_retries(call: api_calls.ApiCall, func, args, kwargs):
+    rate_gate.wait()
+    call.attempts += 1
     try:
         return func(*args, **kwargs)
     except Exception as e:
         if _is_rate_limited_exception(e):
-            time.sleep(_retry_after_seconds(e) + 1)
+            call.throttled += 1
+            rate_gate.block(_retry_after_seconds(e) + 1)
+            rate_gate.wait()
+        raise
+
+
+def call_spotify_with_retries(func, *args, **kwargs):
+    """Call a Spotify client method with retry/backoff and 429 handling.
+
+    If a 429 occurs and Retry-After header is present, pause all callers (see
+    RateGate) for that duration then retry.
+    Uses exponential backoff with jitter for other transient exceptions; other
+    4xx responses (404, 403...) are raised at once.
+    Each call (retries included) is accounted in the active api_calls.ApiCallLog.
+    """
+    call = api_calls.start(getattr(func, "__name__", "?"), kwargs.get("market", kwargs.get("country")))
+    try:
+        return _call_with_retries(call, func, args, kwargs)
+    except Exception:
+        call.ok = False
         raise
+    finally:
+        api_calls.finish(call)
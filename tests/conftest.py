@@ -0,0 +1,32 @@
+import argparse
+import logging
+
+import pytest
+
+from src.cli import ImportRun
+from src.types import PlaylistInfo
+
+
+@pytest.fixture
+def make_run(tmp_path):
+    """Build an ImportRun writing its summaries under tmp_path; ``args`` override the CLI defaults."""
+
+    def make(sp=None, existing=None, **args):
+        defaults = dict(dry_run=False, resume=None, market="FR", auto_accept=0.92, auto_deny=None, max_candidates=5)
+        run = ImportRun(
+            args=argparse.Namespace(**{**defaults, **args}),
+            sp=sp,
+            pl=PlaylistInfo("pl", "Test", "me", "me", False, False, 0),
+            logger=logging.getLogger("test"),
+            existing=set(existing or ()),
+            state={"processed": {}},
+            csv_path=tmp_path / "s.csv",
+            json_path=tmp_path / "s.json",
+            status_fhs={},
+            engine=None,
+        )
+        run.csv_path.touch()
+        run.json_path.touch()
+        return run
+
+    return make
@@ -0,0 +1,72 @@
+import itertools
+import random
+from pathlib import Path
+
+from src.album import group_by_album, linear_assignment, match_album
+from src.types import LocalTrack
+
+
+def test_linear_assignment_is_optimal():
+    rnd = random.Random(3)
+    for n, m in [(3, 3), (4, 6), (6, 4), (1, 5)]:
+        scores = [[rnd.random() for _ in range(m)] for _ in range(n)]
+        pairs = linear_assignment(scores)
+        assert len(pairs) == min(n, m)
+        assert len({i for i, _ in pairs}) == len({j for _, j in pairs}) == len(pairs)
+        if n <= m:
+            best = max(sum(scores[i][p[i]] for i in range(n)) for p in itertools.permutations(range(m), n))
+        else:
+            best = max(sum(scores[p[j]][j] for j in range(m)) for p in itertools.permutations(range(n), m))
+        assert abs(sum(scores[i][j] for i, j in pairs) - best) < 1e-9
+
+
+class AlbumSpotify:
+    TITLES = ["Intro", "Blue", "Blue (Reprise)", "Night Drive"]
+
+    def __init__(self):
+        self.calls = []
+
+    def search(self, q, type="track", market=None, limit=20):
+        self.calls.append("search")
+        album = {"id": "alb", "name": "Colors", "artists": [{"name": "Vivid"}], "total_tracks": 4, "release_date": "2011"}
+        return {"albums": {"items": [album]}}
+
+    def album_tracks(self, album_id, limit=50, offset=0, market=None):
+        self.calls.append("album_tracks")
+        items = [
+            {
+                "id": f"t{i}",
+                "uri": f"spotify:track:t{i}",
+                "name": t,
+                "artists": [{"name": "Vivid"}],
+                "duration_ms": 180000 + 20000 * i,
+                "track_number": i + 1,
+            }
+            for i, t in enumerate(self.TITLES)
+        ]
+        return {"items": items, "next": None}
+
+
+def _lt(path, title, n, ms):
+    return LocalTrack(path=path, title=title, artist="Vivid", album="Colors", duration_ms=ms, year=None, isrc=None, tracknumber=n)
+
+
+def test_album_mode_assigns_whole_folder_with_two_calls():
+    d = Path("music/Vivid - Colors")
+    # Ambiguous titles ("Blue" vs "Blue (Reprise)") are settled by track number and duration
+    files = [
+        (d / "02.flac", _lt(d / "02.flac", "Blue", 2, 200000)),
+        (d / "03.flac", _lt(d / "03.flac", "Blue", 3, 220000)),
+        (d / "04.flac", _lt(d / "04.flac", "Night Drive", 4, 240000)),
+        (Path("other/x.mp3"), _lt(Path("other/x.mp3"), "Intro", 1, 180000)),
+    ]
+    groups = group_by_album(files, min_tracks=3)
+    assert [len(g) for g in groups] == [3]
+    sp = AlbumSpotify()
+    m = match_album(sp, groups[0], "FR")
+    assert sp.calls == ["search", "album_tracks"] and m.calls == 2
+    assert {p.name: c.uri for p, c in m.assigned.items()} == {
+        "02.flac": "spotify:track:t1",
+        "03.flac": "spotify:track:t2",
+        "04.flac": "spotify:track:t3",
+    }
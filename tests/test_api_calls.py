@@ -0,0 +1,38 @@
+import json
+from pathlib import Path
+
+from src import api_calls
+from src.matcher import search_candidates
+from src.types import LocalTrack
+
+
+class OneHitSpotify:
+    """Only the plain "title artist" query finds the track."""
+
+    def search(self, q, type="track", market=None, limit=20):
+        items = []
+        if q == "Song Artist":
+            items = [{"id": "t1", "uri": "spotify:track:t1", "name": "Song", "artists": [{"name": "Artist"}],
+                      "album": {"name": "Album"}, "duration_ms": 200000}]
+        return {"tracks": {"items": items}}
+
+
+def test_calls_tagged_and_accepted_credited(tmp_path):
+    log = api_calls.ApiCallLog(tmp_path / "api-calls.ndjson")
+    api_calls.set_active(log)
+    try:
+        lt = LocalTrack(path=Path("x.mp3"), title="Song", artist="Artist", album=None, duration_ms=200000, year=None, isrc=None)
+        cands = search_candidates(OneHitSpotify(), lt, "FR", limit=5, stop_score=0.9, markets=["FR"])
+        api_calls.accepted(cands[0].call_id, cands[0].uri)
+    finally:
+        api_calls.set_active(None)
+        log.close()
+
+    totals = {key: t for key, t in log.rows()}
+    assert set(totals) == {("search", "quoted", "FR"), ("search", "plain", "FR")}
+    assert totals[("search", "plain", "FR")].accepted == 1
+    assert totals[("search", "quoted", "FR")].accepted == 0
+    records = [json.loads(line) for line in log.path.read_text().splitlines()]
+    assert [r.get("strategy") for r in records[:2]] == ["quoted", "plain"]
+    assert records[-1] == {"accepted": records[1]["call"], "uri": "spotify:track:t1"}
+    assert all(r["attempts"] == 1 and r["ok"] for r in records[:2])
@@ -0,0 +1,61 @@
+from pathlib import Path
+
+from src.artist import group_by_artist, prefetch_artist
+from src.types import LocalTrack
+
+
+class ArtistSpotify:
+    def __init__(self):
+        self.calls = []
+
+    def search(self, q, type="track", market=None, limit=20):
+        self.calls.append("search")
+        return {"artists": {"items": [{"id": "other", "name": "Vivid Dreams"}, {"id": "ar1", "name": "Vivid", "popularity": 50}]}}
+
+    def artist_albums(self, artist_id, album_type=None, country=None, limit=20, offset=0):
+        self.calls.append("artist_albums")
+        ids = [f"al{i}" for i in range(offset, min(offset + limit, 30))]
+        return {"items": [{"id": i} for i in ids], "next": "more" if offset + limit < 30 else None}
+
+    def albums(self, ids, market=None):
+        self.calls.append("albums")
+        return {
+            "albums": [
+                {
+                    "id": i,
+                    "name": f"Album {i}",
+                    "release_date": "2011",
+                    "tracks": {
+                        "items": [
+                            {
+                                "id": f"{i}t{n}",
+                                "uri": f"spotify:track:{i}t{n}",
+                                "name": f"Song {i} {n}",
+                                "artists": [{"name": "Vivid"}],
+                                "duration_ms": 200000,
+                            }
+                            for n in range(3)
+                        ],
+                        "next": None,
+                    },
+                }
+                for i in ids
+            ]
+        }
+
+
+def test_prefetch_builds_pool_in_few_calls():
+    def lt(i):
+        artist = "Vivid" if i < 12 else "Other"
+        return LocalTrack(path=Path(f"{i}.mp3"), title=f"Song al{i} 1", artist=artist, album=None, duration_ms=200000, year=None, isrc=None)
+
+    files = [(Path(f"{i}.mp3"), lt(i)) for i in range(15)]
+    groups = group_by_artist(files, min_tracks=10)
+    assert list(groups) == ["vivid"]
+    sp = ArtistSpotify()
+    cat = prefetch_artist(sp, groups["vivid"], "FR")
+    assert cat.artist["id"] == "ar1"
+    assert sp.calls == ["search", "artist_albums", "albums", "albums"]  # 30 albums: 1 page, 2 batches of 20
+    assert len(cat.pool) == 90
+    lt = files[4][1]
+    assert cat.pool.ranked(lt)[0].uri == "spotify:track:al4t1"
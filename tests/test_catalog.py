@@ -0,0 +1,63 @@
+from pathlib import Path
+
+from src.catalog import TrackCatalog
+from src.matcher import SearchStats, search_candidates
+from src.types import LocalTrack
+
+
+def _item(tid, name, artist, isrc=None):
+    it = {
+        "id": tid,
+        "uri": f"spotify:track:{tid}",
+        "name": name,
+        "artists": [{"name": artist}],
+        "album": {"name": "Album"},
+        "duration_ms": 200000,
+    }
+    if isrc:
+        it["external_ids"] = {"isrc": isrc}
+    return it
+
+
+class CountingSpotify:
+    def __init__(self, items):
+        self.items = items
+        self.calls = 0
+
+    def search(self, q, type="track", market=None, limit=20):
+        self.calls += 1
+        return {"tracks": {"items": self.items}}
+
+
+def _lt(title, artist, isrc=None):
+    return LocalTrack(path=Path("x.mp3"), title=title, artist=artist, album=None, duration_ms=200000, year=None, isrc=isrc)
+
+
+def test_lookup_by_tokens_trigrams_and_isrc(tmp_path):
+    cat = TrackCatalog(tmp_path / "catalog.sqlite")
+    cat.add_items(
+        [_item("a", "Blue Bird", "Ikimono Gakari"), _item("b", "Silhouette", "KANA-BOON", isrc="jpabc1")], "JP"
+    )
+    assert [it["id"] for it, _ in cat.lookup("Blue Bird", "Ikimono-gakari")][:1] == ["a"]
+    assert [it["id"] for it, _ in cat.lookup("Silhoutte", None)][:1] == ["b"]  # typo: trigrams
+    assert cat.lookup("zzz", None, isrc="JPABC1")[0] == (_item("b", "Silhouette", "KANA-BOON", isrc="jpabc1"), "JP")
+    cat.close()
+    assert len(TrackCatalog(tmp_path / "catalog.sqlite")) == 2
+
+
+def test_search_resolves_offline_from_catalog(tmp_path):
+    cat = TrackCatalog(tmp_path / "catalog.sqlite")
+    sp = CountingSpotify([_item("a", "Blue Bird", "Ikimono Gakari")])
+    first = search_candidates(sp, _lt("Blue Bird", "Ikimono Gakari"), "FR", limit=5, stop_score=0.9, catalog=cat)
+    calls = sp.calls
+    assert calls > 0
+
+    stats = SearchStats()
+    again = search_candidates(sp, _lt("Blue Bird", "Ikimono Gakari"), "FR", limit=5, stop_score=0.9, catalog=cat, stats=stats)
+    assert sp.calls == calls
+    assert [(c.uri, c.score) for c in again] == [(c.uri, c.score) for c in first]
+    assert stats.local_hits == 1 and stats.executed == 0
+
+    # Below auto-accept locally: goes to the network
+    search_candidates(sp, _lt("Something Else", "Nobody"), "FR", limit=5, stop_score=0.9, catalog=cat)
+    assert sp.calls > calls
@@ -0,0 +1,64 @@
+import struct
+
+from src.dedupe import audio_hash, cluster_by_audio
+
+
+def _mp3(path, title):
+    from mutagen.id3 import ID3, TIT2
+
+    path.write_bytes((bytes([0xFF, 0xFB, 0x90, 0x64]) + b"\x01" * 413) * 5)
+    tags = ID3()
+    tags.add(TIT2(encoding=3, text=[title]))
+    tags.save(path)
+    return path
+
+
+def _wav(path, payload, extra=b""):
+    fmt = struct.pack("<HHIIHH", 1, 2, 44100, 44100 * 4, 4, 16)
+    body = b"WAVE" + b"fmt " + struct.pack("<I", len(fmt)) + fmt + b"data" + struct.pack("<I", len(payload)) + payload
+    if extra:
+        body += b"LIST" + struct.pack("<I", len(extra)) + extra
+    path.write_bytes(b"RIFF" + struct.pack("<I", len(body)) + body)
+    return path
+
+
+def test_audio_hash_ignores_tags(tmp_path):
+    a = _mp3(tmp_path / "a.mp3", "Title")
+    b = _mp3(tmp_path / "b.mp3", "A much longer title from a compilation")
+    assert a.read_bytes() != b.read_bytes()
+    assert audio_hash(a) == audio_hash(b)
+
+    w1 = _wav(tmp_path / "a.wav", b"\x02" * 400)
+    w2 = _wav(tmp_path / "b.wav", b"\x02" * 400, extra=b"INFOINAM\x04\x00\x00\x00abc\x00")
+    w3 = _wav(tmp_path / "c.wav", b"\x03" * 400)
+    assert audio_hash(w1) == audio_hash(w2) != audio_hash(w3)
+
+
+def test_cluster_by_audio_keeps_only_groups(tmp_path):
+    a = _mp3(tmp_path / "a.mp3", "x")
+    b = _mp3(tmp_path / "b.mp3", "y")
+    c = _wav(tmp_path / "c.wav", b"\x05" * 100)
+    clusters = cluster_by_audio([a, b, c], workers=2)
+    assert set(clusters) == {a, b}
+    assert clusters[a] == clusters[b]
+
+
+def test_full_hash_only_within_signature_buckets(tmp_path, monkeypatch):
+    from src import dedupe
+
+    a = _mp3(tmp_path / "a.mp3", "x")
+    b = _mp3(tmp_path / "b.mp3", "y")
+    unique = _wav(tmp_path / "u.wav", b"\x05" * 100)
+    # Same size and same first PREFIX_BYTES: only the full hash tells them apart
+    head = b"\x07" * dedupe.PREFIX_BYTES
+    w1 = _wav(tmp_path / "w1.wav", head + b"\x01" * 64)
+    w2 = _wav(tmp_path / "w2.wav", head + b"\x02" * 64)
+    w3 = _wav(tmp_path / "w3.wav", head + b"\x01" * 64, extra=b"INFOINAM\x04\x00\x00\x00abc\x00")
+
+    hashed = []
+    full_hash = dedupe.audio_hash
+    monkeypatch.setattr(dedupe, "audio_hash", lambda p: hashed.append(p) or full_hash(p))
+    clusters = cluster_by_audio([a, b, unique, w1, w2, w3], workers=2)
+    assert sorted(hashed) == sorted([a, b, w1, w2, w3])  # the unique file is never read in full
+    assert set(clusters) == {a, b, w1, w3}
+    assert clusters[w1] == clusters[w3] != clusters[a]
@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from src.metadata import infer_from_filename
+from src.metadata import infer_from_filename, iter_local_tracks
 from src.types import LocalTrack
 
 
@@ -23,3 +23,15 @@ def test_infer_artist_title_underscore():
 def test_strip_suffixes():
     l = infer_from_filename(Path("Artist - Title (Remastered 2011).mp3"), lt("Artist - Title (Remastered 2011).mp3"))
     assert l.title == "Title"
+
+
+def test_iter_local_tracks_keeps_order_with_workers(tmp_path):
+    paths = []
+    for i in range(6):
+        p = tmp_path / f"Artist {i} - Title {i}.dat"
+        p.write_bytes(b"")
+        paths.append(p)
+    out = list(iter_local_tracks(paths, workers=2, window=3))
+    assert [p for p, _ in out] == paths
+    assert [l.artist for _, l in out] == [f"Artist {i}" for i in range(6)]
+
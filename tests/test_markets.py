@@ -0,0 +1,90 @@
+from pathlib import Path
+
+from src.markets import MarketScheduler, MarketStats, scripts_of
+from src.matcher import SearchStats, search_candidates
+from src.search_engine import SearchEngine
+from src.types import Candidate, LocalTrack
+
+
+def _lt(title, artist):
+    return LocalTrack(path=Path("x.mp3"), title=title, artist=artist, album=None, duration_ms=None, year=None, isrc=None)
+
+
+def _cand(score, market):
+    return Candidate(uri="spotify:track:a", name="x", artists=("y",), album="z", duration_ms=1, score=score, market=market)
+
+
+def test_scripts_drive_market_order():
+    assert scripts_of("Hello, world!") == {"latin"}
+    assert scripts_of("残酷な天使のテーゼ") == {"han", "kana"}
+    s = MarketScheduler("FR")
+    assert s.markets(_lt("Hello", "Adele")) == ["FR", "JP", "US", None]  # full sweep without statistics
+    assert s.markets(_lt("残酷な天使のテーゼ", "高橋洋子")) == ["JP", "FR", "US", None]
+    assert s.markets(_lt("Gangnam Style", "싸이")) == ["KR", "FR", "JP", "US", None]
+    assert MarketScheduler(None).markets(_lt("Hello", "Adele")) == [None, "JP", "US"]
+
+
+def test_stats_learned_saved_and_reset(tmp_path):
+    path = tmp_path / "stats.json"
+    stats = MarketStats(path)
+    s = MarketScheduler("FR", stats)
+    lt = _lt("Romaji Title", "Anime Band")
+    sweep = ["FR", "JP", "US", None]
+    s.record(lt, [_cand(0.95, "JP")], threshold=0.9, markets=sweep)
+    s.record(lt, [_cand(0.95, "JP")], threshold=0.9, markets=sweep)
+    s.record(lt, [_cand(0.5, "FR")], threshold=0.9, markets=sweep)
+    stats.save()
+
+    reloaded = MarketStats(path)
+    assert reloaded.rows() == [("anime band", {"JP": 2}, {"FR": 3, "JP": 1, "US": 1, "*": 1})]
+    assert MarketScheduler("FR", reloaded).markets(lt) == ["JP", "FR", "US", None]
+    reloaded.reset()
+    assert not path.exists() and len(MarketStats(path)) == 0
+
+
+def test_failing_market_tried_last_and_promoted_on_hit(tmp_path):
+    class UsOnlySpotify:
+        def __init__(self):
+            self.markets = []
+
+        def search(self, q, type="track", market=None, limit=20):
+            self.markets.append(market)
+            items = []
+            if market == "US":
+                items = [{"id": "u1", "uri": "spotify:track:u1", "name": "Song", "artists": [{"name": "Band"}],
+                          "album": {"name": "Album"}, "duration_ms": 200000}]
+            return {"tracks": {"items": items}}
+
+    stats = MarketStats(tmp_path / "stats.json")
+    s = MarketScheduler("FR", stats, demote_after=2)
+    lt = _lt("Song", "Band")
+    for _ in range(2):
+        s.record(lt, [], threshold=0.9, markets=["FR", "JP", "US", None])
+    assert s.markets(lt) == ["FR", None, "JP", "US"]  # never found there: after the global pass
+
+    sp = UsOnlySpotify()
+    engine = SearchEngine(sp, "FR", stop_score=0.9, scheduler=s)
+    try:
+        cands = engine.candidates(lt)
+    finally:
+        engine.close()
+    assert cands[0].market == "US"
+    assert list(dict.fromkeys(sp.markets)) == ["FR", None, "JP", "US"]
+    assert s.markets(lt) == ["US", "FR", None, "JP"]  # the hit promotes US, JP stays demoted
+
+
+class CountingSpotify:
+    def __init__(self):
+        self.markets = []
+
+    def search(self, q, type="track", market=None, limit=20):
+        self.markets.append(market)
+        return {"tracks": {"items": []}}
+
+
+def test_pruned_markets_are_counted():
+    lt = _lt("Song", "Artist")
+    sp, stats = CountingSpotify(), SearchStats()
+    search_candidates(sp, lt, "FR", limit=5, stats=stats, markets=["FR", None])
+    assert set(sp.markets) == {"FR", None}
+    assert stats.pruned > 0 and stats.saved == stats.naive - stats.executed
@@ -0,0 +1,127 @@
+import threading
+
+import pytest
+from spotipy.exceptions import SpotifyException
+
+from src.playlist import (
+    PLAYLIST_ITEMS_FIELDS,
+    PlaylistIndex,
+    _playlist_info,
+    add_tracks_batched,
+    get_playlist_track_uris,
+    list_user_playlists,
+)
+from src.playlist_cache import PlaylistCache
+
+
+class FakePlaylistSpotify:
+    def __init__(self, total):
+        self.total = total
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def playlist_items(self, playlist_id, fields=None, limit=100, offset=0, market=None):
+        with self._lock:
+            self.calls.append((fields, offset))
+        items = [{"track": {"uri": f"spotify:track:{i}"}} for i in range(offset, min(offset + limit, self.total))]
+        items.append({"track": None})  # removed or unavailable track
+        return {"items": items, "total": self.total}
+
+
+def test_pages_fetched_concurrently_with_projection():
+    sp = FakePlaylistSpotify(1050)
+    uris = get_playlist_track_uris(sp, "pl")
+    assert uris == {f"spotify:track:{i}" for i in range(1050)}
+    assert sorted(off for _, off in sp.calls) == list(range(0, 1100, 100))
+    assert {f for f, _ in sp.calls} == {PLAYLIST_ITEMS_FIELDS}
+
+
+def test_empty_playlist_single_call():
+    sp = FakePlaylistSpotify(0)
+    assert get_playlist_track_uris(sp, "pl") == set()
+    assert len(sp.calls) == 1
+
+
+class MissingPageSpotify(FakePlaylistSpotify):
+    def playlist_items(self, playlist_id, fields=None, limit=100, offset=0, market=None):
+        page = super().playlist_items(playlist_id, fields=fields, limit=limit, offset=offset, market=market)
+        if offset == 300:
+            raise SpotifyException(404, -1, "Not found.")
+        return page
+
+
+def test_client_error_on_a_page_is_not_retried():
+    sp = MissingPageSpotify(450)
+    with pytest.raises(SpotifyException):
+        get_playlist_track_uris(sp, "pl")
+    assert [off for _, off in sp.calls].count(300) == 1
+
+
+class SnapshotSpotify(FakePlaylistSpotify):
+    def __init__(self, total):
+        super().__init__(total)
+        self.snapshot = "s1"
+
+    def playlist(self, playlist_id, fields=None, market=None, additional_types=("track",)):
+        return {"snapshot_id": self.snapshot}
+
+    def playlist_add_items(self, playlist_id, items, position=None):
+        self.total += len(items)
+        self.snapshot = f"s{int(self.snapshot[1:]) + 1}"
+        return {"snapshot_id": self.snapshot}
+
+
+def test_snapshot_cache_reused_and_updated_by_our_adds(tmp_path):
+    cache = PlaylistCache(tmp_path / "playlists.sqlite")
+    sp = SnapshotSpotify(250)
+    first = get_playlist_track_uris(sp, "pl", cache=cache)
+    pages = len(sp.calls)
+
+    assert get_playlist_track_uris(sp, "pl", cache=cache) == first
+    assert len(sp.calls) == pages  # same snapshot: no page fetched
+
+    add_tracks_batched(sp, "pl", ["spotify:track:new"], cache=cache)
+    assert get_playlist_track_uris(sp, "pl", cache=cache) == first | {"spotify:track:new"}
+    assert len(sp.calls) == pages
+
+    sp.snapshot = "changed elsewhere"
+    get_playlist_track_uris(sp, "pl", cache=cache)
+    assert len(sp.calls) > pages
+    cache.close()
+
+
+class ListingSpotify:
+    def __init__(self, names):
+        self.names = names
+        self.calls = 0
+
+    def current_user_playlists(self, limit=50, offset=0):
+        self.calls += 1
+        items = [
+            {"id": f"p{i}", "name": n, "owner": {"id": "me"}, "tracks": {"total": i}}
+            for i, n in enumerate(self.names[offset : offset + limit], start=offset)
+        ]
+        return {"items": items, "total": len(self.names)}
+
+
+def test_listing_paged_in_order_and_cached(tmp_path):
+    sp = ListingSpotify([f"Playlist {i}" for i in range(120)])
+    cache = PlaylistCache(tmp_path / "playlists.sqlite")
+    pls = list_user_playlists(sp, cache=cache, user_id="me")
+    assert [p.id for p in pls] == [f"p{i}" for i in range(120)] and sp.calls == 3
+    assert list_user_playlists(sp, cache=cache, user_id="me") == pls and sp.calls == 3
+    cache.listing_ttl = 0
+    list_user_playlists(sp, cache=cache, user_id="me")
+    assert sp.calls == 6
+    cache.close()
+
+
+def test_playlist_index_matches_substring_filter():
+    names = ["Rock Classics", "Best of Jazz", "Hardrock 90s", "Ｊａｚｚ Café", "Chill", "rock"]
+    pls = [_playlist_info({"id": str(i), "name": n}) for i, n in enumerate(names)]
+    index = PlaylistIndex(pls)
+    for q in ["ROCK", "rock", "drock", "jaz", "of ja", "café", "c", "90s", "nothing", "  Chill "]:
+        expected = [p for p in pls if q.strip().lower() in p.name.lower()]
+        assert index.search(q) == expected, q
+    assert [p.name for p in index.search("rock")] == ["Rock Classics", "Hardrock 90s", "rock"]
+    assert len(index.search("")) == len(names)
@@ -0,0 +1,45 @@
+import os
+
+from src.response_cache import CachedSearchClient, SearchResponseCache
+
+
+class CountingSpotify:
+    def __init__(self):
+        self.calls = 0
+
+    def search(self, q, limit=10, offset=0, type="track", market=None):
+        self.calls += 1
+        return {"tracks": {"items": [{"id": f"{q}-{i}", "name": "x" * 200} for i in range(limit)]}}
+
+    def me(self):
+        return {"id": "me"}
+
+
+def test_cached_client_normalizes_and_delegates(tmp_path):
+    sp = CountingSpotify()
+    cache = SearchResponseCache(tmp_path / "s.sqlite")
+    client = CachedSearchClient(sp, cache)
+    first = client.search(q="Song  Artist", type="track", market="FR", limit=5)
+    again = client.search(q="song artist", type="track", market="fr", limit=5)
+    assert again == first and sp.calls == 1
+    client.search(q="song artist", type="track", market="JP", limit=5)
+    assert sp.calls == 2
+    assert client.me() == {"id": "me"}
+    cache.close()
+
+
+def test_ttl_and_size_eviction(tmp_path):
+    cache = SearchResponseCache(tmp_path / "s.sqlite", ttl_seconds=0)
+    key = cache.make_key("q", None, "track", 20)
+    cache.put(key, {"a": 1})
+    assert cache.get(key) is None
+    cache.close()
+
+    cache = SearchResponseCache(tmp_path / "s2.sqlite", max_bytes=2000)
+
+    keys = [cache.make_key(f"q{i}", None, "track", 20) for i in range(10)]
+    for k in keys:
+        cache.put(k, {"blob": os.urandom(300).hex()})
+    assert cache.get(keys[-1]) is not None
+    assert cache.get(keys[0]) is None
+    cache.close()
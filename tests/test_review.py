@@ -0,0 +1,66 @@
+from pathlib import Path
+
+from src.cli import process_track, review_deferred
+from src.review import ReviewQueue
+from src.types import Candidate, LocalTrack
+
+
+def _lt(name):
+    return LocalTrack(path=Path(name), title="Song", artist="Artist", album=None, duration_ms=None, year=None, isrc=None)
+
+
+def _cands(score):
+    alt = Candidate(uri="spotify:track:alt", name="Song", artists=("Artist",), album="B", duration_ms=1, score=0.0)
+    return [
+        Candidate(uri="spotify:track:a", name="Song", artists=("Artist",), album="A", duration_ms=1, score=score, alternates=(alt,)),
+        Candidate(uri="spotify:track:b", name="Other", artists=("Artist",), album="A", duration_ms=1, score=score / 2),
+    ]
+
+
+def test_queue_survives_reopen_and_torn_line(tmp_path):
+    q = ReviewQueue(tmp_path / "q.ndjson")
+    q.add(Path("a.mp3"), _lt("a.mp3"), _cands(0.5))
+    q.add(Path("b.mp3"), _lt("b.mp3"), _cands(0.4))
+    q.remove(Path("a.mp3"))
+    q._fh.write('{"op": "add", "path": "c.mp3", "tra')  # crash mid-write
+    q._fh.flush()
+
+    q2 = ReviewQueue(tmp_path / "q.ndjson")
+    assert [str(p) for p, _, _ in q2] == ["b.mp3"]
+    (_, lt, cands), = list(q2)
+    assert lt == _lt("b.mp3") and cands == _cands(0.4)
+    q2.close()
+
+
+def test_deferred_tracks_reviewed_at_the_end(tmp_path, monkeypatch, make_run):
+    run = make_run(dry_run=True)
+    run.review = ReviewQueue(tmp_path / "q.ndjson")
+    answers = []
+    monkeypatch.setattr("builtins.input", lambda prompt="": answers.pop(0))
+
+    process_track(run, Path("unsure.mp3"), _lt("unsure.mp3"), (_lt("unsure.mp3"), _cands(0.6)))
+    process_track(run, Path("sure.mp3"), _lt("sure.mp3"), (_lt("sure.mp3"), _cands(0.95)))
+    assert len(run.review) == 1 and run.counts["added"] == 1  # no prompt during the batch
+
+    answers.append("2")
+    review_deferred(run)
+    assert not answers and len(run.review) == 0
+    assert run.to_add_batch == ["spotify:track:a", "spotify:track:b"] and run.counts["added"] == 2
+    statuses = {k: v["status"] for k, v in run.state["processed"].items()}
+    assert sorted(statuses.values()) == ["PLANNED_ADD", "PLANNED_ADD"]
+    run.review.close()
+
+
+def test_confident_duplicate_is_deferred_not_prompted(tmp_path, monkeypatch, make_run):
+    run = make_run(existing={"spotify:track:a"})
+    run.review = ReviewQueue(tmp_path / "q.ndjson")
+    answers = []
+    monkeypatch.setattr("builtins.input", lambda prompt="": answers.pop(0))
+
+    process_track(run, Path("dup.mp3"), _lt("dup.mp3"), (_lt("dup.mp3"), _cands(0.99)))
+    assert len(run.review) == 1 and not run.state["processed"]  # no duplicate question during the batch
+
+    answers.append("n")  # at review time: do not add it again
+    review_deferred(run)
+    assert not answers and run.counts["duplicates"] == 1 and run.to_add_batch == []
+    run.review.close()
@@ -0,0 +1,110 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from src.scanner import ScanManifest, iter_audio_files
+
+
+def _touch(p: Path) -> Path:
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_bytes(b"")
+    return p
+
+
+def _age(*dirs: Path, seconds: int = 60) -> None:
+    for d in dirs:
+        st = d.stat()
+        os.utime(d, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+def _scan(root: Path, manifest=None, **kw):
+    return sorted(
+        iter_audio_files(root, exts=["mp3", "flac"], follow_symlinks=False, ignore_hidden=True, manifest=manifest, **kw)
+    )
+
+
+def test_scan_filters_ext_hidden_and_excluded(tmp_path):
+    a = _touch(tmp_path / "A" / "01 - Song.mp3")
+    _touch(tmp_path / "A" / "cover.jpg")
+    _touch(tmp_path / ".hidden" / "x.mp3")
+    _touch(tmp_path / "AMV" / "y.mp3")
+    b = _touch(tmp_path / "B" / "C" / "z.FLAC")
+    assert _scan(tmp_path, exclude_dirs=["amv"]) == sorted([a, b])
+
+
+def test_incremental_scan_picks_up_new_files(tmp_path):
+    root = tmp_path / "lib"
+    a = _touch(root / "A" / "a.mp3")
+    manifest_path = tmp_path / "manifest.json"
+    _age(root, root / "A")
+
+    assert _scan(root, ScanManifest(manifest_path)) == [a]
+
+    warm = ScanManifest(manifest_path)
+    assert _scan(root, warm) == [a]
+    assert warm.misses == 0
+
+    b = _touch(root / "A" / "b.mp3")
+    os.utime(root / "A")
+    m = ScanManifest(manifest_path)
+    assert _scan(root, m) == sorted([a, b])
+    assert m.misses >= 1
+
+
+def test_watch_rechecks_only_changed_tags_and_never_prompts(tmp_path, monkeypatch, make_run):
+    from src import cli
+    from src.tag_cache import stat_key
+    from src.types import Candidate, LocalTrack
+
+    root = tmp_path / "lib"
+    same, retagged = _touch(root / "A" / "same.mp3"), _touch(root / "A" / "retagged.mp3")
+    manifest_path = tmp_path / "manifest.json"
+    _age(root, root / "A")
+    _scan(root, ScanManifest(manifest_path))
+    known = {f: stat_key(f) for f in (same, retagged)}
+
+    def track(path, title):
+        return LocalTrack(path=path, title=title, artist="Band", album=None, duration_ms=None, year=None, isrc=None)
+
+    tags = {same: track(same, "Same"), retagged: track(retagged, "Old title")}
+    run = make_run(
+        path_import=str(root), watch_interval=1, no_follow_symlinks=True, ignore_hidden=True,
+        no_recursive=False, exclude=None, review_queue=str(tmp_path / "review.ndjson"),
+        advanced_search=None, album_mode=False,
+    )
+    for f, lt in tags.items():
+        run.state["processed"][cli._norm_key(f)] = {"uri": None, "score": None, "status": "SKIPPED", "tags": cli._tags_key(lt)}
+
+    # In-place edits: one only touched, one with a new title, plus a new file
+    for f in (same, retagged):
+        f.write_bytes(b"edited")
+    tags[retagged] = track(retagged, "New title")
+    new = _touch(root / "A" / "new.mp3")
+    tags[new] = track(new, "New")
+    _age(root / "A")
+
+    class Engine:
+        limit = 5
+        searched = []
+
+        def candidates(self, lt, use_cache=True):
+            self.searched.append(lt.title)
+            return [Candidate(uri=f"spotify:track:{lt.title}", name=lt.title, artists=("Band",), album="", duration_ms=1, score=0.7)]
+
+    run.engine = Engine()
+    ticks = iter(range(3))
+
+    def sleep(_):
+        if next(ticks, None) is None:
+            raise KeyboardInterrupt
+
+    reviewed = []
+    monkeypatch.setattr(cli.time, "sleep", sleep)
+    monkeypatch.setattr(cli, "iter_local_tracks", lambda paths, tag_cache=None: ((p, tags[p]) for p in paths))
+    monkeypatch.setattr(cli, "review_deferred", lambda run: reviewed.extend(p for p, _, _ in run.review))
+    monkeypatch.setattr("builtins.input", lambda *a: pytest.fail("watch mode must not prompt"))
+    manifest = ScanManifest(manifest_path)
+    cli.watch_loop(run, ["mp3"], [], manifest, None, known)
+    assert sorted(run.engine.searched) == ["New", "New title"]  # once each, after two stable polls
+    assert sorted(reviewed) == sorted([retagged, new])  # queued, reviewed when watch stops
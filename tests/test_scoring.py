@@ -20,3 +20,68 @@ def test_duration_within_3s_full_score():
     cand = Candidate(uri="u", name="X", artists=["Y"], album="A", duration_ms=182500, score=0.0)
     s = score_candidate(lt, cand)
     assert s > 0.9
+
+
+def test_batch_scores_match_score_candidate_exactly():
+    import random
+
+    from src.matcher import score_matrix
+
+    rnd = random.Random(7)
+    words = ["Love", "Song", "Blue", "Night", "(Live)", "[Remastered 2011]", "feat. X", "Vivid", "", "東京"]
+
+    def text(n):
+        return " ".join(rnd.choice(words) for _ in range(rnd.randint(0, n))).strip() or None
+
+    lts = [
+        LocalTrack(
+            path=Path(f"{i}"),
+            title=text(4),
+            artist=text(2),
+            album=text(3),
+            duration_ms=rnd.choice([None, 0, rnd.randint(100000, 300000)]),
+            year=rnd.choice([None, 1999, 2000, 2011]),
+            isrc=None,
+            tracknumber=rnd.choice([None, 1, 2, 3]),
+        )
+        for i in range(25)
+    ]
+    cands = [
+        Candidate(
+            uri=f"u{i}",
+            name=text(4) or "",
+            artists=[a for a in [text(1), text(1)] if a],
+            album=text(3) or "",
+            duration_ms=rnd.choice([0, rnd.randint(100000, 300000)]),
+            score=0.0,
+            release_year=rnd.choice([None, 1998, 2000, 2012]),
+            track_number=rnd.choice([None, 1, 2, 4]),
+        )
+        for i in range(30)
+    ]
+    m = score_matrix(lts, cands, workers=2)
+    for i, l in enumerate(lts):
+        for j, c in enumerate(cands):
+            assert m[i][j] == score_candidate(l, c)
+
+
+def test_candidate_pool_shared_between_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    from src.matcher import CandidatePool
+
+    cands = [
+        Candidate(uri=f"u{i}", name=f"Song {i}", artists=("Artist",), album="Album", duration_ms=200000 + i * 1000, score=0.0)
+        for i in range(10)
+    ]
+    pool = CandidatePool(cands)
+    lts = [
+        LocalTrack(path=Path(f"{i}"), title=f"Song {i}", artist="Artist", album=None, duration_ms=200000, year=None, isrc=None)
+        for i in range(10)
+    ]
+    with ThreadPoolExecutor(4) as ex:
+        vectors = list(ex.map(pool.scores, lts))
+    for lt, vec in zip(lts, vectors):
+        assert vec == [score_candidate(lt, c) for c in cands]
+    assert all(c.score == 0.0 for c in pool.cands)
+    assert pool.ranked(lts[3])[0].uri == "u3"
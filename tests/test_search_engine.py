@@ -0,0 +1,177 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from src.matcher import search_candidates
+from src.search_engine import SearchCancelled, SearchEngine
+from src.types import LocalTrack
+
+
+class FakeSpotify:
+    """Deterministic search results with random latency."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def search(self, q, type="track", market=None, limit=20):
+        self.calls += 1
+        time.sleep(random.random() / 200)
+        seed = sum(map(ord, f"{q}|{market}"))
+        items = []
+        for i in range(8):
+            tid = f"t{(seed + i * 7) % 23}"
+            items.append(
+                {
+                    "id": tid,
+                    "uri": f"spotify:track:{tid}",
+                    "name": f"Song {tid}",
+                    "artists": [{"name": "Artist"}],
+                    "album": {"name": "Album", "release_date": "2001-01-01"},
+                    "duration_ms": 200000 + i,
+                }
+            )
+        return {"tracks": {"items": items}}
+
+
+def _lt(title="Song t3", artist="Artist"):
+    return LocalTrack(path=Path("x.mp3"), title=title, artist=artist, album=None, duration_ms=200000, year=None, isrc=None)
+
+
+def test_concurrent_search_matches_serial():
+    serial = search_candidates(FakeSpotify(), _lt(), "FR", limit=50)
+    with ThreadPoolExecutor(4) as ex:
+        concurrent = search_candidates(FakeSpotify(), _lt(), "FR", limit=50, executor=ex)
+    assert [(c.uri, c.score) for c in concurrent] == [(c.uri, c.score) for c in serial]
+
+
+def test_engine_cache_does_not_leak_scores():
+    sp = FakeSpotify()
+    engine = SearchEngine(sp, "FR", workers=3)
+    try:
+        first = engine.candidates(_lt(title="Song t3"))
+        calls = sp.calls
+        other = engine.candidates(_lt(title="Song t3 (Live)"))
+        assert sp.calls == calls  # same normalized key -> cache hit
+        assert {c.uri: c.score for c in first} == {c.uri: c.score for c in engine.candidates(_lt(title="Song t3"))}
+        assert all(a is not b for a, b in zip(first, other))
+    finally:
+        engine.close()
+
+
+def test_planner_dedupes_and_stops_early():
+    from src.matcher import SearchStats, plan_queries
+
+    lt = _lt(title="Song t3", artist="Artist")
+    queries = [q for _, q in plan_queries(lt)]
+    assert len(queries) == len(set(queries)) == 3  # both "cleaned" variants equal the plain query
+
+    sp = FakeSpotify()
+    stats = SearchStats()
+    cands = search_candidates(sp, lt, "FR", limit=5, stop_score=0.9, stats=stats)
+    assert cands[0].name == "Song t3" and cands[0].score >= 0.9
+    assert sp.calls == stats.executed < stats.naive
+    assert stats.saved == stats.naive - stats.executed
+
+
+class RelinkingSpotify:
+    """One recording: a JP-only id, an FR relink of it, and a single with the same ISRC."""
+
+    def search(self, q, type="track", market=None, limit=20):
+        def item(tid, album, **extra):
+            return {
+                "id": tid,
+                "uri": f"spotify:track:{tid}",
+                "name": "Song",
+                "artists": [{"name": "Artist"}],
+                "album": {"name": album},
+                "duration_ms": 200000,
+                "external_ids": {"isrc": "jpabc0000001"},
+                **extra,
+            }
+
+        if market == "FR":
+            items = [item("fr1", "Album", linked_from={"id": "jp1"}, is_playable=True)]
+        else:
+            items = [item("jp1", "Album"), item("single1", "Song - Single")]
+        return {"tracks": {"items": items}}
+
+
+def test_candidates_collapsed_by_isrc_and_relink():
+    lt = _lt(title="Song", artist="Artist")
+    cands = search_candidates(RelinkingSpotify(), lt, "FR", limit=50)
+    assert [c.uri for c in cands] == ["spotify:track:fr1"]
+    assert cands[0].isrc == "JPABC0000001"
+    assert sorted(a.uri for a in cands[0].alternates) == ["spotify:track:jp1", "spotify:track:single1"]
+
+
+def test_prefetch_runs_ahead_and_cancels():
+    sp = FakeSpotify()
+    engine = SearchEngine(sp, "FR")
+    started = []
+    gate = threading.Event()
+
+    def prepare(title):
+        started.append(title)
+        if len(started) > 1:
+            gate.wait(5)  # a search still running when the user quits
+        return engine.candidates(_lt(title=title))
+
+    titles = [f"Song t{i}" for i in range(10)]
+    ahead = engine.run_ahead(prepare, iter(titles), window=3, threads=1)
+    try:
+        title, cands = next(ahead)
+        assert title == "Song t0" and cands
+        for _ in range(100):
+            if len(started) == 2:
+                break
+            time.sleep(0.01)
+        assert started == ["Song t0", "Song t1"]  # next file already in progress on one thread
+        engine.cancel()
+        ahead.close()
+        gate.set()
+    finally:
+        engine.close()
+    time.sleep(0.05)
+    assert started == ["Song t0", "Song t1"]  # queued look-ahead dropped
+    with pytest.raises(SearchCancelled):
+        engine.candidates(_lt(title="Song t5"))
+
+
+def test_cancel_stops_a_running_search_between_queries():
+    class QuittingSpotify(FakeSpotify):
+        def search(self, q, type="track", market=None, limit=20):
+            engine.cancel()  # the user quits while the first query is in flight
+            return super().search(q, type=type, market=market, limit=limit)
+
+    sp = QuittingSpotify()
+    for workers in (1, 3):
+        sp.calls = 0
+        engine = SearchEngine(sp, "FR", workers=workers)
+        try:
+            with pytest.raises(SearchCancelled):
+                engine.candidates(_lt(title="Nothing close", artist="Nobody"))
+        finally:
+            engine.close()
+        assert sp.calls <= workers  # only the queries already sent, no further market
+        assert not engine._cache
+
+
+def test_prefetch_keeps_tag_workers(tmp_path):
+    import argparse
+
+    from src import cli
+
+    files = []
+    for i in range(4):
+        p = tmp_path / f"Artist {i} - Title {i}.dat"
+        p.write_bytes(b"")
+        files.append(p)
+    threads_read = cli.lookahead_tracks(argparse.Namespace(prefetch=2, tag_workers=0), files, None)
+    assert list(threads_read) == [(f, None) for f in files]  # read by the look-ahead threads
+    pool_read = list(cli.lookahead_tracks(argparse.Namespace(prefetch=2, tag_workers=2), files, None))
+    assert [p for p, _ in pool_read] == files
+    assert [lt.artist for _, lt in pool_read] == [f"Artist {i}" for i in range(4)]
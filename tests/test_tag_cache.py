@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from src.tag_cache import TagCache
+from src.types import LocalTrack
+
+
+def test_tag_cache_hit_and_invalidation(tmp_path):
+    audio = tmp_path / "a.mp3"
+    audio.write_bytes(b"x" * 10)
+    calls = []
+
+    def loader(p: Path) -> LocalTrack:
+        calls.append(p)
+        return LocalTrack(path=p, title="T", artist="A", album=None, duration_ms=1000, year=2001, isrc=None, tracknumber=3)
+
+    cache = TagCache(tmp_path / "tags.sqlite")
+    first = cache.read(audio, loader)
+    cache.close()
+
+    cache = TagCache(tmp_path / "tags.sqlite")
+    again = cache.read(audio, loader)
+    assert len(calls) == 1
+    assert again == first
+
+    audio.write_bytes(b"x" * 20)
+    cache.read(audio, loader)
+    assert len(calls) == 2
+    cache.close()
@@ -0,0 +1,42 @@
+from src.metadata import extract_fields
+
+
+def test_extract_id3_frames():
+    from mutagen.id3 import ID3, TALB, TDRC, TIT2, TPE1, TRCK, TSRC
+
+    tags = ID3()
+    tags.add(TIT2(encoding=3, text=[" Song "]))
+    tags.add(TPE1(encoding=3, text=["Artist", "Other"]))
+    tags.add(TALB(encoding=3, text=["Album"]))
+    tags.add(TRCK(encoding=3, text=["3/12"]))
+    tags.add(TDRC(encoding=3, text=["2011-05-01"]))
+    tags.add(TSRC(encoding=3, text=["USRC17607839"]))
+    assert extract_fields(tags) == {
+        "title": "Song",
+        "artist": "Artist",
+        "album": "Album",
+        "tracknumber": 3,
+        "year": 2011,
+        "isrc": "USRC17607839",
+    }
+
+
+def test_extract_vorbis_and_mp4():
+    from mutagen.flac import VCFLACDict
+    from mutagen.mp4 import MP4FreeForm, MP4Tags
+
+    vc = VCFLACDict()
+    vc["TITLE"] = ["Song"]
+    vc["ARTIST"] = ["Artist"]
+    vc["DATE"] = ["1999"]
+    vc["TRACKNUMBER"] = ["7/10"]
+    fields = extract_fields(vc)
+    assert (fields["title"], fields["artist"], fields["year"], fields["tracknumber"]) == ("Song", "Artist", 1999, 7)
+
+    mp4 = MP4Tags()
+    mp4["©nam"] = ["Song"]
+    mp4["©ART"] = ["Artist"]
+    mp4["trkn"] = [(4, 12)]
+    mp4["----:com.apple.iTunes:ISRC"] = [MP4FreeForm(b"GBAYE0601498")]
+    fields = extract_fields(mp4)
+    assert (fields["title"], fields["artist"], fields["tracknumber"], fields["isrc"]) == ("Song", "Artist", 4, "GBAYE0601498")
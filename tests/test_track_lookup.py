@@ -0,0 +1,70 @@
+from pathlib import Path
+
+from src.cli import flush_adds, record_decision
+from src.matcher import lookup_tracks
+from src.types import ADDED, NOT_FOUND, LocalTrack
+
+GOOD = "spotify:track:" + "A" * 22
+MISSING = "spotify:track:" + "B" * 22
+
+
+class FakeSpotify:
+    def __init__(self):
+        self.tracks_calls = []
+        self.added = []
+
+    def tracks(self, ids, market=None):
+        self.tracks_calls.append(list(ids))
+        return {
+            "tracks": [
+                {"id": i, "uri": f"spotify:track:{i}", "name": "Song", "artists": [{"name": "Artist"}], "duration_ms": 1000}
+                if i.startswith("A")
+                else None
+                for i in ids
+            ]
+        }
+
+    def playlist_add_items(self, playlist_id, uris):
+        self.added.extend(uris)
+
+
+def test_lookup_tracks_batches_and_rejects_malformed():
+    sp = FakeSpotify()
+    uris = [f"spotify:track:A{i:021d}" for i in range(60)] + [MISSING, "spotify:track:short"]
+    found = lookup_tracks(sp, uris)
+    assert [len(b) for b in sp.tracks_calls] == [50, 11]
+    assert found[uris[0]].name == "Song" and found[uris[0]].duration_ms == 1000
+    assert found[MISSING] is None and found["spotify:track:short"] is None
+
+
+def test_pasted_uris_checked_before_add(make_run):
+    sp = FakeSpotify()
+    run = make_run(sp)
+    lt = LocalTrack(path=Path("a.mp3"), title="t", artist="a", album=None, duration_ms=None, year=None, isrc=None)
+    record_decision(run, Path("a.mp3"), lt, GOOD, ADDED, None)
+    record_decision(run, Path("b.mp3"), lt, MISSING, ADDED, None)
+    assert not sp.tracks_calls and not sp.added  # deferred
+
+    flush_adds(run)
+    assert len(sp.tracks_calls) == 1
+    assert sp.added == [GOOD]
+    assert run.counts["added"] == 1 and run.counts["not_found"] == 1
+    assert sorted(v["status"] for v in run.state["processed"].values()) == [ADDED, NOT_FOUND]
+    assert '"track_name": "Song"' in run.json_path.read_text(encoding="utf-8")
+
+
+def test_pasted_link_checked_at_the_prompt(monkeypatch):
+    from src.matcher import decide_with_auto_or_menu
+    from src.types import Candidate
+
+    sp = FakeSpotify()
+    answers = iter([
+        "l", "https://open.spotify.com/track/ABC",  # too short
+        "l", f"https://open.spotify.com/track/{MISSING.rsplit(':', 1)[-1]}",  # does not exist
+        "l", f"https://open.spotify.com/track/{GOOD.rsplit(':', 1)[-1]}?si=x",
+    ])
+    monkeypatch.setattr("builtins.input", lambda *a: next(answers))
+    lt = LocalTrack(path=Path("a.mp3"), title="t", artist="a", album=None, duration_ms=None, year=None, isrc=None)
+    cand = Candidate(uri="spotify:track:x", name="x", artists=("y",), album="z", duration_ms=1, score=0.5)
+    assert decide_with_auto_or_menu([cand], lt, 0.92, False, sp=sp, market="FR") == GOOD
+    assert sp.tracks_calls == [[MISSING.rsplit(":", 1)[-1]], [GOOD.rsplit(":", 1)[-1]]]
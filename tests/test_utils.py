@@ -0,0 +1,17 @@
+from src.utils import remove_feat, strip_suffixes, text_forms
+
+
+def test_text_forms_matches_helpers():
+    f = text_forms("Song  (Live) [2011] feat. Someone")
+    assert f.stripped == strip_suffixes("Song  (Live) [2011] feat. Someone") == "Song feat. Someone"
+    assert f.defeat == remove_feat("Song  (Live) [2011] feat. Someone")
+    assert f.stripped_key == "song feat. someone"
+    assert text_forms("").stripped == ""
+
+
+def test_text_forms_is_memoized():
+    text_forms.cache_clear()
+    first = text_forms("Ｓｏｎｇ  (Remix)")
+    assert text_forms("Ｓｏｎｇ  (Remix)") is first
+    assert text_forms.cache_info().hits == 1
+    assert first.folded == "song"